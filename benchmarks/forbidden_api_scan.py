@@ -0,0 +1,92 @@
+# implements: FR-015
+# traces_to: Π.3.1
+
+"""Benchmark ForbiddenAPIEngine tree traversal.
+
+Compares the single ``_ModuleScan`` pass against the previous three full
+``ast.walk`` passes (from-imports, ``random.seed()`` search, call sites; reproduced
+below as ``legacy_passes``) over generated test modules, reporting traversal time
+alone and together with ``ast.parse``.
+
+    python benchmarks/forbidden_api_scan.py [--files 2000] [--repeat 3]
+"""
+
+import argparse
+import ast
+import time
+from typing import Callable, List
+
+from ade_compliance.engines.forbidden_api_engine import _ModuleScan
+
+
+def legacy_passes(tree: ast.AST) -> int:
+    """The three traversals ``scan_source`` made before the single-pass visitor."""
+    from_imports = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.module:
+            for alias in node.names:
+                from_imports[alias.asname or alias.name] = (node.module, alias.name)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute):
+            if isinstance(node.func.value, ast.Name) and node.func.value.id == "random" and node.func.attr == "seed":
+                break
+    return sum(1 for node in ast.walk(tree) if isinstance(node, ast.Call))
+
+
+def single_pass(tree: ast.AST) -> int:
+    scan = _ModuleScan()
+    scan.visit(tree)
+    scan.has_random_seed()
+    return len(scan.calls)
+
+
+def _module(i: int) -> str:
+    parts = ["import json\nimport random as rnd\nfrom unittest.mock import patch\n\nimport pytest\n\n\n"]
+    for j in range(12):
+        parts.append(
+            f"@pytest.mark.parametrize('value', [1, 2, 3])\n"
+            f"def test_case_{i}_{j}(value, tmp_path):\n"
+            f"    payload = {{'id': value, 'items': [str(k) for k in range(value)]}}\n"
+            f"    (tmp_path / 'out.json').write_text(json.dumps(payload))\n"
+            f"    with patch('svc.client.fetch', return_value=payload) as fetch:\n"
+            f"        assert fetch('x')['id'] == value\n"
+            f"    assert rnd.choice(payload['items'] or ['0'])\n\n\n"
+        )
+    return "".join(parts)
+
+
+def _best(func: Callable[[], object], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=2000, help="Number of generated test modules")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repetitions (best is reported)")
+    args = parser.parse_args()
+
+    sources: List[str] = [_module(i) for i in range(args.files)]
+    if [legacy_passes(ast.parse(s)) for s in sources] != [single_pass(ast.parse(s)) for s in sources]:
+        raise SystemExit("call site mismatch between legacy and single-pass traversal")
+
+    trees = [ast.parse(s) for s in sources]
+    walk_legacy = _best(lambda: [legacy_passes(t) for t in trees], args.repeat)
+    walk_single = _best(lambda: [single_pass(t) for t in trees], args.repeat)
+    scan_legacy = _best(lambda: [legacy_passes(ast.parse(s)) for s in sources], args.repeat)
+    scan_single = _best(lambda: [single_pass(ast.parse(s)) for s in sources], args.repeat)
+
+    print(f"{'':<22}{'legacy ms':>12}{'single ms':>12}{'speedup':>10}")
+    for label, legacy_s, single_s in (
+        ("traversal", walk_legacy, walk_single),
+        ("parse + traversal", scan_legacy, scan_single),
+    ):
+        print(f"{label:<22}{legacy_s * 1000:>12.1f}{single_s * 1000:>12.1f}{legacy_s / single_s:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
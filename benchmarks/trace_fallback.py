@@ -0,0 +1,147 @@
+# implements: FR-003
+# traces_to: Π.3.1
+
+"""Benchmark the TraceEngine regex fallback (used when tree-sitter is unavailable).
+
+Compares the single-pass comment tokenizer against the previous line-by-line
+implementation (reproduced below as ``legacy_comments``) on generated Python,
+JavaScript, TypeScript and Java sources, and checks both yield the same links.
+
+    python benchmarks/trace_fallback.py [--lines 20000] [--repeat 5]
+"""
+
+import argparse
+import re
+import time
+from collections import Counter
+from typing import Callable, List, Optional, Tuple
+
+from ade_compliance.config import EngineConfig
+from ade_compliance.engines.trace_engine import LINK_PATTERN, TraceEngine
+
+
+def legacy_comments(content: str) -> List[Tuple[str, Optional[str]]]:
+    """The fallback scanner as it was before the single-pass rewrite."""
+    comments_with_symbols: List[Tuple[str, Optional[str]]] = []
+    lines = content.splitlines()
+    for idx, line in enumerate(lines):
+        single_match = re.search(r"(?:#|//)\s*(.*)", line)
+        if single_match:
+            comment_text = single_match.group(0)
+            symbol = None
+            for j in range(idx + 1, min(idx + 6, len(lines))):
+                next_line = lines[j].strip()
+                if (
+                    not next_line
+                    or next_line.startswith("#")
+                    or next_line.startswith("//")
+                    or next_line.startswith("@")
+                ):
+                    continue
+                class_match = re.search(r"\bclass\s+(\w+)", next_line)
+                if class_match:
+                    symbol = class_match.group(1)
+                    break
+                func_match = re.search(r"\b(?:def|function)\s+(\w+)", next_line)
+                if func_match:
+                    symbol = func_match.group(1)
+                    break
+                assign_match = re.search(r"\b(?:const|let|var)?\s*(\w+)\s*=", next_line)
+                if assign_match:
+                    symbol = assign_match.group(1)
+                    break
+                break
+            comments_with_symbols.append((comment_text, symbol))
+
+    for block in re.findall(r"/\*([\s\S]*?)\*/", content):
+        for line in block.splitlines():
+            cleaned_line = re.sub(r"^\s*\*\s*", "", line).strip()
+            comments_with_symbols.append((cleaned_line, None))
+    return comments_with_symbols
+
+
+def _links(comments: List[Tuple[str, Optional[str]]]) -> Counter:
+    found: Counter = Counter()
+    for comment, symbol in comments:
+        for link_type, targets in LINK_PATTERN.findall(comment):
+            for target in [t.strip() for t in targets.split("*/")[0].strip().split(",") if t.strip()]:
+                found[(link_type.lower(), target, symbol)] += 1
+    return found
+
+
+def _python(n: int) -> str:
+    parts = ["# implements: FR-001\n# traces_to: Π.3.1\n\nimport os\n\n"]
+    for i in range(n // 10):
+        marker = f"# implements: FR-{i % 40:03d}\n" if i % 8 == 0 else "# helper\n"
+        parts.append(f"{marker}@cached\ndef func_{i}(a, b):\n    total = a + b  # sum\n    return total\n\n\n")
+    return "".join(parts)
+
+
+def _javascript(n: int) -> str:
+    parts = ["// implements: FR-002\n'use strict';\n\n"]
+    for i in range(n // 10):
+        marker = f"/**\n * validates: FR-{i % 40:03d}\n */\n" if i % 8 == 0 else "// helper\n"
+        parts.append(
+            f"{marker}function fn{i}(a, b) {{\n  const url = 'http://example.com/{i}';\n  return a + b;\n}}\n\n"
+        )
+    return "".join(parts)
+
+
+def _typescript(n: int) -> str:
+    parts = ["// traces_to: Π.3.1\nimport { x } from './x';\n\n"]
+    for i in range(n // 10):
+        marker = f"// implements: FR-{i % 40:03d}\n" if i % 8 == 0 else "/* plain block */\n"
+        parts.append(f"{marker}export const value{i}: number = compute({i});\n\nclass Box{i} {{\n  size = {i};\n}}\n\n")
+    return "".join(parts)
+
+
+def _java(n: int) -> str:
+    parts = ["// implements: FR-003\npackage demo;\n\n"]
+    for i in range(n // 10):
+        marker = f"/** validates: FR-{i % 40:03d} */\n" if i % 8 == 0 else "// getter\n"
+        parts.append(f"{marker}class Item{i} {{\n    int value = {i};\n    int get() {{ return value; }}\n}}\n\n")
+    return "".join(parts)
+
+
+SAMPLES: List[Tuple[str, Callable[[int], str]]] = [
+    ("python", _python),
+    ("javascript", _javascript),
+    ("typescript", _typescript),
+    ("java", _java),
+]
+
+
+def _best(func: Callable[[], object], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=20000, help="Approximate lines per generated file")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions (best is reported)")
+    args = parser.parse_args()
+
+    engine = TraceEngine(EngineConfig())
+    print(f"{'language':<12}{'lines':>8}{'legacy ms':>12}{'single-pass ms':>16}{'speedup':>10}")
+    for name, generate in SAMPLES:
+        content = generate(args.lines)
+        legacy = _links(legacy_comments(content))
+        current = _links(engine._scan_comments_with_symbols(content))
+        if legacy != current:
+            raise SystemExit(f"{name}: link mismatch between legacy and single-pass scanners")
+
+        legacy_s = _best(lambda c=content: legacy_comments(c), args.repeat)
+        current_s = _best(lambda c=content: engine._scan_comments_with_symbols(c), args.repeat)
+        print(
+            f"{name:<12}{content.count(chr(10)):>8}{legacy_s * 1000:>12.1f}{current_s * 1000:>16.1f}"
+            f"{legacy_s / current_s:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
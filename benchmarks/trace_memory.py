@@ -0,0 +1,106 @@
+# implements: FR-003
+# traces_to: Π.3.1
+
+"""Memory benchmark for trace links in large runs.
+
+Measures allocation peak (tracemalloc) and build time for holding ``--links`` trace
+links as pydantic ``TraceLink`` models versus compact interned ``LinkRecord``
+tuples, then (unless ``--skip-run``) performs a full ``Orchestrator.run`` over
+generated sources producing the same number of links and reports the peak RSS of
+that process.
+
+    python benchmarks/trace_memory.py [--links 100000] [--files 1000]
+"""
+
+import argparse
+import asyncio
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, List
+
+from ade_compliance.models import TraceLink
+from ade_compliance.models.records import LinkRecord
+
+LINK_TYPES = ("implements", "validates", "traces_to")
+
+
+def _raw_links(count: int, files: int):
+    # Fresh strings per link, as produced by regex extraction
+    for i in range(count):
+        yield f"src/pkg/module_{i % files}.py", f"FR-{i % 500:03d}", LINK_TYPES[i % 3].upper().lower(), f"func_{i % 97}"
+
+
+def _measure(build: Callable[[], List], label: str) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    links = build()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<12}{len(links):>10}{peak / 2**20:>12.1f}{elapsed * 1000:>12.1f}")
+
+
+def _run(links: int, files: int) -> None:
+    """Full orchestrator run over generated files, printing peak RSS (executed in a child process)."""
+    from ade_compliance.config import Config, GlobalSettings
+    from ade_compliance.services.orchestrator import Orchestrator
+
+    per_file = max(1, links // files)
+    with tempfile.TemporaryDirectory() as root:
+        os.chdir(root)
+        os.makedirs("src/pkg")
+        paths = []
+        for f in range(files):
+            lines = [
+                f"# implements: FR-{(f * per_file + j) % 500:03d}\ndef func_{j}():\n    pass\n" for j in range(per_file)
+            ]
+            path = f"src/pkg/module_{f}.py"
+            with open(path, "w", encoding="utf-8") as fh:
+                fh.write("".join(lines))
+            paths.append(path)
+
+        config = Config(global_settings=GlobalSettings(audit_path=":memory:", cache_enabled=False))
+        for name in ("spec", "test", "adr", "forbidden_api"):
+            getattr(config.engines, name).enabled = False
+        start = time.perf_counter()
+        report = asyncio.run(Orchestrator(config).run(paths))
+        elapsed = time.perf_counter() - start
+        matrix_links = sum(len(v) for entry in report.traceability_matrix.values() for v in entry.values())
+
+    peak_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"full run: {files} files, {files * per_file} links ({matrix_links} matrix entries) in {elapsed:.2f}s")
+    print(f"peak RSS: {peak_kib / 1024:.1f} MiB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--links", type=int, default=100_000, help="Number of trace links")
+    parser.add_argument("--files", type=int, default=1000, help="Number of source files the links are spread over")
+    parser.add_argument("--skip-run", action="store_true", help="Only compare the in-memory representations")
+    parser.add_argument("--run-only", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_only:
+        _run(args.links, args.files)
+        return
+
+    print(f"{'layout':<12}{'links':>10}{'peak MiB':>12}{'build ms':>12}")
+    _measure(
+        lambda: [TraceLink(source=s, target=t, type=k, symbol=y) for s, t, k, y in _raw_links(args.links, args.files)],
+        "pydantic",
+    )
+    _measure(lambda: [LinkRecord.create(s, t, k, y) for s, t, k, y in _raw_links(args.links, args.files)], "LinkRecord")
+
+    if not args.skip_run:
+        # A fresh process so the reported peak RSS belongs to the run alone
+        cmd = [sys.executable, __file__, "--run-only", "--links", str(args.links), "--files", str(args.files)]
+        subprocess.run(cmd, check=True)
+
+
+if __name__ == "__main__":
+    main()
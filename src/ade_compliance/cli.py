@@ -4,13 +4,15 @@
 import asyncio
 import sys
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 import click
 
 from ade_compliance.config import Config, get_axiom_strictness, load_config
 from ade_compliance.models.report import ComplianceReport
 from ade_compliance.services.orchestrator import Orchestrator
+from ade_compliance.utils.path import collect_source_files
+from ade_compliance.utils.sharding import parse_shard, select_shard
 
 
 def determine_exit_code(violations: List, config: Config) -> int:
@@ -56,36 +58,37 @@ def _run_checks(
     run_trace: bool = True,
     run_adr: bool = True,
     run_forbidden_api: bool = True,
+    jobs: Optional[int] = None,
+    shard: Optional[Tuple[int, int]] = None,
 ) -> Tuple[ComplianceReport, Config]:
     # Expand paths
-    files = []
-    for p in paths:
-        path = Path(p)
-        if path.is_file():
-            files.append(str(path).replace("\\", "/"))
-        elif path.is_dir():
-            # Recursive search for supported languages
-            for ext in ("*.py", "*.js", "*.ts", "*.tsx", "*.java"):
-                for f in path.rglob(ext):
-                    files.append(str(f).replace("\\", "/"))
+    files = collect_source_files(paths)
 
     if not files:
         click.echo("No files found to check.")
         sys.exit(0)
 
+    # Keep only this runner's share of the files; repository-wide engines run on shard 1 only
+    shard_index, shard_total = shard or (1, 1)
+    files = select_shard(files, shard_index, shard_total)
+
     # Load Config
     cfg = load_config(Path(config))
 
     # Configure active engines
     cfg.engines.spec.enabled = cfg.engines.spec.enabled and run_spec
     cfg.engines.test.enabled = cfg.engines.test.enabled and run_test
+    cfg.engines.coverage.enabled = cfg.engines.coverage.enabled and run_test
     cfg.engines.trace.enabled = cfg.engines.trace.enabled and run_trace
     if hasattr(cfg.engines, "adr"):
         cfg.engines.adr.enabled = cfg.engines.adr.enabled and run_adr
     cfg.engines.forbidden_api.enabled = cfg.engines.forbidden_api.enabled and run_forbidden_api
 
+    if jobs is not None:
+        cfg.global_settings.jobs = jobs
+
     # Run Orchestrator
-    orchestrator = Orchestrator(cfg)
+    orchestrator = Orchestrator(cfg, global_engines=shard_index == 1)
 
     try:
         report = asyncio.run(orchestrator.run(files))
@@ -93,9 +96,38 @@ def _run_checks(
         click.echo(f"Error running checks: {e}", err=True)
         sys.exit(3)
 
+    if shard_total > 1:
+        report.metrics["shard"] = {"index": shard_index, "total": shard_total, "files": len(files)}
     return report, cfg
 
 
+jobs_option = click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=0),
+    default=None,
+    help="Worker processes for per-file engines (0 = one per CPU; default from config)",
+)
+
+
+def _parse_shard_option(ctx, param, value: Optional[str]) -> Optional[Tuple[int, int]]:
+    if value is None:
+        return None
+    try:
+        return parse_shard(value)
+    except ValueError as e:
+        raise click.BadParameter(str(e)) from None
+
+
+shard_option = click.option(
+    "--shard",
+    default=None,
+    metavar="INDEX/TOTAL",
+    callback=_parse_shard_option,
+    help="Check only shard INDEX of TOTAL (1-based, stable per file path)",
+)
+
+
 @click.group()
 def main():
     """ADE Compliance Framework CLI"""
@@ -110,9 +142,13 @@ def main():
 @main.command()
 @click.argument("paths", nargs=-1, type=click.Path(exists=True))
 @click.option("--config", "-c", default=".ade-compliance.yml", help="Path to config file")
-def run(paths: List[str], config: str):
+@jobs_option
+@shard_option
+def run(paths: List[str], config: str, jobs: Optional[int], shard: Optional[Tuple[int, int]]):
     """Run compliance checks on the specified paths (legacy compatibility)."""
-    report, cfg = _run_checks(paths, config, run_spec=True, run_test=True, run_trace=True, run_adr=True)
+    report, cfg = _run_checks(
+        paths, config, run_spec=True, run_test=True, run_trace=True, run_adr=True, jobs=jobs, shard=shard
+    )
     click.echo(report.generate_summary())
     if report.violations:
         sys.exit(1)
@@ -122,9 +158,13 @@ def run(paths: List[str], config: str):
 @main.command(name="check-all")
 @click.argument("paths", nargs=-1, type=click.Path(exists=True))
 @click.option("--config", "-c", default=".ade-compliance.yml", help="Path to config file")
-def check_all(paths: List[str], config: str):
+@jobs_option
+@shard_option
+def check_all(paths: List[str], config: str, jobs: Optional[int], shard: Optional[Tuple[int, int]]):
     """Run all compliance checks on the specified paths."""
-    report, cfg = _run_checks(paths, config, run_spec=True, run_test=True, run_trace=True, run_adr=True)
+    report, cfg = _run_checks(
+        paths, config, run_spec=True, run_test=True, run_trace=True, run_adr=True, jobs=jobs, shard=shard
+    )
     click.echo(report.generate_summary())
     exit_code = determine_exit_code(report.violations, cfg)
     sys.exit(exit_code)
@@ -133,10 +173,20 @@ def check_all(paths: List[str], config: str):
 @main.command(name="check-spec")
 @click.argument("paths", nargs=-1, type=click.Path(exists=True))
 @click.option("--config", "-c", default=".ade-compliance.yml", help="Path to config file")
-def check_spec(paths: List[str], config: str):
+@jobs_option
+@shard_option
+def check_spec(paths: List[str], config: str, jobs: Optional[int], shard: Optional[Tuple[int, int]]):
     """Run specification compliance checks."""
     report, cfg = _run_checks(
-        paths, config, run_spec=True, run_test=False, run_trace=False, run_adr=False, run_forbidden_api=False
+        paths,
+        config,
+        run_spec=True,
+        run_test=False,
+        run_trace=False,
+        run_adr=False,
+        run_forbidden_api=False,
+        jobs=jobs,
+        shard=shard,
     )
     click.echo(report.generate_summary())
     exit_code = determine_exit_code(report.violations, cfg)
@@ -146,10 +196,20 @@ def check_spec(paths: List[str], config: str):
 @main.command(name="check-test")
 @click.argument("paths", nargs=-1, type=click.Path(exists=True))
 @click.option("--config", "-c", default=".ade-compliance.yml", help="Path to config file")
-def check_test(paths: List[str], config: str):
+@jobs_option
+@shard_option
+def check_test(paths: List[str], config: str, jobs: Optional[int], shard: Optional[Tuple[int, int]]):
     """Run test compliance checks."""
     report, cfg = _run_checks(
-        paths, config, run_spec=False, run_test=True, run_trace=False, run_adr=False, run_forbidden_api=False
+        paths,
+        config,
+        run_spec=False,
+        run_test=True,
+        run_trace=False,
+        run_adr=False,
+        run_forbidden_api=False,
+        jobs=jobs,
+        shard=shard,
     )
     click.echo(report.generate_summary())
     exit_code = determine_exit_code(report.violations, cfg)
@@ -159,10 +219,20 @@ def check_test(paths: List[str], config: str):
 @main.command(name="check-traceability")
 @click.argument("paths", nargs=-1, type=click.Path(exists=True))
 @click.option("--config", "-c", default=".ade-compliance.yml", help="Path to config file")
-def check_traceability(paths: List[str], config: str):
+@jobs_option
+@shard_option
+def check_traceability(paths: List[str], config: str, jobs: Optional[int], shard: Optional[Tuple[int, int]]):
     """Run traceability checks and generate matrix."""
     report, cfg = _run_checks(
-        paths, config, run_spec=False, run_test=False, run_trace=True, run_adr=False, run_forbidden_api=False
+        paths,
+        config,
+        run_spec=False,
+        run_test=False,
+        run_trace=True,
+        run_adr=False,
+        run_forbidden_api=False,
+        jobs=jobs,
+        shard=shard,
     )
 
     # Print Traceability Matrix
@@ -191,10 +261,20 @@ def check_traceability(paths: List[str], config: str):
 @main.command(name="check-adr")
 @click.argument("paths", nargs=-1, type=click.Path(exists=True))
 @click.option("--config", "-c", default=".ade-compliance.yml", help="Path to config file")
-def check_adr(paths: List[str], config: str):
+@jobs_option
+@shard_option
+def check_adr(paths: List[str], config: str, jobs: Optional[int], shard: Optional[Tuple[int, int]]):
     """Run ADR compliance and architectural change checks."""
     report, cfg = _run_checks(
-        paths, config, run_spec=False, run_test=False, run_trace=False, run_adr=True, run_forbidden_api=False
+        paths,
+        config,
+        run_spec=False,
+        run_test=False,
+        run_trace=False,
+        run_adr=True,
+        run_forbidden_api=False,
+        jobs=jobs,
+        shard=shard,
     )
     click.echo(report.generate_summary())
     exit_code = determine_exit_code(report.violations, cfg)
@@ -204,10 +284,20 @@ def check_adr(paths: List[str], config: str):
 @main.command(name="check-forbidden-apis")
 @click.argument("paths", nargs=-1, type=click.Path(exists=True))
 @click.option("--config", "-c", default=".ade-compliance.yml", help="Path to config file")
-def check_forbidden_apis(paths: List[str], config: str):
+@jobs_option
+@shard_option
+def check_forbidden_apis(paths: List[str], config: str, jobs: Optional[int], shard: Optional[Tuple[int, int]]):
     """Scan test files for forbidden API calls violating test determinism (FR-015)."""
     report, cfg = _run_checks(
-        paths, config, run_spec=False, run_test=False, run_trace=False, run_adr=False, run_forbidden_api=True
+        paths,
+        config,
+        run_spec=False,
+        run_test=False,
+        run_trace=False,
+        run_adr=False,
+        run_forbidden_api=True,
+        jobs=jobs,
+        shard=shard,
     )
 
     forbidden_violations = [v for v in report.violations if v.axiom_id == "Π.2.2"]
@@ -225,15 +315,105 @@ def check_forbidden_apis(paths: List[str], config: str):
 @main.command(name="generate-report")
 @click.argument("paths", nargs=-1, type=click.Path(exists=True))
 @click.option("--config", "-c", default=".ade-compliance.yml", help="Path to config file")
-def generate_report(paths: List[str], config: str):
+@jobs_option
+@shard_option
+def generate_report(paths: List[str], config: str, jobs: Optional[int], shard: Optional[Tuple[int, int]]):
     """Generate machine-readable JSON compliance report."""
-    report, cfg = _run_checks(paths, config, run_spec=True, run_test=True, run_trace=True, run_adr=True)
+    report, cfg = _run_checks(
+        paths, config, run_spec=True, run_test=True, run_trace=True, run_adr=True, jobs=jobs, shard=shard
+    )
     report.generate_summary()
     click.echo(report.model_dump_json(by_alias=True))
     exit_code = determine_exit_code(report.violations, cfg)
     sys.exit(exit_code)
 
 
+@main.command(name="export-matrix")
+@click.argument("paths", nargs=-1, type=click.Path(exists=True))
+@click.option("--config", "-c", default=".ade-compliance.yml", help="Path to config file")
+@click.option("--format", "fmt", type=click.Choice(["csv", "jsonl", "parquet"]), default="csv", show_default=True)
+@click.option(
+    "--output", "-o", type=click.Path(dir_okay=False), default=None, help="Output file (required for parquet)"
+)
+@jobs_option
+def export_matrix(paths: List[str], config: str, fmt: str, output: Optional[str], jobs: Optional[int]):
+    """Stream the traceability matrix of PATHS as CSV, JSON Lines or Parquet rows."""
+    from ade_compliance.models.records import LinkRecord, TraceMatrix
+    from ade_compliance.utils.matrix_export import open_matrix_writer
+
+    files = collect_source_files(paths)
+    cfg = load_config(Path(config))
+    cfg.engines.spec.enabled = False
+    cfg.engines.test.enabled = False
+    if hasattr(cfg.engines, "adr"):
+        cfg.engines.adr.enabled = False
+    cfg.engines.forbidden_api.enabled = False
+    cfg.engines.coverage.enabled = False
+    if jobs is not None:
+        cfg.global_settings.jobs = jobs
+    if fmt == "parquet" and not output:
+        raise click.UsageError("--output is required for parquet export")
+
+    async def export(writer) -> None:
+        # Links never repeat across files, so deduplicating per file is enough
+        async for result in Orchestrator(cfg).stream(files):
+            if result.trace_links:
+                writer.write_rows(TraceMatrix(LinkRecord.from_model(k) for k in result.trace_links).rows())
+
+    stream = None
+    try:
+        if fmt != "parquet":
+            stream = open(output, "w", encoding="utf-8", newline="") if output else sys.stdout
+        writer = open_matrix_writer(fmt, stream=stream, path=output)
+        try:
+            asyncio.run(export(writer))
+        finally:
+            writer.close()
+    except Exception as e:
+        click.echo(f"Error exporting matrix: {e}", err=True)
+        sys.exit(3)
+    finally:
+        if stream is not None and stream is not sys.stdout:
+            stream.close()
+
+    if output:
+        click.echo(f"Exported {writer.rows} matrix row(s) to {output}", err=True)
+    sys.exit(0)
+
+
+@main.command(name="merge-reports")
+@click.argument("report_files", nargs=-1, required=True, type=click.Path(exists=True, dir_okay=False))
+@click.option("--config", "-c", default=".ade-compliance.yml", help="Path to config file")
+@click.option("--output", "-o", type=click.Path(dir_okay=False), default=None, help="Write JSON here instead of stdout")
+@click.option("--allow-partial", is_flag=True, help="Merge even if some shards of a sharded run are missing")
+def merge_reports(report_files: List[str], config: str, output: Optional[str], allow_partial: bool):
+    """Merge `generate-report` JSON outputs (e.g. one per CI shard) into a single report."""
+    cfg = load_config(Path(config))
+    try:
+        reports = [ComplianceReport.model_validate_json(Path(f).read_text(encoding="utf-8")) for f in report_files]
+    except Exception as e:
+        click.echo(f"Error reading reports: {e}", err=True)
+        sys.exit(3)
+
+    shards = [r.metrics.get("shard") for r in reports if isinstance(r.metrics.get("shard"), dict)]
+    if shards and not allow_partial:
+        totals = {s.get("total") for s in shards}
+        seen = sorted({s.get("index") for s in shards})
+        expected = list(range(1, next(iter(totals)) + 1)) if len(totals) == 1 else None
+        if expected is None or seen != expected or len(shards) != len(reports):
+            click.echo(f"Error: incomplete or inconsistent shard set {seen} of {sorted(totals)}.", err=True)
+            sys.exit(3)
+
+    merged = ComplianceReport.merge(reports)
+    payload = merged.model_dump_json(by_alias=True)
+    if output:
+        Path(output).write_text(payload, encoding="utf-8")
+        click.echo(merged.generate_summary())
+    else:
+        click.echo(payload)
+    sys.exit(determine_exit_code(merged.violations, cfg))
+
+
 @main.command(name="override")
 @click.argument("axiom_id")
 @click.option(
@@ -306,6 +486,169 @@ def verify_audit_trail(config: str):
         sys.exit(2)
 
 
+@main.group()
+def cache():
+    """Inspect and maintain the persistent result cache."""
+
+
+@cache.command(name="stats")
+@click.option("--config", "-c", default=".ade-compliance.yml", help="Path to config file")
+def cache_stats(config: str):
+    """Show result cache size and hit/miss counters per engine."""
+    from ade_compliance.services.cache import ResultCache
+
+    cfg = load_config(Path(config))
+    if not cfg.global_settings.cache_enabled:
+        click.echo("Result cache is disabled (global.cache_enabled: false).")
+        sys.exit(0)
+
+    stats = ResultCache(Path(cfg.global_settings.cache_path)).stats()
+    click.echo(f"Cache: {stats['path']}")
+    click.echo(f"Entries: {stats['entries']} ({stats['size_bytes']} bytes)")
+    for engine, s in stats["engines"].items():
+        click.echo(
+            f"  {engine}: {s['entries']} entries, {s['hits']} hits, {s['misses']} misses (hit rate {s['hit_rate']:.1%})"
+        )
+    sys.exit(0)
+
+
+@cache.command(name="prune")
+@click.option("--older-than", type=float, default=30.0, help="Remove entries not used within this many days")
+@click.option("--all", "prune_all", is_flag=True, help="Remove every cached entry and reset counters")
+@click.option("--config", "-c", default=".ade-compliance.yml", help="Path to config file")
+def cache_prune(older_than: float, prune_all: bool, config: str):
+    """Remove stale entries from the result cache and trace links of deleted files."""
+    from ade_compliance.services.cache import ResultCache
+    from ade_compliance.services.trace_index import TraceIndex
+
+    cfg = load_config(Path(config))
+    cache_dir = Path(cfg.global_settings.cache_path)
+    if not cache_dir.exists():
+        click.echo("Result cache is empty.")
+        sys.exit(0)
+
+    deleted = ResultCache(cache_dir).prune(None if prune_all else older_than)
+    click.echo(f"Pruned {deleted} cache entr{'y' if deleted == 1 else 'ies'}.")
+    index = TraceIndex.from_config(cfg)
+    if index is not None:
+        removed = index.prune_missing()
+        click.echo(f"Pruned trace links of {removed} deleted file{'' if removed == 1 else 's'}.")
+    sys.exit(0)
+
+
+@main.command()
+@click.argument("paths", nargs=-1, required=True, type=click.Path(exists=True))
+@click.option("--config", "-c", default=".ade-compliance.yml", help="Path to config file")
+@jobs_option
+@click.option("--poll", "force_poll", is_flag=True, help="Use stat polling instead of inotify")
+@click.option("--interval", type=click.FloatRange(min=0, min_open=True), default=None, help="Polling interval (s)")
+def watch(paths: List[str], config: str, jobs: Optional[int], force_poll: bool, interval: Optional[float]):
+    """Keep checking PATHS, re-checking only changed files, and keep the watch report current."""
+    from ade_compliance.services.watch import WatchSession
+    from ade_compliance.utils.watch import create_watcher
+
+    cfg = load_config(Path(config))
+    if jobs is not None:
+        cfg.global_settings.jobs = jobs
+
+    session = WatchSession(cfg, paths)
+    watcher = create_watcher(session.roots(), polling=force_poll)
+    click.echo(f"Watching {len(session.files)} file(s) using {watcher.name}; report: {session.report_path}")
+
+    def on_refresh(current: WatchSession) -> None:
+        summary = current.report().generate_summary()
+        click.echo(f"Checked {current.last_checked} file(s) in {current.last_refresh_ms} ms. {summary}")
+
+    try:
+        asyncio.run(session.watch(watcher, interval or cfg.global_settings.watch_interval, on_refresh))
+    except KeyboardInterrupt:
+        click.echo("Stopped watching.")
+    except Exception as e:
+        click.echo(f"Error in watch mode: {e}", err=True)
+        sys.exit(3)
+    finally:
+        watcher.close()
+        session.close()
+    sys.exit(0)
+
+
+@main.command(name="watch-status")
+@click.option("--config", "-c", default=".ade-compliance.yml", help="Path to config file")
+@click.option("--json", "as_json", is_flag=True, help="Print the full JSON report")
+def watch_status(config: str, as_json: bool):
+    """Print the report maintained by a running `watch` process."""
+    cfg = load_config(Path(config))
+    report_path = Path(cfg.global_settings.watch_report_path)
+    if not report_path.exists():
+        click.echo(f"No watch report found at {report_path}. Start `ade-compliance watch` first.", err=True)
+        sys.exit(3)
+
+    data = report_path.read_text(encoding="utf-8")
+    report = ComplianceReport.model_validate_json(data)
+    if as_json:
+        click.echo(data)
+    else:
+        click.echo(f"Report generated at {report.generated_at.isoformat()}")
+        click.echo(report.generate_summary())
+        for v in report.violations:
+            click.echo(f"  - [{v.axiom_id}] {v.file_path}: {v.message}")
+    sys.exit(determine_exit_code(report.violations, cfg))
+
+
+@main.command(name="trace-query")
+@click.argument("target")
+@click.option("--config", "-c", default=".ade-compliance.yml", help="Path to config file")
+@click.option("--json", "as_json", is_flag=True, help="Print links as JSON")
+def trace_query(target: str, config: str, as_json: bool):
+    """List files and symbols linked to TARGET (e.g. FR-021) from the persistent trace index."""
+    import json
+
+    from ade_compliance.services.trace_index import TraceIndex
+
+    cfg = load_config(Path(config))
+    index = TraceIndex.from_config(cfg)
+    if index is None:
+        click.echo("Trace index is disabled (global.cache_enabled: false).", err=True)
+        sys.exit(3)
+
+    links = index.query(target)
+    if as_json:
+        click.echo(json.dumps([{"source": k.source, "symbol": k.symbol, "type": k.type} for k in links], indent=2))
+    elif not links:
+        click.echo(f"No trace links to {target} (the index reflects the last check of each file).")
+    else:
+        click.echo(f"{len(links)} trace link(s) to {target}:")
+        for k in links:
+            symbol = f" ({k.symbol})" if k.symbol else ""
+            click.echo(f"  {k.type:<10} {k.source}{symbol}")
+    sys.exit(0)
+
+
+@main.command(name="spec-query")
+@click.argument("requirement")
+@click.option("--config", "-c", default=".ade-compliance.yml", help="Path to config file")
+@click.option("--json", "as_json", is_flag=True, help="Print definitions as JSON")
+def spec_query(requirement: str, config: str, as_json: bool):
+    """Show where REQUIREMENT (e.g. FR-021) is defined, from the persistent spec index."""
+    import json
+
+    from ade_compliance.services.spec_index import SpecIndex
+
+    cfg = load_config(Path(config))
+    index = SpecIndex.from_config(cfg)
+    index.refresh()
+
+    definitions = index.lookup(requirement)
+    if as_json:
+        click.echo(json.dumps([{"path": r.path, "line": r.line, "text": r.text} for r in definitions], indent=2))
+    elif not definitions:
+        click.echo(f"{requirement} is not defined in any specification ({len(index)} document(s) indexed).")
+    else:
+        for r in definitions:
+            click.echo(f"{r.id}  {r.path}:{r.line}  {r.text}")
+    sys.exit(0)
+
+
 @main.command(name="prompt-decorate")
 @click.argument("paths", nargs=-1, type=click.Path(exists=True))
 @click.option("--config", "-c", default=".ade-compliance.yml", help="Path to config file")
@@ -318,6 +661,8 @@ def prompt_decorate(paths: List[str], config: str):
     markdown = generate_prompt_decorator(cfg, files_list)
     click.echo(markdown)
     sys.exit(0)
+
+
 @main.command()
 @click.option("--host", default="127.0.0.1", help="Host to bind to (default: 127.0.0.1)")
 @click.option("--port", default=8080, type=int, help="Port to bind to (default: 8080)")
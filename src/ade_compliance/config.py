@@ -5,10 +5,12 @@ from pathlib import Path
 from typing import Any, Dict, List, Literal, Mapping, Optional
 
 import yaml
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, Field, ValidationError, field_validator
 from pydantic.fields import FieldInfo
 from pydantic_settings import BaseSettings, EnvSettingsSource, PydanticBaseSettingsSource, SettingsConfigDict
 
+from .utils.testfiles import DEFAULT_TEST_PATTERNS, DEFAULT_TEST_ROOTS, validate_pattern
+
 # Constrained strictness type — rejects invalid values at parse time
 StrictnessLevel = Literal["enforce", "warn", "audit"]
 
@@ -22,6 +24,21 @@ class GlobalSettings(BaseModel):
     enabled: bool = True
     audit_path: str = ".ade_compliance/audit.sqlite"
     database_url: Optional[str] = None
+    cache_enabled: bool = True
+    cache_path: str = ".ade_compliance/cache"
+    # Persistent trace-link index, maintained whenever cache_enabled is set (default: <cache_path>/trace.sqlite)
+    trace_index_path: Optional[str] = None
+    # Memory budget for parse trees (ast and tree-sitter) shared by all engines; 0 disables retention
+    parse_cache_mb: int = Field(default=256, ge=0)
+    # Worker processes for per-file engines: 1 runs in-process, 0 uses one worker per CPU
+    jobs: int = Field(default=1, ge=0)
+    lock_path: str = ".ade_compliance/locks"
+    # Hash buckets for run locking: 1 serializes whole runs, more lets disjoint file sets proceed concurrently
+    lock_shards: int = Field(default=1, ge=1)
+    # Always-current report maintained by `ade-compliance watch`
+    watch_report_path: str = ".ade_compliance/watch/report.json"
+    # Seconds between polling scans (and override re-checks) in watch mode
+    watch_interval: float = Field(default=1.0, gt=0)
 
     model_config = {"extra": "ignore"}
 
@@ -34,15 +51,68 @@ class EngineConfig(BaseModel):
     model_config = {"extra": "ignore"}
 
 
+class TestEngineConfig(EngineConfig):
+    __test__ = False
+
+    # Directories enumerated once per run for test files
+    test_roots: List[str] = Field(default_factory=lambda: list(DEFAULT_TEST_ROOTS))
+    # Test file names/paths for a module, tried in order (see utils.testfiles), e.g. "{stem}_test.py"
+    test_patterns: List[str] = Field(default_factory=lambda: list(DEFAULT_TEST_PATTERNS))
+
+    @field_validator("test_patterns")
+    @classmethod
+    def _known_placeholders(cls, patterns: List[str]) -> List[str]:
+        return [validate_pattern(pattern) for pattern in patterns]
+
+
+class CoverageEngineConfig(EngineConfig):
+    # .coverage (coverage.py SQLite) or Cobertura XML; default: .coverage, then coverage.xml
+    data_file: Optional[str] = None
+
+
+class ForbiddenAPIRule(BaseModel):
+    # Dotted call path, e.g. "subprocess.run"; an object path such as "os.environ" also covers calls on it
+    call: str
+    reason: str = "Forbidden API call in test"
+
+    model_config = {"extra": "ignore"}
+
+    @field_validator("call")
+    @classmethod
+    def _dotted(cls, value: str) -> str:
+        value = value.strip().removesuffix("()")
+        module, _, attr = value.rpartition(".")
+        if not module or not attr:
+            raise ValueError(f"forbidden API rule '{value}' must be a dotted path like 'module.function'")
+        return value
+
+
+class ForbiddenAPIConfig(EngineConfig):
+    # Per-project rules added to (or overriding) the built-in table
+    rules: List[ForbiddenAPIRule] = Field(default_factory=list)
+    # Built-in calls to permit, as dotted paths (e.g. "os.system")
+    allow: List[str] = Field(default_factory=list)
+
+
 class Engines(BaseModel):
     spec: EngineConfig = EngineConfig()
-    test: EngineConfig = EngineConfig()
+    test: TestEngineConfig = TestEngineConfig()
     trace: EngineConfig = Field(default_factory=EngineConfig, alias="traceability", validation_alias="traceability")
     adr: EngineConfig = EngineConfig()
-    forbidden_api: EngineConfig = EngineConfig()
+    forbidden_api: ForbiddenAPIConfig = ForbiddenAPIConfig()
+    # min_coverage unset here falls back to engines.test.min_coverage
+    coverage: CoverageEngineConfig = CoverageEngineConfig()
 
     model_config = {"extra": "ignore", "populate_by_name": True}
 
+    @field_validator("test", "forbidden_api", "coverage", mode="before")
+    @classmethod
+    def _widen_engine_config(cls, value: Any) -> Any:
+        # A plain EngineConfig is accepted and gains the engine-specific defaults
+        if isinstance(value, EngineConfig):
+            return value.model_dump()
+        return value
+
 
 class EscalationConfig(BaseModel):
     github_repo: str = "First-ADE/first-ade"
@@ -5,12 +5,16 @@ import subprocess
 from typing import List, Optional
 
 from ..models.axiom import Violation, ViolationState
+from ..observability.logging import logger
 from .base import BaseEngine
 
 
 class ADREngine(BaseEngine):
     """Engine to enforce postulate Π.3.1 (ADRs required for all architectural changes)."""
 
+    # Evaluates the git change set as a whole, so results cannot be cached per file
+    cacheable = False
+
     def get_git_modified_files(self) -> Optional[List[str]]:
         """Query git to find all modified/added files in the current workspace or branch.
         Returns None if not running inside a git repository.
@@ -20,51 +24,19 @@ class ADREngine(BaseEngine):
         if "pytest" in sys.modules:
             return None
 
-        import subprocess
+        from ..services.git_changes import change_set_provider
 
-        # Check if inside git work tree
         try:
-            res = subprocess.run(["git", "rev-parse", "--is-inside-work-tree"], capture_output=True, text=True)
-            if res.returncode != 0 or res.stdout.strip() != "true":
+            provider = change_set_provider()
+            if provider is None:
                 return None
-        except Exception:
+            # Computed once per run: check() asks for it a single time
+            return provider.changed_files()
+        except Exception as e:
+            # Fall back to the files passed in rather than failing the run
+            logger.warning("git_change_set_unavailable", error=str(e))
             return None
 
-        modified = set()
-        try:
-            # 1. Get unstaged/staged changes
-            res = subprocess.run(["git", "status", "--porcelain"], capture_output=True, text=True)
-            if res.returncode == 0:
-                for line in res.stdout.splitlines():
-                    if len(line) > 3:
-                        path = line[3:].strip()
-                        if " -> " in path:
-                            path = path.split(" -> ")[-1].strip()
-                        modified.add(path.replace("\\", "/"))
-        except Exception:
-            pass
-
-        try:
-            # 2. Get changes relative to base branch
-            for base in ("origin/main", "main"):
-                res = subprocess.run(["git", "diff", "--name-only", f"{base}...HEAD"], capture_output=True, text=True)
-                if res.returncode == 0:
-                    for line in res.stdout.splitlines():
-                        if line.strip():
-                            modified.add(line.strip().replace("\\", "/"))
-                    break
-                else:
-                    res = subprocess.run(["git", "diff", "--name-only", base], capture_output=True, text=True)
-                    if res.returncode == 0:
-                        for line in res.stdout.splitlines():
-                            if line.strip():
-                                modified.add(line.strip().replace("\\", "/"))
-                        break
-        except Exception:
-            pass
-
-        return list(modified)
-
     async def check(self, files: List[str]) -> List[Violation]:
         if not self.should_run():
             return []
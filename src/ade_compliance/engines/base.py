@@ -1,21 +1,80 @@
 # implements: FR-003
 # traces_to: Π.3.1
 
-from abc import ABC, abstractmethod
-from typing import List
+import hashlib
+import json
+from typing import Any, Dict, List
 
+from .. import __version__
 from ..config import EngineConfig
 from ..models.axiom import Violation
+from ..utils.parse_cache import ParseCache
+from ..utils.source import SourceCache, SourceFile
 
 
-class BaseEngine(ABC):
+class BaseEngine:
+    # Bump when checking logic changes so persisted cache entries are invalidated
+    version: str = "1"
+    # Per-file engines whose result depends only on the file (plus cache_key_extra) can be cached
+    cacheable: bool = True
+    # Per-file engines whose work is worth fanning out to worker processes
+    parallel: bool = True
+
     def __init__(self, config: EngineConfig):
         self.config = config
+        # Shared per-run file snapshots; the orchestrator rebinds this at the start of each run
+        self.source_cache = SourceCache()
+        # Parse trees keyed by content hash; the orchestrator binds its shared cache here
+        self.parse_cache = ParseCache()
+
+    def begin_run(self) -> None:
+        """Called before each run (or worker chunk); engines drop per-run state here."""
 
-    @abstractmethod
     async def check(self, files: List[str]) -> List[Violation]:
-        """Run compliance checks against the provided files."""
-        pass
+        """Run compliance checks against the provided files.
+
+        Compatibility shim: loads the files afresh and delegates to ``check_sources``.
+        """
+        self.source_cache = SourceCache()
+        self.begin_run()
+        return await self.check_sources(self.source_cache.load_many(files))
+
+    async def check_sources(self, sources: List[SourceFile]) -> List[Violation]:
+        """Run compliance checks against files already loaded by the orchestrator.
+
+        Engines that only implement the legacy ``check(files)`` entry point are served
+        through it.
+        """
+        if type(self).check is BaseEngine.check:
+            raise NotImplementedError(f"{self.name} must implement check_sources() or check()")
+        return await self.check([s.path for s in sources])
 
     def should_run(self) -> bool:
         return self.config.enabled
+
+    @property
+    def name(self) -> str:
+        return type(self).__name__
+
+    def cache_material(self) -> Dict[str, Any]:
+        """Extra engine state (e.g. rule tables) that affects results, folded into the fingerprint."""
+        return {}
+
+    def fingerprint(self) -> str:
+        """Stable hash of engine identity, version and effective configuration."""
+        payload = json.dumps(
+            {
+                "engine": self.name,
+                "version": self.version,
+                "package": __version__,
+                "config": self.config.model_dump(mode="json"),
+                "material": self.cache_material(),
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def cache_key_extra(self, file_path: str) -> str:
+        """Key material for inputs other than the file itself that influence its result."""
+        return ""
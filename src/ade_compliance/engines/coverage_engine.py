@@ -0,0 +1,90 @@
+# implements: FR-002
+# traces_to: Π.2.1
+
+"""Line-coverage gate for the files of a run.
+
+Reads the project's coverage data (``.coverage`` or Cobertura ``coverage.xml``, see
+``services.coverage_data``) once per run and reports a Π.2.1 violation for every
+checked file whose line coverage is below ``min_coverage``. Files absent from the
+coverage data (never imported, or not Python) are not judged here; TestEngine
+reports implementation files without tests.
+"""
+
+from pathlib import Path
+from typing import List, Optional
+
+from ..config import EngineConfig
+from ..models.axiom import Violation, ViolationState
+from ..observability.logging import logger
+from ..services.coverage_data import CoverageStore, CoverageSummary, find_data_file
+from ..utils.source import SourceFile
+from .base import BaseEngine
+
+
+class CoverageEngine(BaseEngine):
+    # A dictionary lookup per file: never worth shipping to worker processes
+    parallel = False
+
+    def __init__(self, config: EngineConfig, cache_dir: Optional[str] = None):
+        super().__init__(config)
+        self.store = CoverageStore(cache_dir)
+        self._data_file: Optional[Path] = None
+        self._summary: Optional[CoverageSummary] = None
+        self._loaded = False
+
+    def begin_run(self) -> None:
+        # Coverage data may have been regenerated since the last run
+        self._data_file = None
+        self._summary = None
+        self._loaded = False
+
+    def data_file(self) -> Optional[Path]:
+        if self._data_file is None:
+            self._data_file = find_data_file(getattr(self.config, "data_file", None))
+        return self._data_file
+
+    def should_run(self) -> bool:
+        return self.config.enabled and self.config.min_coverage is not None and self.data_file() is not None
+
+    def summary(self) -> Optional[CoverageSummary]:
+        """This run's coverage summary; None (logged) when the data file cannot be read."""
+        if not self._loaded:
+            self._loaded = True
+            path = self.data_file()
+            if path is not None:
+                try:
+                    self._summary = self.store.load(path)
+                except Exception as e:
+                    logger.warning("coverage_data_unreadable", path=str(path), error=str(e))
+        return self._summary
+
+    def cache_key_extra(self, file_path: str) -> str:
+        """Results depend on the coverage data, identified by its hash."""
+        summary = self.summary()
+        return f"coverage:{summary.digest}" if summary else "coverage:none"
+
+    async def check_sources(self, sources: List[SourceFile]) -> List[Violation]:
+        if not self.should_run():
+            return []
+        summary = self.summary()
+        if summary is None:
+            return []
+
+        minimum = self.config.min_coverage
+        violations = []
+        for source in sources:
+            measured = summary.files.get(source.norm_path)
+            if measured is None or not measured.total or measured.percent >= minimum:
+                continue
+            violations.append(
+                Violation(
+                    axiom_id="Π.2.1",
+                    file_path=source.norm_path,
+                    message=(
+                        f"Line coverage {measured.percent:.1f}% is below the minimum of {minimum}% "
+                        f"({measured.covered}/{measured.total} lines covered)"
+                    ),
+                    state=ViolationState.NEW,
+                )
+            )
+        return violations
@@ -14,16 +14,21 @@ Forbidden patterns include:
 - Direct network I/O (requests.*, httpx.*, socket.*, urllib.*)
 - os.system() — external process invocation
 
+Calls are resolved through import aliases (``import time as t``, ``from random
+import seed as reseed``) before they are matched against the rule tables.
+
 Files in src/ directories are NOT checked (production code may legitimately use
 these APIs). Only files under tests/ directories are scanned.
 """
 
 import ast
-from pathlib import Path
-from typing import Dict, List, Set, Tuple
+import hashlib
+import json
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
 
+from ..config import EngineConfig, ForbiddenAPIRule
 from ..models import Severity, Violation, ViolationState
-from ..utils.path import normalize_project_path
+from ..utils.source import SourceFile
 from .base import BaseEngine
 
 # Mapping of forbidden attribute calls to human-readable reasons.
@@ -77,13 +82,170 @@ BARE_NAME_FORBIDDEN: Dict[str, Tuple[str, str]] = {
 }
 
 
+class _ModuleScan(ast.NodeVisitor):
+    """Single pass over a module collecting imports, ``seed()`` calls and call sites.
+
+    Nothing is judged while walking: imports may follow the calls they govern (and a
+    ``seed()`` anywhere in the file covers every random call), so resolution happens
+    once the whole tree has been visited.
+    """
+
+    def __init__(self) -> None:
+        # `from X import Y [as Z]`: local name -> (module, original name)
+        self.from_imports: Dict[str, Tuple[str, str]] = {}
+        # `import X [as Y]`: local name -> module
+        self.module_aliases: Dict[str, str] = {}
+        self.calls: List[ast.Call] = []
+        self.seed_calls: List[ast.Call] = []
+
+    def visit_Import(self, node: ast.Import) -> None:
+        for alias in node.names:
+            if alias.asname:
+                self.module_aliases[alias.asname] = alias.name
+            else:
+                # `import a.b` binds `a`
+                top = alias.name.partition(".")[0]
+                self.module_aliases[top] = top
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        if node.module:
+            for alias in node.names:
+                self.from_imports[alias.asname or alias.name] = (node.module, alias.name)
+
+    def visit_Call(self, node: ast.Call) -> None:
+        func = node.func
+        if isinstance(func, ast.Attribute):
+            if func.attr == "seed" and isinstance(func.value, ast.Name):
+                self.seed_calls.append(node)
+            self.calls.append(node)
+        elif isinstance(func, ast.Name):
+            self.seed_calls.append(node)
+            self.calls.append(node)
+        # Arguments and call targets may contain further calls
+        self.generic_visit(node)
+
+    def resolve(self, name: str) -> str:
+        """Dotted path of the module or object a local name is bound to; the name itself if unbound."""
+        module = self.module_aliases.get(name)
+        if module is not None:
+            return module
+        origin = self.from_imports.get(name)
+        if origin is not None:
+            return f"{origin[0]}.{origin[1]}"
+        return name
+
+    def has_random_seed(self) -> bool:
+        """True if ``random.seed()`` is called anywhere in the module, under any alias."""
+        for node in self.seed_calls:
+            func = node.func
+            if isinstance(func, ast.Attribute):
+                if self.resolve(func.value.id) == "random":
+                    return True
+            elif self.from_imports.get(func.id) == ("random", "seed"):
+                return True
+        return False
+
+
+class ForbiddenRule(NamedTuple):
+    reason: str
+    # Only forbidden while the module never calls random.seed()
+    unless_seeded: bool = False
+
+
+UNSEEDED_RANDOM_REASON = "Unseeded random call (seed with random.seed() for determinism)"
+
+
+class RuleIndex:
+    """Forbidden-API rule tables compiled into one dict keyed by resolved ``(module, attr)``.
+
+    Built by ``compile_rules`` and shared by every engine with the same effective
+    tables (see ``digest``).
+    """
+
+    def __init__(
+        self,
+        attr_calls: Dict[Tuple[str, str], str],
+        random_functions: Iterable[str],
+        bare_names: Dict[str, Tuple[str, str]],
+    ):
+        self.calls: Dict[Tuple[str, str], ForbiddenRule] = {key: ForbiddenRule(r) for key, r in attr_calls.items()}
+        # Rules the chained-call fallbacks of ``match`` may use (not the unseeded-random ones)
+        self.chained_calls = dict(self.calls)
+        for name in random_functions:
+            self.calls[("random", name)] = ForbiddenRule(UNSEEDED_RANDOM_REASON, unless_seeded=True)
+        self.bare_names = dict(bare_names)
+        self._material: Dict[str, object] = {
+            "attr_calls": {f"{m}.{a}": reason for (m, a), reason in sorted(attr_calls.items())},
+            "random": sorted(random_functions),
+            "bare_names": sorted(f"{n}={m}.{a}" for n, (m, a) in bare_names.items()),
+        }
+        self.digest = hashlib.sha256(json.dumps(self._material, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def material(self) -> Dict[str, object]:
+        return self._material
+
+    def match(self, path: Tuple[str, ...]) -> Optional[ForbiddenRule]:
+        """Rule for a resolved dotted call path such as ``("time", "sleep")``.
+
+        Two-part paths take a single lookup. Longer ones also try the module spelled
+        by its last or top-level component (``datetime.datetime.now``,
+        ``urllib.request.urlopen``) and then forbidden objects the call goes through
+        (``os.environ.get`` under an ``os.environ`` rule). These fallbacks skip the
+        unseeded-random rules, which only apply to the ``random`` module itself
+        (``np.random.choice()`` and ``self.random.shuffle()`` are not flagged).
+        """
+        rule = self.calls.get((".".join(path[:-1]), path[-1]))
+        if rule is not None or len(path) == 2:
+            return rule
+        calls = self.chained_calls
+        rule = calls.get((path[-2], path[-1])) or calls.get((path[0], path[-1]))
+        if rule is not None:
+            return rule
+        for i in range(len(path) - 2, 0, -1):
+            rule = calls.get((".".join(path[:i]), path[i]))
+            if rule is not None:
+                return rule
+        return None
+
+
+# Compiled indexes by rule-table digest, reused by every engine instance in the process
+_COMPILED_RULES: Dict[str, RuleIndex] = {}
+
+
+def compile_rules(rules: Iterable[ForbiddenAPIRule] = (), allow: Iterable[str] = ()) -> RuleIndex:
+    """Merge per-project rules and allowances into the built-in tables and compile them.
+
+    Project rules add to (or override the reason of) ``FORBIDDEN_ATTR_CALLS``;
+    ``allow`` drops built-in entries, including random functions and bare names.
+    """
+    allowed = set(allow)
+    attr_calls = {key: reason for key, reason in FORBIDDEN_ATTR_CALLS.items() if ".".join(key) not in allowed}
+    for rule in rules:
+        module, _, attr = rule.call.rpartition(".")
+        attr_calls[(module, attr)] = rule.reason
+    random_functions = sorted(name for name in RANDOM_FUNCTIONS if f"random.{name}" not in allowed)
+    bare_names = {name: key for name, key in BARE_NAME_FORBIDDEN.items() if ".".join(key) not in allowed}
+
+    index = RuleIndex(attr_calls, random_functions, bare_names)
+    return _COMPILED_RULES.setdefault(index.digest, index)
+
+
 class ForbiddenAPIEngine(BaseEngine):
     """Engine that scans Python test files for forbidden API calls.
 
-    Uses the stdlib ast module to parse and walk the AST, detecting calls
-    that violate test determinism requirements.
+    Uses the stdlib ast module to parse the file and a single visitor pass to
+    collect imports, seed calls and call sites, then matches each call against the
+    compiled rule index (built-in tables plus the project's configured rules).
     """
 
+    def __init__(self, config: EngineConfig):
+        super().__init__(config)
+        self.rules = compile_rules(getattr(config, "rules", ()), getattr(config, "allow", ()))
+
+    def cache_material(self) -> Dict[str, object]:
+        """Fold the effective forbidden-API rule tables into the engine fingerprint."""
+        return self.rules.material()
+
     def scan_source(self, source: str, file_path: str) -> List[Violation]:
         """Scan Python source code for forbidden API calls.
 
@@ -99,24 +261,23 @@ class ForbiddenAPIEngine(BaseEngine):
         except SyntaxError:
             # Gracefully skip files with syntax errors
             return []
+        return self.scan_tree(tree, file_path)
 
-        violations: List[Violation] = []
-        # Track from-imports to resolve bare name calls
-        from_imports = self._collect_from_imports(tree)
-        # Check if random.seed() is called anywhere in the file
-        has_random_seed = self._has_random_seed(tree, from_imports)
-
-        for node in ast.walk(tree):
-            if not isinstance(node, ast.Call):
-                continue
+    def scan_tree(self, tree: ast.AST, file_path: str) -> List[Violation]:
+        """Scan an already parsed module (e.g. from the shared parse cache) for forbidden API calls."""
+        scan = _ModuleScan()
+        scan.visit(tree)
+        has_random_seed = scan.has_random_seed()
 
-            found = self._check_call_node(node, file_path, from_imports, has_random_seed)
+        violations: List[Violation] = []
+        for node in scan.calls:
+            found = self._check_call_node(node, file_path, scan, has_random_seed)
             if found:
                 violations.append(found)
 
         return violations
 
-    async def check(self, files: List[str]) -> List[Violation]:
+    async def check_sources(self, sources: List[SourceFile]) -> List[Violation]:
         """Run forbidden API checks against the provided files.
 
         Only checks Python files under tests/ directories.
@@ -126,8 +287,8 @@ class ForbiddenAPIEngine(BaseEngine):
 
         violations: List[Violation] = []
 
-        for file_path in files:
-            norm_path = normalize_project_path(file_path)
+        for source in sources:
+            norm_path = source.norm_path
 
             # Only check test files
             if not norm_path.startswith("tests/"):
@@ -137,174 +298,70 @@ class ForbiddenAPIEngine(BaseEngine):
             if not norm_path.endswith(".py"):
                 continue
 
-            path = Path(file_path)
-            if not path.exists():
-                continue
-
-            try:
-                with open(path, "r", encoding="utf-8") as f:
-                    content = f.read()
-            except Exception:
+            # Parsed at most once per content across engines; files with syntax errors are skipped
+            tree = self.parse_cache.python_ast(source)
+            if tree is None:
                 continue
 
-            violations.extend(self.scan_source(content, norm_path))
+            violations.extend(self.scan_tree(tree, norm_path))
 
         return violations
 
-    def _collect_from_imports(self, tree: ast.AST) -> Dict[str, Tuple[str, str]]:
-        """Collect `from X import Y` statements to track bare name origins.
-
-        Returns a mapping of imported name -> (module, original_name).
-        Example: `from time import sleep` -> {"sleep": ("time", "sleep")}
-        """
-        from_imports: Dict[str, Tuple[str, str]] = {}
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ImportFrom) and node.module:
-                for alias in node.names:
-                    # Use the alias name if renamed, otherwise the original
-                    local_name = alias.asname if alias.asname else alias.name
-                    from_imports[local_name] = (node.module, alias.name)
-
-        return from_imports
-
-    def _has_random_seed(self, tree: ast.AST, from_imports: Dict[str, Tuple[str, str]]) -> bool:
-        """Check if random.seed() is called anywhere in the module.
+    def _resolve_call(self, func: ast.expr, scan: _ModuleScan) -> Optional[Tuple[Tuple[str, ...], str]]:
+        """Resolved dotted path of a call target and how to show it, or None if it cannot be resolved.
 
-        This is a simplistic whole-file check — if seed() is called at module
-        level or in any function, all random calls are considered safe.
+        ``t.sleep()`` after ``import time as t`` resolves to ``("time", "sleep")`` and
+        is shown as ``t.sleep() (time.sleep)``; ``choice()`` after ``from random import
+        choice`` is shown as ``choice() (from random)``.
         """
-        for node in ast.walk(tree):
-            if not isinstance(node, ast.Call):
-                continue
-
-            # Check random.seed()
-            if isinstance(node.func, ast.Attribute):
-                if isinstance(node.func.value, ast.Name):
-                    if node.func.value.id == "random" and node.func.attr == "seed":
-                        return True
-
-            # Check bare seed() from `from random import seed`
-            if isinstance(node.func, ast.Name):
-                if node.func.id == "seed":
-                    origin = from_imports.get("seed")
-                    if origin and origin[0] == "random":
-                        return True
-
-        return False
+        # --- Bare name calls: func() from `from X import Y` ---
+        if isinstance(func, ast.Name):
+            origin = scan.from_imports.get(func.id) or self.rules.bare_names.get(func.id)
+            if origin is None:
+                return None
+            module, orig_name = origin
+            return (*module.split("."), orig_name), f"{func.id}() (from {module})"
+
+        # --- Attribute calls: module.func(), module.submodule.func() ---
+        attrs: List[str] = []
+        while isinstance(func, ast.Attribute):
+            attrs.append(func.attr)
+            func = func.value
+        if not attrs or not isinstance(func, ast.Name):
+            return None
+        attrs.reverse()
+        local_name = func.id
+        qualified = scan.resolve(local_name)
+        called = f"{'.'.join((local_name, *attrs))}()"
+        if qualified.rpartition(".")[2] != local_name:
+            # Aliased import: show what the call resolves to
+            called += f" ({'.'.join((qualified, *attrs))})"
+        return (*qualified.split("."), *attrs), called
 
     def _check_call_node(
         self,
         node: ast.Call,
         file_path: str,
-        from_imports: Dict[str, Tuple[str, str]],
+        scan: _ModuleScan,
         has_random_seed: bool,
     ) -> Violation | None:
-        """Check a single ast.Call node for forbidden patterns.
+        """Check a single ast.Call node against the rule index.
 
         Returns a Violation if the call is forbidden, or None otherwise.
         """
-        line_no = getattr(node, "lineno", 0)
+        resolved = self._resolve_call(node.func, scan)
+        if resolved is None:
+            return None
+        path, called = resolved
+        rule = self.rules.match(path)
+        if rule is None or (rule.unless_seeded and has_random_seed):
+            return None
 
-        # --- Check attribute calls: module.func() ---
-        if isinstance(node.func, ast.Attribute):
-            attr_name = node.func.attr
-            value = node.func.value
-
-            # Simple case: direct module.func() like time.sleep()
-            if isinstance(value, ast.Name):
-                module_name = value.id
-                key = (module_name, attr_name)
-
-                # Special handling for random module
-                if module_name == "random" and attr_name in RANDOM_FUNCTIONS:
-                    if not has_random_seed:
-                        return Violation(
-                            axiom_id="Π.2.2",
-                            file_path=file_path,
-                            message=(
-                                f"Forbidden API call: random.{attr_name}() at line {line_no}. "
-                                f"Unseeded random call (seed with random.seed() for determinism)"
-                            ),
-                            severity=Severity.CRITICAL,
-                            state=ViolationState.NEW,
-                        )
-                    return None
-
-                # Check against forbidden attribute calls table
-                if key in FORBIDDEN_ATTR_CALLS:
-                    reason = FORBIDDEN_ATTR_CALLS[key]
-                    return Violation(
-                        axiom_id="Π.2.2",
-                        file_path=file_path,
-                        message=f"Forbidden API call: {module_name}.{attr_name}() at line {line_no}. {reason}",
-                        severity=Severity.CRITICAL,
-                        state=ViolationState.NEW,
-                    )
-
-            # Chained case: module.submodule.func() like datetime.datetime.utcnow()
-            if isinstance(value, ast.Attribute) and isinstance(value.value, ast.Name):
-                outer_module = value.value.id
-                inner_attr = value.attr
-                # e.g., datetime.datetime.utcnow()
-                key = (inner_attr, attr_name)
-                if key in FORBIDDEN_ATTR_CALLS:
-                    reason = FORBIDDEN_ATTR_CALLS[key]
-                    return Violation(
-                        axiom_id="Π.2.2",
-                        file_path=file_path,
-                        message=(
-                            f"Forbidden API call: {outer_module}.{inner_attr}.{attr_name}() at line {line_no}. {reason}"
-                        ),
-                        severity=Severity.CRITICAL,
-                        state=ViolationState.NEW,
-                    )
-
-        # --- Check bare name calls: func() from `from X import Y` ---
-        if isinstance(node.func, ast.Name):
-            func_name = node.func.id
-
-            # Check if this bare name was imported from a forbidden module
-            if func_name in BARE_NAME_FORBIDDEN:
-                module, orig_name = BARE_NAME_FORBIDDEN[func_name]
-                reason = FORBIDDEN_ATTR_CALLS.get((module, orig_name), "Forbidden API call")
-                return Violation(
-                    axiom_id="Π.2.2",
-                    file_path=file_path,
-                    message=f"Forbidden API call: {func_name}() (from {module}) at line {line_no}. {reason}",
-                    severity=Severity.CRITICAL,
-                    state=ViolationState.NEW,
-                )
-
-            # Check from-imported forbidden functions
-            origin = from_imports.get(func_name)
-            if origin:
-                module, orig_name = origin
-                # Check random functions
-                if module == "random" and orig_name in RANDOM_FUNCTIONS:
-                    if not has_random_seed:
-                        return Violation(
-                            axiom_id="Π.2.2",
-                            file_path=file_path,
-                            message=(
-                                f"Forbidden API call: {func_name}() (from random) at line {line_no}. "
-                                f"Unseeded random call (seed with random.seed() for determinism)"
-                            ),
-                            severity=Severity.CRITICAL,
-                            state=ViolationState.NEW,
-                        )
-                    return None
-
-                # Check other forbidden calls
-                key = (module, orig_name)
-                if key in FORBIDDEN_ATTR_CALLS:
-                    reason = FORBIDDEN_ATTR_CALLS[key]
-                    return Violation(
-                        axiom_id="Π.2.2",
-                        file_path=file_path,
-                        message=f"Forbidden API call: {func_name}() (from {module}) at line {line_no}. {reason}",
-                        severity=Severity.CRITICAL,
-                        state=ViolationState.NEW,
-                    )
-
-        return None
+        line_no = getattr(node, "lineno", 0)
+        return Violation(
+            axiom_id="Π.2.2",
+            file_path=file_path,
+            message=f"Forbidden API call: {called} at line {line_no}. {rule.reason}",
+            severity=Severity.CRITICAL,
+            state=ViolationState.NEW,
+        )
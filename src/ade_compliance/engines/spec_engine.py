@@ -1,45 +1,100 @@
 # implements: FR-001
 # traces_to: Π.1.1
 
-from pathlib import Path
-from typing import List
+"""Specification-first checks (Π.1.1).
 
+Specifications are discovered through ``SpecIndex``, refreshed once per run.
+``SpecPresenceEngine`` reports a repository without any specification once, at the
+repository level. ``SpecEngine`` checks each file on its own: its declared
+requirements (``implements: FR-xxx``) must be defined by some specification, and
+the violation names the spec that governs the file so the missing requirement can
+be added there. Its results are cached per file, keyed by the spec index digest.
+"""
+
+import re
+from typing import List, Optional
+
+from ..config import EngineConfig
 from ..models.axiom import Violation, ViolationState
+from ..services.spec_index import REQUIREMENT_ID, SpecIndex
+from ..utils.source import SourceFile
 from .base import BaseEngine
 
+# `implements:` markers in line comments (#, //, /* */ or docblock, <!-- -->, --)
+IMPLEMENTS_PATTERN = re.compile(r"(?im)^\s*(?:#|//|/?\*+|<!--|--)\s*implements\s*:\s*([^\n\r*]+)")
 
-class SpecEngine(BaseEngine):
-    async def check(self, files: List[str]) -> List[Violation]:
-        if not self.should_run():
-            return []
 
-        violations = []
-        # Naive check: Look for spec.md or *.feature in obvious places
-        # In reality, might search up from file path or checks repo root
+def declared_requirements(text: str) -> List[str]:
+    """Requirement IDs named by the ``implements:`` markers of a source, in first-seen order."""
+    seen = {}
+    for match in IMPLEMENTS_PATTERN.finditer(text):
+        for requirement_id in REQUIREMENT_ID.findall(match.group(1)):
+            seen.setdefault(requirement_id, None)
+    return list(seen)
 
-        # We assume files are relative to repo root or we check specific locations
-        # For this MVP, we verify if `specs/` exists or `spec.md` exists in root
 
-        repo_root = Path(".")  # Simplify
+class _SpecIndexEngine(BaseEngine):
+    """Engine reading a ``SpecIndex`` that is refreshed on first use in each run."""
 
-        # Check standard locations
-        if list(repo_root.glob("specs/**/*.md")) or list(repo_root.glob("*.md")):
-            # Check content for "Requirement" or "Feature"
-            # This is a stub for T026
-            pass
+    def __init__(self, config: EngineConfig, index: Optional[SpecIndex] = None):
+        super().__init__(config)
+        self.index = index if index is not None else SpecIndex()
+        self._refreshed = False
 
-        # Actually, the test mocks glob.
-        # Let's match the test expectation: it checks glob("specs/**/*.md") maybe?
-        # The test output in Step 187 mocked `pathlib.Path.glob`
+    def begin_run(self) -> None:
+        # Specs may have been added or edited since the last run
+        self._refreshed = False
+
+    def spec_index(self) -> SpecIndex:
+        """The spec index, brought up to date on first use in each run."""
+        if not self._refreshed:
+            self.index.refresh()
+            self._refreshed = True
+        return self.index
+
+
+class SpecPresenceEngine(_SpecIndexEngine):
+    # Repo-wide check: result depends on the specification tree, not on the input files
+    cacheable = False
+
+    async def check_sources(self, sources: List[SourceFile]) -> List[Violation]:
+        if not self.should_run() or len(self.spec_index()):
+            return []
+        return [Violation(axiom_id="Π.1.1", file_path=".", message="No specification found", state=ViolationState.NEW)]
 
-        # Re-reading test:
-        # with patch("pathlib.Path.glob", return_value=[]): ... missing
 
-        # Real implementation:
-        specs = list(Path(".").glob("specs/**/*.md")) + list(Path(".").glob("spec.md"))
-        if not specs:
+class SpecEngine(_SpecIndexEngine):
+    # A regex pass per file is cheaper than shipping the file (and a spec index) to a worker
+    parallel = False
+
+    def cache_key_extra(self, file_path: str) -> str:
+        """Results also depend on which requirements the specifications define, and where."""
+        return f"specs:{self.spec_index().digest()}"
+
+    async def check_sources(self, sources: List[SourceFile]) -> List[Violation]:
+        if not self.should_run():
+            return []
+
+        index = self.spec_index()
+        defined = index.requirement_ids()
+        if not defined:
+            # No specification (reported by SpecPresenceEngine) or free-form ones without
+            # requirement IDs: nothing to resolve against
+            return []
+
+        violations = []
+        for source in sources:
+            if not source.exists or source.text is None:
+                continue
+            declared = declared_requirements(source.text)
+            undefined = [requirement_id for requirement_id in declared if requirement_id not in defined]
+            if not undefined:
+                continue
+            message = f"Requirement(s) {', '.join(undefined)} not defined in any specification"
+            governing = index.governing_spec(source.norm_path, declared)
+            if governing:
+                message += f"; define them in {governing}"
             violations.append(
-                Violation(axiom_id="Π.1.1", file_path=".", message="No specification found", state=ViolationState.NEW)
+                Violation(axiom_id="Π.1.1", file_path=source.norm_path, message=message, state=ViolationState.NEW)
             )
-
         return violations
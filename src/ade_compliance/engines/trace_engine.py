@@ -2,63 +2,67 @@
 # traces_to: Π.3.1
 
 import hashlib
+import os
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
-from ..models.axiom import TraceLink, Violation, ViolationState
+from ..models.axiom import Violation, ViolationState
+from ..models.records import LinkRecord, TraceMatrix
+from ..utils.grammars import COMMENT_NODE_TYPES, GRAMMARS
+from ..utils.source import SourceFile
 from .base import BaseEngine
 
+# Source suffixes with trace marker extraction support
+TRACEABLE_SUFFIXES = (".py", ".js", ".ts", ".tsx", ".java")
 
-class TraceEngine(BaseEngine):
-    def __init__(self, config):
-        super().__init__(config)
-        self._cache: Dict[str, Tuple[str, List[TraceLink]]] = {}
-        self._parsers: Dict[str, Tuple[Optional[object], Optional[object]]] = {}
+# Link markers inside comments: implements:, validates:, traces_to:
+LINK_PATTERN = re.compile(r"(?i)\b(implements|validates|traces_to)\s*:\s*([^\n\r*]+)")
 
-    def _get_parser_and_lang(self, file_path: str) -> Tuple[Optional[object], Optional[object]]:
-        suffix = Path(file_path).suffix.lower()
-        if suffix in self._parsers:
-            return self._parsers[suffix]
+# Cheap byte-level superset of LINK_PATTERN; files without a hit cannot yield links
+MARKER_PREFILTER = re.compile(rb"(?i)implements|validates|traces_to")
 
-        parser = None
-        lang = None
+# Fallback tokenizer: block comments (/* ... */) and line comments (# or // to end of line)
+_COMMENT_TOKEN = re.compile(r"/\*(?P<block>[\s\S]*?)\*/|(?P<line>(?:#|//)[^\n]*)")
 
-        try:
-            from tree_sitter import Language, Parser
+# Declarations associated with a preceding comment by the fallback scanner, in priority order
+_SYMBOL_PATTERNS = (
+    re.compile(r"\bclass\s+(\w+)"),
+    re.compile(r"\b(?:def|function)\s+(\w+)"),
+    re.compile(r"\b(?:const|let|var)?\s*(\w+)\s*="),
+)
 
-            if suffix == ".py":
-                import tree_sitter_python as tspython
+# Files are parsed concurrently on a shared thread pool (tree-sitter releases the GIL while parsing)
+PARSE_THREADS = min(8, os.cpu_count() or 1)
+_PARSE_POOL = ThreadPoolExecutor(max_workers=PARSE_THREADS, thread_name_prefix="ade-parse")
 
-                lang = Language(tspython.language())
-                parser = Parser(lang)
-            elif suffix == ".js":
-                import tree_sitter_javascript as tsjavascript
+# Lines searched below a line comment for its declaration, and prefixes skipped while searching
+SYMBOL_LOOKAHEAD_LINES = 5
+_SKIPPED_LINE_PREFIXES = ("#", "//", "@")
 
-                lang = Language(tsjavascript.language())
-                parser = Parser(lang)
-            elif suffix in (".ts", ".tsx"):
-                import tree_sitter_typescript as tstypescript
 
-                lang = Language(tstypescript.language_typescript())
-                parser = Parser(lang)
-            elif suffix == ".java":
-                import tree_sitter_java as tsjava
+class TraceEngine(BaseEngine):
+    version = "2"
 
-                lang = Language(tsjava.language())
-                parser = Parser(lang)
-        except Exception:
-            # Fallback gracefully if tree-sitter or packages are not installed (e.g. in minimal environments)
-            pass
+    def __init__(self, config):
+        super().__init__(config)
+        self._cache: Dict[str, Tuple[str, List[LinkRecord]]] = {}
 
-        self._parsers[suffix] = (parser, lang)
-        return parser, lang
+    def _get_parser_and_lang(self, file_path: str) -> Tuple[Optional[object], Optional[object]]:
+        """This thread's parser and the shared language for ``file_path`` (None, None if unsupported)."""
+        suffix = Path(file_path).suffix.lower()
+        lang = GRAMMARS.language(suffix)
+        if lang is None:
+            return None, None
+        return GRAMMARS.parser(suffix), lang
 
     def _find_associated_symbol(self, comment_node, source_bytes: bytes) -> Optional[str]:
         """Navigate AST sibling nodes to find class/function/variable associated with this comment."""
         curr = comment_node.next_sibling
         while curr:
-            if curr.type in ("comment", "line_comment", "block_comment"):
+            if curr.type in COMMENT_NODE_TYPES:
                 curr = curr.next_sibling
                 continue
             if curr.type == "decorated_definition":
@@ -90,23 +94,104 @@ class TraceEngine(BaseEngine):
             break
         return None
 
-    def _walk_comments_with_symbols(self, node, source_bytes: bytes) -> List[Tuple[str, Optional[str]]]:
+    def _get_comment_query(self, file_path: str, lang) -> Optional[object]:
+        """This thread's comment query cursor, if it was compiled for ``lang`` (the parser's language)."""
+        suffix = Path(file_path).suffix.lower()
+        if lang is None or lang is not GRAMMARS.language(suffix):
+            return None
+        return GRAMMARS.comment_cursor(suffix)
+
+    @staticmethod
+    def _iter_comment_nodes(root) -> Iterator[object]:
+        """Yield comment nodes in document order using an explicit stack instead of recursion."""
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if node.type in COMMENT_NODE_TYPES:
+                yield node
+            else:
+                stack.extend(reversed(node.children))
+
+    @staticmethod
+    def _symbol_after(content: str, pos: int) -> Optional[str]:
+        """Declared name on the first code line within the lookahead window starting at ``pos``.
+
+        Blank lines, comment lines and decorators are skipped; the first other line
+        decides (None when it declares nothing).
+        """
+        length = len(content)
+        for _ in range(SYMBOL_LOOKAHEAD_LINES):
+            if pos > length:
+                break
+            nl = content.find("\n", pos)
+            if nl == -1:
+                nl = length
+            line = content[pos:nl].strip()
+            pos = nl + 1
+            if not line or line.startswith(_SKIPPED_LINE_PREFIXES):
+                continue
+            for pattern in _SYMBOL_PATTERNS:
+                match = pattern.search(line)
+                if match:
+                    return match.group(1)
+            return None
+        return None
+
+    def _scan_comments_with_symbols(self, content: str) -> List[Tuple[str, Optional[str]]]:
+        """Regex fallback for when tree-sitter is unavailable: one forward sweep over ``content``.
+
+        Only comments containing a marker are returned. Line comments are paired with
+        the declaration following them; block comments carry no symbol.
+        """
+        comments: List[Tuple[str, Optional[str]]] = []
+        for token in _COMMENT_TOKEN.finditer(content):
+            block = token.group("block")
+            if block is not None:
+                if LINK_PATTERN.search(block):
+                    comments.append((block, None))
+                continue
+            text = token.group("line")
+            if LINK_PATTERN.search(text):
+                comments.append((text, self._symbol_after(content, token.end() + 1)))
+        return comments
+
+    def _walk_comments_with_symbols(
+        self, node, source_bytes: bytes, query: Optional[object] = None
+    ) -> List[Tuple[str, Optional[str]]]:
+        """Collect ``(comment text, associated symbol)`` pairs beneath ``node``.
+
+        With a comment query the Python-level work is proportional to the number of
+        comments; otherwise the tree is walked iteratively (no recursion limit on deeply
+        nested sources).
+        """
+        if query is not None:
+            nodes = sorted(query.captures(node).get("comment", ()), key=lambda n: n.start_byte)
+        else:
+            nodes = self._iter_comment_nodes(node)
+
         comments = []
-        if node.type in ("comment", "line_comment", "block_comment"):
+        for comment_node in nodes:
             try:
-                comment_text = source_bytes[node.start_byte : node.end_byte].decode("utf-8")
-                symbol = self._find_associated_symbol(node, source_bytes)
+                comment_text = source_bytes[comment_node.start_byte : comment_node.end_byte].decode("utf-8")
+                symbol = self._find_associated_symbol(comment_node, source_bytes)
                 comments.append((comment_text, symbol))
             except Exception:
                 pass
-
-        for child in node.children:
-            comments.extend(self._walk_comments_with_symbols(child, source_bytes))
         return comments
 
-    def extract_links(self, file_path: str, content: str) -> List[TraceLink]:
-        # Compute hash
-        content_hash = hashlib.md5(content.encode("utf-8"), usedforsecurity=False).hexdigest()
+    def extract_links(
+        self,
+        file_path: str,
+        content: str,
+        content_hash: Optional[str] = None,
+        source_bytes: Optional[bytes] = None,
+    ) -> List[LinkRecord]:
+        """Extract trace links from ``content``; ``source_bytes`` may pass its UTF-8 encoding to avoid re-encoding."""
+        if source_bytes is None:
+            source_bytes = content.encode("utf-8")
+        # Compute hash unless the caller already fingerprinted the content
+        if content_hash is None:
+            content_hash = hashlib.md5(source_bytes, usedforsecurity=False).hexdigest()
 
         # Check cache
         if file_path in self._cache:
@@ -114,91 +199,88 @@ class TraceEngine(BaseEngine):
             if cached_hash == content_hash:
                 return cached_links
 
-        links: List[TraceLink] = []
-        parser, _ = self._get_parser_and_lang(file_path)
+        links: List[LinkRecord] = []
+        if not MARKER_PREFILTER.search(source_bytes):
+            # No marker keyword anywhere: skip parsing entirely
+            self._cache[file_path] = (content_hash, links)
+            return links
+
+        parser, lang = self._get_parser_and_lang(file_path)
 
         comments_with_symbols: List[Tuple[str, Optional[str]]] = []
         if parser:
+            # Trees are shared through the parse cache, keyed by content hash
+            tree = self.parse_cache.tree_sitter(Path(file_path).suffix.lower(), content_hash, source_bytes, parser)
             try:
-                source_bytes = content.encode("utf-8")
-                tree = parser.parse(source_bytes)
-                comments_with_symbols = self._walk_comments_with_symbols(tree.root_node, source_bytes)
+                if tree is None:
+                    parser = None
+                else:
+                    query = self._get_comment_query(file_path, lang)
+                    comments_with_symbols = self._walk_comments_with_symbols(tree.root_node, source_bytes, query)
             except Exception:
                 parser = None
 
         if not parser:
-            # Fallback to regex comment search if tree-sitter parsing is unavailable or failed
-            lines = content.splitlines()
-            for idx, line in enumerate(lines):
-                # 1. Single-line comments (# and //)
-                single_match = re.search(r"(?:#|//)\s*(.*)", line)
-                if single_match:
-                    comment_text = single_match.group(0)  # Preserve the full comment prefix to maintain regex format
-                    # Search up to 5 lines ahead for associated symbol
-                    symbol = None
-                    for j in range(idx + 1, min(idx + 6, len(lines))):
-                        next_line = lines[j].strip()
-                        if (
-                            not next_line
-                            or next_line.startswith("#")
-                            or next_line.startswith("//")
-                            or next_line.startswith("@")
-                        ):
-                            continue
-                        class_match = re.search(r"\bclass\s+(\w+)", next_line)
-                        if class_match:
-                            symbol = class_match.group(1)
-                            break
-                        func_match = re.search(r"\b(?:def|function)\s+(\w+)", next_line)
-                        if func_match:
-                            symbol = func_match.group(1)
-                            break
-                        assign_match = re.search(r"\b(?:const|let|var)?\s*(\w+)\s*=", next_line)
-                        if assign_match:
-                            symbol = assign_match.group(1)
-                            break
-                        break
-                    comments_with_symbols.append((comment_text, symbol))
-
-            # 2. Multi-line block comments (/* ... */)
-            # For simplicity, block comments in fallback are processed without direct symbol mapping
-            for block in re.findall(r"/\*([\s\S]*?)\*/", content):
-                for line in block.splitlines():
-                    cleaned_line = re.sub(r"^\s*\*\s*", "", line).strip()
-                    comments_with_symbols.append((cleaned_line, None))
-
-        # Regex to match implements:, validates:, traces_to:
-        pattern = re.compile(r"(?i)\b(implements|validates|traces_to)\s*:\s*([^\n\r*]+)")
+            # Fallback to a regex comment scan if tree-sitter parsing is unavailable or failed
+            comments_with_symbols = self._scan_comments_with_symbols(content)
 
         for comment, symbol in comments_with_symbols:
-            matches = pattern.findall(comment)
+            matches = LINK_PATTERN.findall(comment)
             for link_type, targets in matches:
                 # Clean targets
                 targets_str = targets.split("*/")[0].strip()  # Strip block comment close if present
                 for target in [t.strip() for t in targets_str.split(",") if t.strip()]:
-                    links.append(
-                        TraceLink(
-                            source=file_path,
-                            target=target,
-                            type=link_type.lower(),
-                            symbol=symbol,
-                        )
-                    )
+                    links.append(LinkRecord.create(file_path, target, link_type.lower(), symbol))
 
         # Update cache
         self._cache[file_path] = (content_hash, links)
         return links
 
-    async def check(self, files: List[str]) -> List[Violation]:
+    def remember(self, file_path: str, content_hash: str, links: List[LinkRecord]) -> None:
+        """Seed the extraction cache with links known to match ``content_hash`` (e.g. from a persistent index)."""
+        self._cache[file_path] = (content_hash, links)
+
+    def extract_source_links(self, source: SourceFile) -> List[LinkRecord]:
+        """Extract trace links from a pre-loaded source file (empty if unreadable or unsupported)."""
+        if not source.exists or source.text is None or source.suffix not in TRACEABLE_SUFFIXES:
+            return []
+        return self.extract_links(source.path, source.text, source.digest, source.data)
+
+    def _timed_extract(self, source: SourceFile) -> Tuple[float, float]:
+        start, cpu_start = time.perf_counter(), time.thread_time()
+        self.extract_source_links(source)
+        return time.perf_counter() - start, time.thread_time() - cpu_start
+
+    def prefetch_links(self, sources: List[SourceFile]) -> Dict[str, Tuple[float, float]]:
+        """Extract links for many files concurrently, warming the extraction cache.
+
+        Only files that actually need a parse (uncached, containing markers) are
+        submitted, and only when there are several of them. Returns the wall and CPU
+        seconds spent per path so callers can still attribute time to each file.
+        """
+        pending = []
+        for source in sources:
+            if not source.exists or source.text is None or source.suffix not in TRACEABLE_SUFFIXES:
+                continue
+            cached = self._cache.get(source.path)
+            if cached is not None and cached[0] == source.digest:
+                continue
+            if MARKER_PREFILTER.search(source.data):
+                pending.append(source)
+        if PARSE_THREADS < 2 or len(pending) < 2:
+            return {}
+        timings = _PARSE_POOL.map(self._timed_extract, pending)
+        return {source.path: timing for source, timing in zip(pending, timings, strict=True)}
+
+    async def check_sources(self, sources: List[SourceFile]) -> List[Violation]:
         if not self.should_run():
             return []
 
-        from ..utils.path import normalize_project_path
-
+        if len(sources) > 1:
+            self.prefetch_links(sources)
         violations: List[Violation] = []
-        for file_path in files:
-            norm_path = normalize_project_path(file_path)
-            path = Path(file_path)
+        for source in sources:
+            norm_path = source.norm_path
             # Only trace code in src/ or tests/
             if not (norm_path.startswith("src/") or norm_path.startswith("tests/")):
                 continue
@@ -208,19 +290,13 @@ class TraceEngine(BaseEngine):
                 continue
 
             # Support checking supported language suffixes
-            if path.suffix.lower() not in (".py", ".js", ".ts", ".tsx", ".java"):
+            if source.suffix not in TRACEABLE_SUFFIXES:
                 continue
 
-            if not path.exists():
-                continue
-
-            try:
-                with open(path, "r", encoding="utf-8") as f:
-                    content = f.read()
-            except Exception:
+            if not source.exists or source.text is None:
                 continue
 
-            links = self.extract_links(file_path, content)
+            links = self.extract_links(source.path, source.text, source.digest, source.data)
 
             # Heuristic: Every implementation file in src/ must have at least one trace link
             if norm_path.startswith("src/") and not links:
@@ -235,21 +311,6 @@ class TraceEngine(BaseEngine):
 
         return violations
 
-    def generate_matrix(self, links: List[TraceLink]) -> Dict[str, Dict[str, List[str]]]:
-        matrix: Dict[str, Dict[str, List[str]]] = {}
-        for link in links:
-            if link.source not in matrix:
-                matrix[link.source] = {
-                    "implements": [],
-                    "validates": [],
-                    "traces_to": [],
-                }
-
-            ltype = link.type.lower()
-            if ltype in matrix[link.source]:
-                # If symbol metadata is present, include it in target formatting
-                target_str = f"{link.target} ({link.symbol})" if link.symbol else link.target
-                # Avoid duplicates
-                if target_str not in matrix[link.source][ltype]:
-                    matrix[link.source][ltype].append(target_str)
-        return matrix
+    def generate_matrix(self, links: Iterable[LinkRecord]) -> Dict[str, Dict[str, List[str]]]:
+        """Nested ``{source: {link type: [targets]}}`` matrix; symbols annotate targets, duplicates are dropped."""
+        return TraceMatrix(links).to_nested()
@@ -197,6 +197,20 @@ class Attestation(BaseModel):
     timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc).replace(tzinfo=None))
 
 
+class FileCheckResult(BaseModel):
+    """Outcome of a compliance run for one file, emitted by ``Orchestrator.stream``.
+
+    ``timings_ms`` maps engine names to the time spent on this file; results replayed
+    from the result cache report ``0.0``. Findings of repository-wide engines are
+    emitted under the path reported in their violations.
+    """
+
+    file_path: str
+    violations: list[Violation] = Field(default_factory=list)
+    trace_links: list[TraceLink] = Field(default_factory=list)
+    timings_ms: dict[str, float] = Field(default_factory=dict)
+
+
 class ComplianceReport(BaseModel):
     """Aggregate compliance report produced by the orchestrator.
 
@@ -231,6 +245,40 @@ class ComplianceReport(BaseModel):
         """Alias accessor for ``generated_at``."""
         return self.generated_at
 
+    @classmethod
+    def merge(cls, reports: "list[ComplianceReport]") -> "ComplianceReport":
+        """Combine reports from disjoint runs (e.g. CI shards) into one report.
+
+        Violations and ``checks_run`` are concatenated, traceability matrices are
+        merged per source and link type without duplicating targets, and the duration
+        is the longest input (shards run in parallel). Per-input metrics are kept under
+        ``metrics["merged"]``.
+        """
+        # Insertion-ordered dicts act as ordered sets for constant-time dedupe
+        ordered: dict[str, dict[str, dict[str, None]]] = {}
+        for report in reports:
+            for source, links in report.traceability_matrix.items():
+                merged_links = ordered.setdefault(source, {})
+                for link_type, targets in links.items():
+                    merged_links.setdefault(link_type, {}).update(dict.fromkeys(targets))
+        matrix = {
+            source: {link_type: list(targets) for link_type, targets in links.items()}
+            for source, links in ordered.items()
+        }
+
+        commits = {r.commit_sha for r in reports if r.commit_sha}
+        merged = cls(
+            repo_root=reports[0].repo_root if reports else ".",
+            commit_sha=commits.pop() if len(commits) == 1 else None,
+            check_duration_ms=max((r.check_duration_ms for r in reports), default=0),
+            checks_run=[check for r in reports for check in r.checks_run],
+            violations=[v for r in reports for v in r.violations],
+            traceability_matrix=matrix,
+            metrics={"merged": [r.metrics for r in reports]},
+        )
+        merged.generate_summary()
+        return merged
+
     def generate_summary(self) -> str:
         """Generate and cache a violation summary, returning a human-readable string."""
         self.summary = {
@@ -250,6 +298,7 @@ __all__ = [
     "ComplianceReport",
     "Criticality",
     "Decision",
+    "FileCheckResult",
     "InvalidStateTransition",
     "Override",
     "ScopeType",
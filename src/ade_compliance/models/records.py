@@ -0,0 +1,105 @@
+# implements: FR-003
+# traces_to: Π.3.1
+
+"""Compact internal records for traceability links and the traceability matrix.
+
+Large repositories produce hundreds of thousands of trace links per run. Inside the
+engines, the orchestrator, the result cache and the trace index they are kept as
+``LinkRecord`` tuples (no per-instance ``__dict__`` or validation) whose strings are
+interned, so repeated paths, targets and link types share one object. They are
+converted to the pydantic ``TraceLink`` model only at API/report boundaries.
+
+``TraceMatrix`` holds deduplicated matrix rows column-wise (one list per column) and
+renders the nested ``{source: {link type: [targets]}}`` report form on demand.
+"""
+
+import sys
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from . import TraceLink
+
+
+class LinkRecord(NamedTuple):
+    """A directed traceability link, field-compatible with ``TraceLink``."""
+
+    source: str
+    target: str
+    type: str
+    symbol: Optional[str] = None
+
+    @classmethod
+    def create(cls, source: str, target: str, type: str, symbol: Optional[str] = None) -> "LinkRecord":
+        """Build a record with interned strings."""
+        intern = sys.intern
+        return cls(intern(source), intern(target), intern(type), intern(symbol) if symbol is not None else None)
+
+    @classmethod
+    def from_model(cls, link: TraceLink) -> "LinkRecord":
+        return cls.create(link.source, link.target, link.type, link.symbol)
+
+    def to_model(self) -> TraceLink:
+        return TraceLink(source=self.source, target=self.target, type=self.type, symbol=self.symbol)
+
+
+# Link types shown in the traceability matrix, in report order
+MATRIX_LINK_TYPES = ("implements", "validates", "traces_to")
+
+# Column names of exported matrix rows
+MATRIX_COLUMNS = ("source", "type", "target", "symbol")
+
+
+def _display_target(target: str, symbol: Optional[str]) -> str:
+    """Matrix cell text: the target, annotated with the linked symbol when there is one."""
+    return f"{target} ({symbol})" if symbol else target
+
+
+class TraceMatrix:
+    """Columnar, deduplicated traceability matrix.
+
+    Rows keep first-seen order; duplicates are detected with a hash set instead of
+    scanning the per-source target lists.
+    """
+
+    def __init__(self, links: Iterable[LinkRecord] = ()):
+        self.sources: List[str] = []
+        self.types: List[str] = []
+        self.targets: List[str] = []
+        self.symbols: List[Optional[str]] = []
+        self._seen: Set[Tuple[str, str, str]] = set()
+        self.extend(links)
+
+    def __len__(self) -> int:
+        return len(self.sources)
+
+    def add(self, link: LinkRecord) -> bool:
+        """Add a link's row unless it is a duplicate or of an unknown type; True if added."""
+        ltype = link.type.lower()
+        if ltype not in MATRIX_LINK_TYPES:
+            return False
+        key = (link.source, ltype, _display_target(link.target, link.symbol))
+        if key in self._seen:
+            return False
+        self._seen.add(key)
+        self.sources.append(link.source)
+        self.types.append(ltype)
+        self.targets.append(link.target)
+        self.symbols.append(link.symbol)
+        return True
+
+    def extend(self, links: Iterable[LinkRecord]) -> None:
+        for link in links:
+            self.add(link)
+
+    def rows(self) -> Iterator[Tuple[str, str, str, Optional[str]]]:
+        """Yield ``(source, type, target, symbol)`` rows in insertion order."""
+        return zip(self.sources, self.types, self.targets, self.symbols, strict=True)
+
+    def to_nested(self) -> Dict[str, Dict[str, List[str]]]:
+        """Report form: ``{source: {link type: ["target (symbol)", ...]}}``."""
+        matrix: Dict[str, Dict[str, List[str]]] = {}
+        for source, ltype, target, symbol in self.rows():
+            entry = matrix.get(source)
+            if entry is None:
+                entry = matrix[source] = {t: [] for t in MATRIX_LINK_TYPES}
+            entry[ltype].append(_display_target(target, symbol))
+        return matrix
@@ -7,6 +7,6 @@ The ComplianceReport collects violations, traceability matrices, and
 metrics from a compliance run into a single serializable document.
 """
 
-from . import ComplianceReport
+from . import ComplianceReport, FileCheckResult
 
-__all__ = ["ComplianceReport"]
+__all__ = ["ComplianceReport", "FileCheckResult"]
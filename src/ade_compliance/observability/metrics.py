@@ -4,7 +4,7 @@
 """T064: Prometheus-compatible metrics for observability (FR-026).
 
 Exposes counters and histograms for compliance checks, attestations,
-violations, escalations, and check duration.
+violations, escalations, result cache hit rate, and check and per-engine duration.
 """
 
 from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
@@ -32,6 +32,18 @@ escalation_total = Counter(
     "Total number of escalations triggered",
 )
 
+result_cache_hits_total = Counter(
+    "result_cache_hits_total",
+    "Total number of per-file engine results replayed from the result cache",
+    ["engine"],
+)
+
+result_cache_misses_total = Counter(
+    "result_cache_misses_total",
+    "Total number of per-file engine results recomputed due to a cache miss",
+    ["engine"],
+)
+
 # Gauges
 escalation_queue_depth = Gauge(
     "escalation_queue_depth",
@@ -51,6 +63,26 @@ check_duration_seconds = Histogram(
     buckets=[0.1, 0.5, 1.0, 2.5, 5.0, 10.0],
 )
 
+engine_duration_seconds = Histogram(
+    "engine_duration_seconds",
+    "Wall-clock time spent in one compliance engine during a run, in seconds",
+    ["engine"],
+    buckets=[0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0],
+)
+
+engine_cpu_seconds = Histogram(
+    "engine_cpu_seconds",
+    "CPU time spent in one compliance engine during a run (including worker processes), in seconds",
+    ["engine"],
+    buckets=[0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0],
+)
+
+lock_wait_seconds = Histogram(
+    "lock_wait_seconds",
+    "Time spent waiting for the repository compliance lock in seconds",
+    buckets=[0.001, 0.01, 0.1, 0.5, 1.0, 5.0, 30.0, 120.0],
+)
+
 
 def get_metrics_output() -> tuple[bytes, str]:
     """Generate Prometheus metrics output.
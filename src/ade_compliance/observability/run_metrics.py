@@ -0,0 +1,114 @@
+# implements: FR-026
+# traces_to: Π.3.1
+
+"""Per-run timing and throughput instrumentation for ``Orchestrator.run``.
+
+``RunMetrics`` accumulates wall and CPU time per engine, files processed, bytes
+read, result cache hits and per-file cost during a run, then publishes them into
+``ComplianceReport.checks_run`` / ``metrics`` and the ``engine_duration_seconds`` /
+``engine_cpu_seconds`` Prometheus histograms.
+"""
+
+import heapq
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+from .metrics import engine_cpu_seconds, engine_duration_seconds
+
+# Number of slowest files listed in the report metrics
+DEFAULT_TOP_FILES = 10
+
+
+@dataclass
+class EngineStats:
+    """Accumulated cost of one engine over a run."""
+
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    files: int = 0
+    violations: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+
+class RunMetrics:
+    """Collector for one compliance run; engines are reported in registration order."""
+
+    def __init__(self, top_files: int = DEFAULT_TOP_FILES):
+        self.top_files = top_files
+        self.engines: Dict[str, EngineStats] = {}
+        self.file_seconds: Dict[str, float] = {}
+        self.files_processed = 0
+        self.bytes_read = 0
+        self.parses: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0}
+        self.duration_seconds = 0.0
+
+    def engine(self, name: str) -> EngineStats:
+        stats = self.engines.get(name)
+        if stats is None:
+            stats = self.engines[name] = EngineStats()
+        return stats
+
+    def record_engine(self, name: str, wall_seconds: float, cpu_seconds: float = 0.0) -> None:
+        """Add time spent in an engine call (one batch, or a whole repository-wide check)."""
+        stats = self.engine(name)
+        stats.wall_seconds += wall_seconds
+        stats.cpu_seconds += cpu_seconds
+
+    def record_file(self, name: str, file_path: str, seconds: float, cpu_seconds: float, violations: int) -> None:
+        """Attribute one engine's work on one file (zero cost for cache replays)."""
+        stats = self.engine(name)
+        stats.files += 1
+        stats.violations += violations
+        stats.cpu_seconds += cpu_seconds
+        self.file_seconds[file_path] = self.file_seconds.get(file_path, 0.0) + seconds
+
+    def record_cache(self, name: str, hits: int, misses: int) -> None:
+        stats = self.engine(name)
+        stats.cache_hits += hits
+        stats.cache_misses += misses
+
+    def slowest_files(self) -> List[Dict[str, Any]]:
+        top = heapq.nlargest(self.top_files, self.file_seconds.items(), key=lambda item: item[1])
+        return [{"file_path": path, "duration_ms": round(seconds * 1000, 3)} for path, seconds in top if seconds > 0]
+
+    def checks_run(self) -> List[Dict[str, object]]:
+        """One entry per engine for ``ComplianceReport.checks_run``."""
+        return [
+            {
+                "engine": name,
+                "files": stats.files,
+                "violations": stats.violations,
+                "duration_ms": round(stats.wall_seconds * 1000, 3),
+                "cpu_ms": round(stats.cpu_seconds * 1000, 3),
+                "cache_hits": stats.cache_hits,
+                "cache_misses": stats.cache_misses,
+            }
+            for name, stats in self.engines.items()
+        ]
+
+    def summary(self) -> Dict[str, object]:
+        """Run-level figures for ``ComplianceReport.metrics``."""
+        hits = sum(s.cache_hits for s in self.engines.values())
+        misses = sum(s.cache_misses for s in self.engines.values())
+        return {
+            "files_processed": self.files_processed,
+            "bytes_read": self.bytes_read,
+            "parse_cache": dict(self.parses),
+            "cache": {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+            },
+            "engines": {
+                name: {"wall_ms": round(s.wall_seconds * 1000, 3), "cpu_ms": round(s.cpu_seconds * 1000, 3)}
+                for name, s in self.engines.items()
+            },
+            "slowest_files": self.slowest_files(),
+        }
+
+    def publish(self) -> None:
+        """Observe per-engine durations in the Prometheus histograms."""
+        for name, stats in self.engines.items():
+            engine_duration_seconds.labels(engine=name).observe(stats.wall_seconds)
+            engine_cpu_seconds.labels(engine=name).observe(stats.cpu_seconds)
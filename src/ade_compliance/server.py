@@ -5,20 +5,22 @@
 
 Provides HTTP API endpoints for agent self-governance:
 - Health check
-- Pre-execution compliance checks
+- Pre-execution compliance checks (buffered and streaming NDJSON)
 - Attestation recording
 - Reports and overrides
+- Reverse traceability lookups from the persistent trace index
 - Prometheus metrics
 
 Binds to 127.0.0.1 only with single uvicorn worker (T066).
 """
 
+import json
 import time
 from pathlib import Path
-from typing import List, Optional, cast
+from typing import AsyncIterator, List, Optional, cast
 
 from fastapi import APIRouter, Depends, FastAPI, Header, HTTPException, Query, Request
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
 
 from ade_compliance.config import Config, load_config
@@ -32,6 +34,7 @@ from ade_compliance.observability.metrics import (
 )
 from ade_compliance.services.attestation import AttestationService
 from ade_compliance.services.override import OverrideService
+from ade_compliance.services.trace_index import TraceIndex
 
 # --- Request/Response Models ---
 
@@ -82,6 +85,22 @@ class CreateOverrideRequest(BaseModel):
     permanent_justification: str = ""
 
 
+class TraceLinkEntry(BaseModel):
+    """One file/symbol linked to a traceability target."""
+
+    source: str
+    symbol: Optional[str] = None
+    type: str
+
+
+class TraceQueryResponse(BaseModel):
+    """Response body for GET /traceability/{target}."""
+
+    target: str
+    links: List[TraceLinkEntry]
+    count: int
+
+
 class PreflightRequest(BaseModel):
     """Request body for POST /api/v1/compliance/preflight."""
 
@@ -118,6 +137,14 @@ def get_override_service(request: Request) -> OverrideService:
     return cast(OverrideService, request.app.state.override_service)
 
 
+def get_trace_index(request: Request) -> TraceIndex:
+    """Dependency to retrieve the persistent TraceIndex from app state (503 when disabled)."""
+    index = getattr(request.app.state, "trace_index", None)
+    if index is None:
+        raise HTTPException(status_code=503, detail="Trace index is disabled (global.cache_enabled: false)")
+    return cast(TraceIndex, index)
+
+
 def get_current_sso_user(
     request: Request,
     authorization: Optional[str] = Header(None, alias="Authorization"),
@@ -194,6 +221,42 @@ async def check(
     )
 
 
+@router.post("/check/stream")
+async def check_stream(
+    request: CheckRequest,
+    attestation_service: AttestationService = Depends(get_attestation_service),
+):
+    """Run pre-execution compliance checks, streaming per-file results as NDJSON.
+
+    Emits one ``{"event": "file", ...}`` line per checked file as soon as it completes,
+    followed by a single ``{"event": "complete", ...}`` summary line.
+    """
+    compliance_checks_total.inc()
+
+    async def lines() -> AsyncIterator[str]:
+        start_time = time.monotonic()
+        files_checked = 0
+        violations_count = 0
+        async for result in attestation_service.pre_check_stream(request.files):
+            files_checked += 1
+            violations_count += len(result.violations)
+            payload = {"event": "file", **result.model_dump(mode="json")}
+            yield json.dumps(payload) + "\n"
+
+        duration = time.monotonic() - start_time
+        check_duration_seconds.observe(duration)
+        summary = {
+            "event": "complete",
+            "files_checked": len(request.files),
+            "results": files_checked,
+            "violations_count": violations_count,
+            "duration_ms": int(duration * 1000),
+        }
+        yield json.dumps(summary) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
 @router.post("/attest", response_model=AttestResponse)
 def attest(
     request: AttestRequest,
@@ -241,6 +304,17 @@ def trend_report(
     return attestation_service.audit.get_trend_report(days=days)
 
 
+@router.get("/traceability/{target:path}", response_model=TraceQueryResponse)
+def traceability(target: str, index: TraceIndex = Depends(get_trace_index)):
+    """List files and symbols implementing, validating or tracing to a target, from the trace index."""
+    links = index.query(target)
+    return TraceQueryResponse(
+        target=target,
+        links=[TraceLinkEntry(source=k.source, symbol=k.symbol, type=k.type) for k in links],
+        count=len(links),
+    )
+
+
 @router.get("/overrides")
 def get_overrides(
     current_user: str = Depends(get_current_sso_user),
@@ -386,12 +460,14 @@ def prompt_decorate(
 def create_app(
     config_path: Optional[str] = None,
     audit_path: Optional[str] = None,
+    cache_path: Optional[str] = None,
 ) -> FastAPI:
     """Create and configure the FastAPI application.
 
     Args:
         config_path: Path to .ade-compliance.yml config file.
         audit_path: Override audit DB path (for testing).
+        cache_path: Override the result cache and index directory (for testing).
 
     Returns:
         Configured FastAPI application.
@@ -405,6 +481,8 @@ def create_app(
     # Override audit path if provided (testing)
     if audit_path:
         config.global_settings.audit_path = audit_path
+    if cache_path:
+        config.global_settings.cache_path = cache_path
 
     # Initialize services
     attestation_service = AttestationService(config)
@@ -420,6 +498,11 @@ def create_app(
     app.state.attestation_service = attestation_service
     app.state.override_service = override_service
     app.state.config = config
+    try:
+        app.state.trace_index = TraceIndex.from_config(config)
+    except Exception:
+        # Reverse lookups are optional; /traceability answers 503 without an index
+        app.state.trace_index = None
 
     # Include modular router
     app.include_router(router)
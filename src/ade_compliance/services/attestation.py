@@ -7,12 +7,12 @@ Provides pre-execution compliance self-checks and post-task attestation
 recording with confidence-based escalation (confidence < 0.7 triggers escalation).
 """
 
-from typing import List
+from typing import AsyncIterator, List
 
 from ..config import Config
 from ..models.axiom import Violation
 from ..models.decision import Attestation
-from ..models.report import ComplianceReport
+from ..models.report import ComplianceReport, FileCheckResult
 from .base import BaseService
 
 CONFIDENCE_THRESHOLD = 0.7
@@ -59,19 +59,30 @@ class AttestationService(BaseService):
             status=status,
         )
 
-        # Log to audit trail
-        self.audit.log(
-            "ATTESTATION_RECORDED",
-            {
-                "agent_id": agent_id,
-                "task_id": task_id,
-                "confidence": confidence,
-                "axioms_applied": axioms_applied,
-                "status": status,
-            },
-        )
-
-        # If escalated, log escalation event and trigger EscalationService
+        # Log to audit trail; the escalation event (if any) is written in the same transaction
+        with self.audit.batch() as batch:
+            batch.log(
+                "ATTESTATION_RECORDED",
+                {
+                    "agent_id": agent_id,
+                    "task_id": task_id,
+                    "confidence": confidence,
+                    "axioms_applied": axioms_applied,
+                    "status": status,
+                },
+            )
+            if status == "escalated":
+                batch.log(
+                    "ESCALATION_TRIGGERED",
+                    {
+                        "agent_id": agent_id,
+                        "task_id": task_id,
+                        "confidence": confidence,
+                        "reason": f"Confidence {confidence} below threshold {CONFIDENCE_THRESHOLD}",
+                    },
+                )
+
+        # If escalated, trigger EscalationService
         from ..models.decision import Decision
         from ..services.escalation import EscalationService
         from ..utils.async_helpers import run_async_safe
@@ -79,15 +90,6 @@ class AttestationService(BaseService):
         escalation_service = EscalationService(self.config)
 
         if status == "escalated":
-            self.audit.log(
-                "ESCALATION_TRIGGERED",
-                {
-                    "agent_id": agent_id,
-                    "task_id": task_id,
-                    "confidence": confidence,
-                    "reason": f"Confidence {confidence} below threshold {CONFIDENCE_THRESHOLD}",
-                },
-            )
             title = f"[ADE Escalation] Low-Confidence Attestation: Task {task_id}"
             body = (
                 f"Agent attestation has low confidence and was escalated.\n\n"
@@ -138,6 +140,22 @@ class AttestationService(BaseService):
         report = await self._run_orchestrator(files)
         return report.violations
 
+    async def pre_check_stream(self, files: List[str]) -> AsyncIterator[FileCheckResult]:
+        """Streaming variant of ``pre_check`` yielding each file's result as it completes.
+
+        Args:
+            files: List of file paths to check.
+
+        Yields:
+            Per-file results, including violations, trace links and engine timings.
+        """
+        self.audit.log("PRE_CHECK_RUN", {"files_count": len(files)})
+
+        from ..services.orchestrator import Orchestrator
+
+        async for result in Orchestrator(self.config).stream(files):
+            yield result
+
     async def _run_orchestrator(self, files: List[str]) -> ComplianceReport:
         """Run the orchestrator on the given files.
 
@@ -9,7 +9,8 @@ Logs framework runs, violations, and override registrations with SHA-256 validat
 import hashlib
 import json
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List
+from types import TracebackType
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
 
 from sqlalchemy import Column, DateTime, Integer, String
 
@@ -43,15 +44,47 @@ class AuditService(BaseService):
 
     def log(self, action: str, details: Dict[str, Any]) -> None:
         """Append a new cryptographic entry to the audit log."""
-        # Log structured JSON to stdout using loguru
-        logger.info("audit_event", action=action, details=details)
+        try:
+            self._append([(action, details)])
+        except Exception as e:
+            if isinstance(e, DatabaseException):
+                raise
+            raise DatabaseException(f"Failed to write audit entry for action '{action}': {e}") from e
+
+    def log_many(self, events: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+        """Append several ``(action, details)`` entries in a single transaction.
 
+        Hashes are chained in memory exactly as ``log`` would chain them one by one, so
+        ``verify_chain`` cannot tell a batch from individual writes. Returns the number
+        of entries written.
+        """
+        events = list(events)
+        if not events:
+            return 0
         try:
-            with self.db_manager.session(self.config) as session:
-                # Query last hash for cryptographic chain
-                last_entry = session.query(AuditEntry).order_by(AuditEntry.id.desc()).first()
-                prev_hash = last_entry.hash if last_entry else "0" * 64
+            self._append(events)
+        except Exception as e:
+            if isinstance(e, DatabaseException):
+                raise
+            raise DatabaseException(f"Failed to write {len(events)} audit entries: {e}") from e
+        return len(events)
+
+    def batch(self) -> "AuditBatch":
+        """Collect entries in memory and write them with ``log_many`` when the block exits."""
+        return AuditBatch(self)
+
+    def _append(self, events: List[Tuple[str, Dict[str, Any]]]) -> None:
+        for action, details in events:
+            # Log structured JSON to stdout using loguru
+            logger.info("audit_event", action=action, details=details)
 
+        with self.db_manager.session(self.config) as session:
+            # Query last hash for cryptographic chain
+            last_entry = session.query(AuditEntry).order_by(AuditEntry.id.desc()).first()
+            prev_hash = last_entry.hash if last_entry else "0" * 64
+
+            entries = []
+            for action, details in events:
                 # Serialize details
                 details_json = json.dumps(details, sort_keys=True)
 
@@ -60,14 +93,17 @@ class AuditService(BaseService):
                 payload = f"{timestamp.isoformat()}{action}{details_json}{prev_hash}"
                 entry_hash = hashlib.sha256(payload.encode()).hexdigest()
 
-                entry = AuditEntry(
-                    timestamp=timestamp, action=action, details=details_json, previous_hash=prev_hash, hash=entry_hash
+                entries.append(
+                    AuditEntry(
+                        timestamp=timestamp,
+                        action=action,
+                        details=details_json,
+                        previous_hash=prev_hash,
+                        hash=entry_hash,
+                    )
                 )
-                session.add(entry)
-        except Exception as e:
-            if isinstance(e, DatabaseException):
-                raise
-            raise DatabaseException(f"Failed to write audit entry for action '{action}': {e}") from e
+                prev_hash = entry_hash
+            session.add_all(entries)
 
     def get_entries(self, limit: int = 100) -> List[Dict[str, Any]]:
         """Retrieve recent audit log entries."""
@@ -187,3 +223,46 @@ class AuditService(BaseService):
             raise DatabaseException(f"Failed to verify cryptographic chain integrity: {e}") from e
 
         return len(errors) == 0, errors
+
+
+class AuditBatch:
+    """Context manager buffering audit entries for a single ``log_many`` write.
+
+    Entries are flushed when the block exits, including when it exits with an
+    exception, so events that happened before a failure are still recorded.
+    """
+
+    def __init__(self, audit: AuditService):
+        self.audit = audit
+        self.events: List[Tuple[str, Dict[str, Any]]] = []
+
+    def log(self, action: str, details: Dict[str, Any]) -> None:
+        """Queue an entry; same signature as ``AuditService.log``."""
+        self.events.append((action, details))
+
+    def flush(self) -> int:
+        """Write queued entries now and clear the buffer."""
+        written = self.audit.log_many(self.events)
+        self.events = []
+        return written
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def __enter__(self) -> "AuditBatch":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        if exc_type is None:
+            self.flush()
+            return
+        try:
+            self.flush()
+        except Exception as e:
+            # Never mask the original failure with an audit write error
+            logger.error(f"Failed to flush {len(self.events)} buffered audit entries: {e}")
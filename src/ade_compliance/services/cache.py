@@ -0,0 +1,187 @@
+# implements: FR-006, FR-026
+# traces_to: Π.3.1
+
+"""Persistent content-addressed result cache for compliance engines.
+
+Stores per-file engine results (violations and trace links) in a SQLite file under
+``.ade_compliance/cache`` so that ``Orchestrator.run`` only dispatches changed files
+to engines and replays cached results for everything else across invocations.
+
+Entries are keyed by a SHA-256 over the engine fingerprint (identity, version and
+effective configuration), the normalized file path, the file content hash and any
+engine-specific dependency material (e.g. the mapped test file for ``TestEngine``).
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..config import Config
+from ..observability.metrics import result_cache_hits_total, result_cache_misses_total
+
+# Bump to invalidate every cached entry when the payload layout changes
+CACHE_SCHEMA_VERSION = "1"
+
+CACHE_DB_NAME = "results.sqlite"
+
+# SQLite caps host parameters per statement (999 on older builds)
+_QUERY_CHUNK = 500
+
+
+class ResultCache:
+    """On-disk store of per-file engine results keyed by content hash.
+
+    Hit/miss counters are kept per engine for the current process, exported as
+    Prometheus counters, and accumulated in the cache database by ``flush_stats``.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.db_path = self.root / CACHE_DB_NAME
+        self.hits: Dict[str, int] = {}
+        self.misses: Dict[str, int] = {}
+        self._touched: List[str] = []
+        self.root.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, engine TEXT NOT NULL, file_path TEXT NOT NULL, "
+                "payload TEXT NOT NULL, created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_results_engine_file ON results (engine, file_path)")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS stats ("
+                "engine TEXT PRIMARY KEY, hits INTEGER NOT NULL DEFAULT 0, misses INTEGER NOT NULL DEFAULT 0)"
+            )
+
+    @classmethod
+    def from_config(cls, config: Config) -> Optional["ResultCache"]:
+        """Build the cache configured in ``global_settings``, or None when caching is disabled."""
+        if not config.global_settings.cache_enabled:
+            return None
+        return cls(Path(config.global_settings.cache_path))
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), timeout=30.0)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @staticmethod
+    def make_key(engine_fingerprint: str, file_path: str, content_hash: str, extra: str = "") -> str:
+        """Derive the content-addressed cache key for one engine/file combination."""
+        material = "\0".join((CACHE_SCHEMA_VERSION, engine_fingerprint, file_path, content_hash, extra))
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch cached payloads for the given keys in bulk. Missing keys are omitted."""
+        keys = list(keys)
+        found: Dict[str, Dict[str, Any]] = {}
+        if not keys:
+            return found
+        with closing(self._connect()) as conn:
+            for i in range(0, len(keys), _QUERY_CHUNK):
+                chunk = keys[i : i + _QUERY_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(f"SELECT key, payload FROM results WHERE key IN ({placeholders})", chunk)
+                for key, payload in rows:
+                    found[key] = json.loads(payload)
+        self._touched.extend(found)
+        return found
+
+    def put_many(self, entries: Iterable[Tuple[str, str, str, Dict[str, Any]]]) -> None:
+        """Store ``(key, engine, file_path, payload)`` entries in one transaction.
+
+        Older entries for the same engine and file are replaced so the cache holds at
+        most one result per file and engine.
+        """
+        entries = list(entries)
+        if not entries:
+            return
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "DELETE FROM results WHERE engine = ? AND file_path = ?",
+                [(engine, file_path) for _, engine, file_path, _ in entries],
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO results (key, engine, file_path, payload, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (key, engine, file_path, json.dumps(payload, sort_keys=True), now, now)
+                    for key, engine, file_path, payload in entries
+                ],
+            )
+
+    def record(self, engine: str, hits: int = 0, misses: int = 0) -> None:
+        """Count cache hits and misses for an engine."""
+        if hits:
+            self.hits[engine] = self.hits.get(engine, 0) + hits
+            result_cache_hits_total.labels(engine=engine).inc(hits)
+        if misses:
+            self.misses[engine] = self.misses.get(engine, 0) + misses
+            result_cache_misses_total.labels(engine=engine).inc(misses)
+
+    def flush_stats(self) -> None:
+        """Persist accumulated counters and access times, then reset the in-process counters."""
+        engines = set(self.hits) | set(self.misses)
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            for engine in engines:
+                conn.execute(
+                    "INSERT INTO stats (engine, hits, misses) VALUES (?, ?, ?) "
+                    "ON CONFLICT(engine) DO UPDATE SET hits = hits + excluded.hits, misses = misses + excluded.misses",
+                    (engine, self.hits.get(engine, 0), self.misses.get(engine, 0)),
+                )
+            for i in range(0, len(self._touched), _QUERY_CHUNK):
+                chunk = self._touched[i : i + _QUERY_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                conn.execute(f"UPDATE results SET accessed_at = ? WHERE key IN ({placeholders})", [now, *chunk])
+        self.hits.clear()
+        self.misses.clear()
+        self._touched.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Summarize cache size and cumulative hit/miss counters per engine."""
+        with closing(self._connect()) as conn:
+            entries = dict(conn.execute("SELECT engine, COUNT(*) FROM results GROUP BY engine").fetchall())
+            counters = {engine: (hits, misses) for engine, hits, misses in conn.execute("SELECT * FROM stats")}
+
+        engines = {}
+        for engine in sorted(set(entries) | set(counters)):
+            hits, misses = counters.get(engine, (0, 0))
+            lookups = hits + misses
+            engines[engine] = {
+                "entries": entries.get(engine, 0),
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            }
+
+        size = sum(p.stat().st_size for p in self.root.glob(f"{CACHE_DB_NAME}*") if p.is_file())
+        return {
+            "path": str(self.db_path),
+            "entries": sum(entries.values()),
+            "size_bytes": size,
+            "engines": engines,
+        }
+
+    def prune(self, older_than_days: Optional[float] = None) -> int:
+        """Delete entries not accessed within ``older_than_days`` (all entries if None).
+
+        Returns the number of deleted entries.
+        """
+        with closing(self._connect()) as conn:
+            with conn:
+                if older_than_days is None:
+                    deleted = conn.execute("DELETE FROM results").rowcount
+                    conn.execute("DELETE FROM stats")
+                else:
+                    cutoff = time.time() - older_than_days * 86400
+                    deleted = conn.execute("DELETE FROM results WHERE accessed_at < ?", (cutoff,)).rowcount
+            conn.execute("VACUUM")
+        return deleted
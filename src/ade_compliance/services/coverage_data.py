@@ -0,0 +1,232 @@
+# implements: FR-002
+# traces_to: Π.2.1
+
+"""Per-file line coverage read from coverage.py data or Cobertura XML.
+
+Two inputs are supported:
+
+- ``.coverage``: coverage.py's SQLite data file. Statement counts need source
+  analysis, so this goes through the (optional) ``coverage`` package.
+- ``coverage.xml`` (Cobertura): parsed with ``iterparse`` one ``<class>`` at a
+  time, clearing each element once counted, so memory stays flat however large the
+  report is.
+
+The result is a ``CoverageSummary`` of ``(covered, total)`` line counts per
+project-relative path. Summaries are keyed by the SHA-256 of the data file, memoized
+per process (with the file's size and mtime guarding re-hashing) and, when a cache
+directory is given, persisted as small JSON files so later runs skip parsing.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Iterator, NamedTuple, Optional, Tuple
+from xml.etree.ElementTree import iterparse
+
+from ..utils.path import normalize_project_path
+
+# Default data files, in lookup order, when none is configured
+DEFAULT_DATA_FILES = (".coverage", "coverage.xml")
+
+# Bump when the summary format or the counting rules change
+SUMMARY_VERSION = 1
+
+HASH_CHUNK = 1 << 20
+
+
+class FileCoverage(NamedTuple):
+    covered: int
+    total: int
+
+    @property
+    def percent(self) -> float:
+        return 100.0 * self.covered / self.total if self.total else 100.0
+
+
+class CoverageSummary(NamedTuple):
+    digest: str
+    files: Dict[str, FileCoverage]
+
+
+def find_data_file(configured: Optional[str] = None) -> Optional[Path]:
+    """The coverage data file to read: the configured one, else the first default present."""
+    candidates = (configured,) if configured else DEFAULT_DATA_FILES
+    for candidate in candidates:
+        path = Path(candidate)
+        if path.is_file():
+            return path
+    return None
+
+
+def file_digest(path: Path) -> str:
+    """SHA-256 of a (possibly very large) file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def iter_cobertura(path: Path) -> Iterator[Tuple[str, Dict[int, bool]]]:
+    """Yield ``(filename, {line number: hit})`` per ``<class>`` of a Cobertura report.
+
+    Filenames are resolved against the report's ``<source>`` roots. Only the class's
+    own ``<lines>`` are counted (method line lists repeat them).
+    """
+    sources = []
+    for _, elem in iterparse(path, events=("end",)):
+        tag = _local_name(elem.tag)
+        if tag == "source":
+            if elem.text and elem.text.strip():
+                sources.append(elem.text.strip())
+        elif tag == "class":
+            filename = elem.get("filename")
+            lines: Dict[int, bool] = {}
+            for child in elem:
+                if _local_name(child.tag) != "lines":
+                    continue
+                for line in child:
+                    try:
+                        lines[int(line.get("number"))] = int(line.get("hits", "0")) > 0
+                    except (TypeError, ValueError):
+                        continue
+            if filename:
+                yield _resolve_source(filename, sources), lines
+            elem.clear()
+        elif tag in ("package", "classes", "packages"):
+            # Drop the (already cleared) children so the tree does not grow
+            elem.clear()
+
+
+def _resolve_source(filename: str, sources) -> str:
+    filename = filename.replace("\\", "/")
+    if os.path.isabs(filename) or not sources:
+        return normalize_project_path(filename)
+    for root in sources:
+        candidate = os.path.join(root, filename)
+        if len(sources) == 1 or os.path.exists(candidate):
+            return normalize_project_path(candidate)
+    return normalize_project_path(filename)
+
+
+def parse_cobertura(path: Path) -> Dict[str, FileCoverage]:
+    """Line coverage per file from a Cobertura XML report (classes of one file are merged)."""
+    merged: Dict[str, Dict[int, bool]] = {}
+    for filename, lines in iter_cobertura(path):
+        known = merged.setdefault(filename, {})
+        for number, hit in lines.items():
+            known[number] = known.get(number, False) or hit
+    return {name: FileCoverage(sum(lines.values()), len(lines)) for name, lines in merged.items()}
+
+
+def parse_coverage_db(path: Path) -> Dict[str, FileCoverage]:
+    """Line coverage per file from a coverage.py ``.coverage`` SQLite data file.
+
+    Needs the ``coverage`` package to count statements; files whose source is gone
+    are skipped.
+    """
+    try:
+        import coverage
+    except ImportError as e:
+        raise RuntimeError(
+            "Reading .coverage data requires the coverage package "
+            "(pip install 'ade-compliance[coverage]'), or point data_file at a Cobertura coverage.xml"
+        ) from e
+
+    cov = coverage.Coverage(data_file=str(path), config_file=False)
+    cov.load()
+    files: Dict[str, FileCoverage] = {}
+    for measured in cov.get_data().measured_files():
+        try:
+            _, statements, _, missing, _ = cov.analysis2(measured)
+        except Exception:
+            continue
+        files[normalize_project_path(measured)] = FileCoverage(len(statements) - len(missing), len(statements))
+    return files
+
+
+def parse_data_file(path: Path) -> Dict[str, FileCoverage]:
+    if path.suffix.lower() == ".xml":
+        return parse_cobertura(path)
+    return parse_coverage_db(path)
+
+
+class CoverageStore:
+    """Coverage summaries keyed by data-file hash, memoized in memory and optionally on disk."""
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._lock = threading.Lock()
+        # resolved path -> ((size, mtime_ns), digest)
+        self._digests: Dict[str, Tuple[Tuple[int, int], str]] = {}
+        self._summaries: Dict[str, CoverageSummary] = {}
+        self.parses = 0
+
+    def _digest(self, path: Path) -> str:
+        st = path.stat()
+        stamp = (st.st_size, st.st_mtime_ns)
+        key = str(path.resolve())
+        known = self._digests.get(key)
+        if known is not None and known[0] == stamp:
+            return known[1]
+        digest = file_digest(path)
+        self._digests[key] = (stamp, digest)
+        return digest
+
+    def _summary_path(self, digest: str) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / "coverage" / f"{digest}.json"
+
+    def _read_summary(self, digest: str) -> Optional[CoverageSummary]:
+        summary_path = self._summary_path(digest)
+        if summary_path is None or not summary_path.is_file():
+            return None
+        try:
+            payload = json.loads(summary_path.read_text(encoding="utf-8"))
+            if payload.get("version") != SUMMARY_VERSION:
+                return None
+            files = {name: FileCoverage(*counts) for name, counts in payload["files"].items()}
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+        return CoverageSummary(digest, files)
+
+    def _write_summary(self, summary: CoverageSummary) -> None:
+        summary_path = self._summary_path(summary.digest)
+        if summary_path is None:
+            return
+        try:
+            summary_path.parent.mkdir(parents=True, exist_ok=True)
+            payload = {"version": SUMMARY_VERSION, "files": {k: list(v) for k, v in summary.files.items()}}
+            fd, tmp = tempfile.mkstemp(dir=summary_path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f)
+            os.replace(tmp, summary_path)
+            # Only the current data file's summary is ever read back; drop those of older data
+            for stale in summary_path.parent.glob("*.json"):
+                if stale != summary_path:
+                    stale.unlink(missing_ok=True)
+        except OSError:
+            # The summary is only an optimization; the next run parses again
+            pass
+
+    def load(self, path: Path) -> CoverageSummary:
+        """The summary of ``path``, parsing the data file only if no cached summary matches its hash."""
+        with self._lock:
+            digest = self._digest(path)
+            summary = self._summaries.get(digest)
+            if summary is None:
+                summary = self._read_summary(digest)
+                if summary is None:
+                    summary = CoverageSummary(digest, parse_data_file(path))
+                    self.parses += 1
+                    self._write_summary(summary)
+                self._summaries = {digest: summary}
+            return summary
@@ -0,0 +1,157 @@
+# implements: FR-005
+# traces_to: Π.3.1
+
+"""Changed files of the working tree, computed in process.
+
+``ChangeSetProvider`` opens the repository with GitPython (refs, ``HEAD`` and the base
+branch are resolved in process) and lists changes with one batched
+``git diff -z --name-status -M -C --merge-base <base>``: everything committed on the
+branch since it left the base branch plus uncommitted edits, with rename and copy
+records kept intact. Untracked files come from ``git ls-files -z --others
+--exclude-standard``. NUL-separated output means paths with spaces, quotes or
+non-ASCII characters need no unquoting.
+
+Every request recomputes the change set: no cheap key reflects new untracked files
+or unstaged edits to tracked files, so callers ask once per run. Providers are shared
+per work tree (``change_set_provider``), so the repository is opened only once.
+"""
+
+import threading
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import git
+
+from ..utils.path import normalize_project_path
+
+# Branches diffed against, in order; the first that resolves wins
+DEFAULT_BASES = ("origin/main", "main")
+
+
+class FileChange(NamedTuple):
+    # Single-letter status: A, C, D, M, R, T, U or "?" for untracked
+    status: str
+    path: str
+    # Source path of a rename or copy
+    old_path: Optional[str] = None
+
+
+class ChangeSet(NamedTuple):
+    head: Optional[str]
+    base: Optional[str]
+    changes: Tuple[FileChange, ...]
+
+    @property
+    def paths(self) -> List[str]:
+        """Changed paths (destinations of renames and copies), in git's order."""
+        seen: Dict[str, None] = {}
+        for change in self.changes:
+            seen.setdefault(change.path, None)
+        return list(seen)
+
+
+def parse_name_status(output: str) -> List[FileChange]:
+    """Parse ``git diff -z --name-status`` output.
+
+    Records are ``status NUL path NUL``, or ``R<score>/C<score> NUL old NUL new NUL``
+    for renames and copies.
+    """
+    tokens = output.split("\0")
+    changes = []
+    i = 0
+    while i < len(tokens):
+        status = tokens[i].strip()
+        i += 1
+        if not status:
+            continue
+        kind = status[0]
+        if kind in ("R", "C"):
+            if i + 1 >= len(tokens):
+                break
+            changes.append(FileChange(kind, tokens[i + 1], tokens[i]))
+            i += 2
+        else:
+            if i >= len(tokens):
+                break
+            changes.append(FileChange(kind, tokens[i]))
+            i += 1
+    return changes
+
+
+class ChangeSetProvider:
+    """Change set of one git work tree."""
+
+    def __init__(self, repo: git.Repo, bases: Sequence[str] = DEFAULT_BASES):
+        self.repo = repo
+        self.bases = tuple(bases)
+        self.root = Path(repo.working_tree_dir)
+        self._lock = threading.Lock()
+        self.computations = 0
+
+    @classmethod
+    def open(cls, path: str = ".", bases: Sequence[str] = DEFAULT_BASES) -> Optional["ChangeSetProvider"]:
+        """Provider for the work tree containing ``path``, or None outside a (non-bare) repository."""
+        try:
+            repo = git.Repo(path, search_parent_directories=True)
+        except (git.InvalidGitRepositoryError, git.NoSuchPathError):
+            return None
+        if repo.bare or not repo.working_tree_dir:
+            return None
+        return cls(repo, bases)
+
+    def _head(self) -> Optional[str]:
+        try:
+            return self.repo.head.commit.hexsha
+        except ValueError:
+            # Unborn branch: no commit yet
+            return None
+
+    def _base(self) -> Optional[str]:
+        for base in self.bases:
+            try:
+                return self.repo.rev_parse(base).hexsha
+            except (git.BadName, ValueError):
+                continue
+        return None
+
+    def change_set(self) -> ChangeSet:
+        """The current change set, including untracked files and unstaged edits."""
+        with self._lock:
+            self.computations += 1
+            return self._compute(self._head(), self._base())
+
+    def _compute(self, head: Optional[str], base: Optional[str]) -> ChangeSet:
+        if head is None:
+            # Nothing committed yet: everything in the index is new
+            staged = self.repo.git.ls_files("-z").split("\0")
+            changes = [FileChange("A", path) for path in staged if path]
+        else:
+            args = ["-z", "--name-status", "-M", "-C", "--no-color", "--no-ext-diff"]
+            try:
+                output = self.repo.git.diff(*args, "--merge-base", base) if base else None
+            except git.GitCommandError:
+                # Unrelated histories: no merge base to diff from
+                output = None
+            if output is None:
+                output = self.repo.git.diff(*args, head)
+            changes = parse_name_status(output)
+        untracked = self.repo.git.ls_files("-z", "--others", "--exclude-standard").split("\0")
+        changes += [FileChange("?", path) for path in untracked if path]
+        return ChangeSet(head, base, tuple(changes))
+
+    def changed_files(self) -> List[str]:
+        """Changed paths relative to the current directory, with forward slashes."""
+        return [normalize_project_path(str(self.root / path)) for path in self.change_set().paths]
+
+
+_PROVIDERS: Dict[str, Optional[ChangeSetProvider]] = {}
+_PROVIDERS_LOCK = threading.Lock()
+
+
+def change_set_provider(path: str = ".") -> Optional[ChangeSetProvider]:
+    """The shared provider for the work tree containing ``path`` (None outside git)."""
+    key = str(Path(path).resolve())
+    with _PROVIDERS_LOCK:
+        if key not in _PROVIDERS:
+            _PROVIDERS[key] = ChangeSetProvider.open(key)
+        return _PROVIDERS[key]
@@ -4,27 +4,69 @@
 """Compliance Orchestrator Coordinating Verification Engines."""
 
 import asyncio
+import contextlib
+import time
 from pathlib import Path
-from typing import List
+from typing import AsyncGenerator, AsyncIterator, Dict, List, Optional, Tuple
 
 from ..config import Config
-from ..engines.spec_engine import SpecEngine
+from ..engines.base import BaseEngine
+from ..engines.spec_engine import SpecEngine, SpecPresenceEngine
 from ..engines.test_engine import TestEngine
 from ..engines.trace_engine import TraceEngine
-from ..models.report import ComplianceReport
+from ..models.axiom import Violation, ViolationState
+from ..models.records import LinkRecord
+from ..models.report import ComplianceReport, FileCheckResult
+from ..observability.run_metrics import RunMetrics
 from ..services.audit import AuditService
-from ..utils.path import sanitize_relative_path
+from ..services.cache import ResultCache
+from ..services.parallel import EnginePool, FileOutcome, evaluate_sources
+from ..services.spec_index import SpecIndex
+from ..services.trace_index import TraceIndex
+from ..utils.locks import RepositoryLock
+from ..utils.parse_cache import ParseCache
+from ..utils.path import is_inside_base, normalize_project_path
+from ..utils.source import SourceCache, SourceFile
+
+# Streaming batch sizes: small first batch for fast first results, doubling up to the cap
+STREAM_FIRST_BATCH = 8
+STREAM_MAX_BATCH = 256
 
 
 class Orchestrator:
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, global_engines: bool = True):
+        """Set up the enabled engines.
+
+        ``global_engines=False`` drops repository-wide engines (those that are not
+        per-file cacheable, e.g. SpecPresenceEngine and ADREngine); sharded runs use it
+        so these run on exactly one shard.
+        """
         self.config = config
         self.audit = AuditService(config)
+        try:
+            self.cache = ResultCache.from_config(config)
+        except Exception as e:
+            # A broken cache must never block compliance checks; fall back to full evaluation
+            self.cache = None
+            self.audit.log("RESULT_CACHE_UNAVAILABLE", {"error": str(e)})
+        try:
+            self.trace_index = TraceIndex.from_config(config)
+        except Exception as e:
+            self.trace_index = None
+            self.audit.log("TRACE_INDEX_UNAVAILABLE", {"error": str(e)})
+
+        # Parse trees shared by all engines, kept across runs of this orchestrator until the budget is hit
+        self.parse_cache = ParseCache.from_config(config)
+
+        # Long-lived worker pool supplied by the caller (e.g. watch mode); otherwise one per run
+        self.pool: Optional[EnginePool] = None
 
         # Initialize engines
         self.engines = []
         if self.config.engines.spec.enabled:
-            self.engines.append(SpecEngine(self.config.engines.spec))
+            spec_index = SpecIndex.from_config(config)
+            self.engines.append(SpecPresenceEngine(self.config.engines.spec, spec_index))
+            self.engines.append(SpecEngine(self.config.engines.spec, spec_index))
         if self.config.engines.test.enabled:
             self.engines.append(TestEngine(self.config.engines.test))
         if self.config.engines.trace.enabled:
@@ -43,88 +85,229 @@ class Orchestrator:
 
             self.engines.append(ForbiddenAPIEngine(self.config.engines.forbidden_api))
 
+        coverage_config = self.config.engines.coverage
+        if coverage_config.enabled:
+            from ..engines.coverage_engine import CoverageEngine
+
+            if coverage_config.min_coverage is None:
+                # The test gate (e.g. `test: min_coverage: 80`) applies unless coverage sets its own
+                coverage_config = coverage_config.model_copy(
+                    update={"min_coverage": self.config.engines.test.min_coverage}
+                )
+            settings = self.config.global_settings
+            cache_dir = settings.cache_path if settings.cache_enabled else None
+            self.engines.append(CoverageEngine(coverage_config, cache_dir))
+
+        if not global_engines:
+            self.engines = [engine for engine in self.engines if engine.cacheable]
+
     async def run(self, files: List[str]) -> ComplianceReport:
+        """Check files and return the aggregate report once every engine has finished."""
+        metrics = RunMetrics()
+        by_engine: Dict[str, List[Violation]] = {engine.name: [] for engine in self.engines}
+        all_links: List[LinkRecord] = []
+        async for _, engine_violations, links in self.iter_results(files, metrics):
+            for name, violations in engine_violations.items():
+                by_engine[name].extend(violations)
+            all_links.extend(links)
+
+        # Report violations grouped by engine, in file order within each engine
+        all_violations = [v for violations in by_engine.values() for v in violations]
+
+        traceability_matrix = {}
+        if self.trace_engine:
+            traceability_matrix = self.trace_engine.generate_matrix(all_links)
+
+        # Create Report
+        report = ComplianceReport(
+            repo_root=".",
+            check_duration_ms=int(metrics.duration_seconds * 1000),
+            checks_run=metrics.checks_run(),
+            violations=all_violations,
+            traceability_matrix=traceability_matrix,
+            metrics=metrics.summary(),
+        )
+        return report
+
+    async def stream(self, files: List[str]) -> AsyncIterator[FileCheckResult]:
+        """Check files, yielding each file's result as soon as all per-file engines finish it.
+
+        Files are processed in batches that start small (so the first results arrive
+        quickly) and grow up to ``STREAM_MAX_BATCH``. Findings of repository-wide engines
+        are yielded when those engines complete. Overrides, auditing and escalation are
+        applied exactly as in ``run``.
+        """
+        # Closing this stream early closes the driver too, so its audit batch is flushed now
+        async with contextlib.aclosing(self.iter_results(files)) as results:
+            async for result, _, links in results:
+                # Trace links become pydantic models only at this API boundary
+                result.trace_links = [link.to_model() for link in links]
+                yield result
+
+    async def iter_results(
+        self, files: List[str], metrics: Optional[RunMetrics] = None, global_files: Optional[List[str]] = None
+    ) -> AsyncGenerator[Tuple[FileCheckResult, Dict[str, List[Violation]], List[LinkRecord]], None]:
+        """Shared driver for ``run`` and ``stream``; also yields violations keyed by engine.
+
+        Trace links are yielded separately as compact ``LinkRecord`` tuples and are not
+        set on the ``FileCheckResult``. Per-file engines check ``files``; repository-wide
+        engines check ``global_files`` (default ``files``), so an incremental caller can
+        re-check a few files while those engines still see the whole file set.
+
+        Timing, throughput and cache figures are accumulated into ``metrics`` and
+        published to Prometheus when the run completes.
+        """
+        metrics = metrics if metrics is not None else RunMetrics()
+        global_files = files if global_files is None else global_files
+        run_start = time.perf_counter()
         # Check for expiring overrides automatically (FR-021)
-        try:
-            from ..services.override import OverrideService
+        from ..services.override import OverrideService
 
+        try:
             override_service = OverrideService(self.config)
             override_service.check_expiring_overrides()
         except Exception as exc:
             self.audit.log("OVERRIDE_EXPIRY_CHECK_FAILED", {"error": str(exc), "stage": "pre-run-expiry-check"})
 
-        all_violations = []
-
         # Log start
         self.audit.log("RUN_START", {"files_count": len(files)})
 
-        # Acquire cross-platform file-system locks per-file to serialize concurrent checks (FR-030)
-        from contextlib import ExitStack
+        # Resolve active overrides once for the whole run
+        override_service = OverrideService(self.config)
+        override_index = override_service.get_override_index()
+        active_violations: List[Violation] = []
+        # VIOLATION_DETECTED entries are written in one audit transaction per batch
+        audit_batch = self.audit.batch()
 
-        from ..utils.path import file_system_lock
+        def finalize(result: FileCheckResult) -> FileCheckResult:
+            override_service.apply_overrides(result.violations, index=override_index)
+            active_violations.extend(v for v in result.violations if v.state != ViolationState.OVERRIDDEN)
+            for v in result.violations:
+                audit_batch.log(
+                    "VIOLATION_DETECTED",
+                    {
+                        "axiom_id": v.axiom_id,
+                        "severity": v.severity.value if hasattr(v.severity, "value") else str(v.severity),
+                        "file_path": v.file_path,
+                    },
+                )
+            return result
 
-        locked_files = []
-        with ExitStack() as stack:
-            for f in files:
-                try:
-                    # standard file locking on file path
-                    lock_ctx = file_system_lock(f)
-                    acquired = stack.enter_context(lock_ctx)
-                    if acquired:
-                        locked_files.append(f)
-                except Exception as e:
-                    self.audit.log("FILE_LOCK_ACQUIRE_FAILED", {"file_path": f, "error": str(e)})
+        per_file_engines = [engine for engine in self.engines if engine.cacheable]
+        global_engines = [engine for engine in self.engines if not engine.cacheable and engine.should_run()]
 
-            # Run engines concurrently within locked boundary
-            tasks = [engine.check(files) for engine in self.engines]
-            results = await asyncio.gather(*tasks)
+        # Serialize concurrent checks over the same files with one repository-scoped lock (FR-030)
+        async with contextlib.AsyncExitStack() as stack:
+            # Flushes queued entries however the run ends (engine error, consumer closing the stream)
+            stack.enter_context(audit_batch)
+            try:
+                await stack.enter_async_context(RepositoryLock.from_config(self.config).acquire_async(files))
+            except Exception as e:
+                self.audit.log("FILE_LOCK_ACQUIRE_FAILED", {"files_count": len(files), "error": str(e)})
 
-        for violations in results:
-            all_violations.extend(violations)
+            # Read every file at most once and share the snapshots with all engines
+            source_cache = SourceCache()
+            parse_stats = (self.parse_cache.hits, self.parse_cache.misses, self.parse_cache.evictions)
+            for engine in self.engines:
+                engine.source_cache = source_cache
+                engine.parse_cache = self.parse_cache
+                engine.begin_run()
+            for engine in self.engines:
+                if engine.should_run():
+                    metrics.engine(engine.name)
 
-        # Apply active overrides to violations
-        from ..services.override import OverrideService
+            # Repository-wide engines run alongside the per-file batches
+            global_tasks = {
+                asyncio.ensure_future(self._check_global(engine, global_files)): engine for engine in global_engines
+            }
 
-        override_service = OverrideService(self.config)
-        for v in all_violations:
-            if override_service.is_override_active(v.axiom_id, v.file_path):
-                v.override()
+            def cancel_global_tasks() -> None:
+                for task in global_tasks:
+                    task.cancel()
 
-        # Extract traceability links from all files to compile matrix
-        traceability_matrix = {}
-        if self.trace_engine:
-            all_links = []
-            base_dir = Path(".").resolve()
-            for file_path in files:
-                try:
-                    path = sanitize_relative_path(base_dir, file_path)
-                    if not path:
-                        continue
-
-                    if path.exists() and path.suffix.lower() in (".py", ".js", ".ts", ".tsx", ".java"):
-                        with open(path, "r", encoding="utf-8") as f:
-                            content = f.read()
-                        links = self.trace_engine.extract_links(file_path, content)
-                        all_links.extend(links)
-                except Exception:
-                    pass
-            traceability_matrix = self.trace_engine.generate_matrix(all_links)
+            stack.callback(cancel_global_tasks)
 
-        # Count only active, non-overridden violations for failures calculation (Π.5.3)
-        from ..models.axiom import ViolationState
+            # Per-file work is fanned out to worker processes when configured
+            pool = self.pool
+            if pool is None:
+                pool = EnginePool.from_config(self.config, self.engines)
+                if pool:
+                    stack.callback(pool.shutdown)
+            if pool:
+                pool.begin_run()
 
-        active_violations = [v for v in all_violations if v.state != ViolationState.OVERRIDDEN]
+            pos = 0
+            batch_size = STREAM_FIRST_BATCH
+            while pos < len(files) or global_tasks:
+                batch = files[pos : pos + batch_size]
+                pos += len(batch)
+                batch_size = min(batch_size * 2, STREAM_MAX_BATCH)
 
-        # Log findings
-        for v in all_violations:
-            self.audit.log(
-                "VIOLATION_DETECTED",
-                {
-                    "axiom_id": v.axiom_id,
-                    "severity": v.severity.value if hasattr(v.severity, "value") else str(v.severity),
-                    "file_path": v.file_path,
-                },
-            )
+                if batch:
+                    sources = source_cache.load_many(batch)
+                    # Run engines concurrently within locked boundary, replaying cached per-file results
+                    outcomes = await asyncio.gather(
+                        *(self._check_engine(e, sources, pool, metrics) for e in per_file_engines)
+                    )
+                    metrics.files_processed += len(sources)
+                    for i, source in enumerate(sources):
+                        result = FileCheckResult(file_path=source.path)
+                        engine_violations: Dict[str, List[Violation]] = {}
+                        links: List[LinkRecord] = []
+                        for engine, engine_outcomes in zip(per_file_engines, outcomes, strict=True):
+                            if engine_outcomes is None:
+                                continue
+                            outcome = engine_outcomes[i]
+                            engine_violations[engine.name] = outcome.violations
+                            result.violations.extend(outcome.violations)
+                            if outcome.links:
+                                links.extend(outcome.links)
+                            result.timings_ms[engine.name] = round(outcome.seconds * 1000, 3)
+                            metrics.record_file(
+                                engine.name,
+                                source.norm_path,
+                                outcome.seconds,
+                                outcome.cpu_seconds,
+                                len(outcome.violations),
+                            )
+                        yield finalize(result), engine_violations, links
+                else:
+                    await asyncio.wait(global_tasks, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in [task for task in global_tasks if task.done()]:
+                    engine = global_tasks.pop(task)
+                    violations, seconds, cpu_seconds = task.result()
+                    metrics.record_engine(engine.name, seconds, cpu_seconds)
+                    metrics.engine(engine.name).violations += len(violations)
+                    grouped: Dict[str, List[Violation]] = {}
+                    for v in violations:
+                        grouped.setdefault(v.file_path, []).append(v)
+                    for file_path, file_violations in grouped.items():
+                        result = FileCheckResult(
+                            file_path=file_path,
+                            violations=file_violations,
+                            timings_ms={engine.name: round(seconds * 1000, 3)},
+                        )
+                        yield finalize(result), {engine.name: file_violations}, []
+
+                audit_batch.flush()
+
+        metrics.bytes_read = source_cache.bytes_read
+        for name, before, after in zip(
+            ("hits", "misses", "evictions"),
+            parse_stats,
+            (self.parse_cache.hits, self.parse_cache.misses, self.parse_cache.evictions),
+            strict=True,
+        ):
+            metrics.parses[name] = after - before
+        metrics.duration_seconds = time.perf_counter() - run_start
+        metrics.publish()
+
+        if self.cache:
+            try:
+                self.cache.flush_stats()
+            except Exception as e:
+                self.audit.log("RESULT_CACHE_STATS_FAILED", {"error": str(e)})
         self.audit.log("RUN_COMPLETE", {"violations_count": len(active_violations)})
 
         # Check consecutive failures (Π.5.3) using active violations
@@ -146,10 +329,174 @@ class Orchestrator:
             except Exception:
                 pass
 
-        # Create Report
-        report = ComplianceReport(
-            repo_root=".",
-            violations=all_violations,
-            traceability_matrix=traceability_matrix,
-        )
-        return report
+    async def _check_global(self, engine: BaseEngine, files: List[str]) -> Tuple[List[Violation], float, float]:
+        """Run a repository-wide engine once over the whole file set; returns wall and CPU seconds too."""
+        start, cpu_start = time.perf_counter(), time.process_time()
+        if type(engine).check_sources is BaseEngine.check_sources:
+            # Legacy engines only need paths; skip loading file contents for them
+            violations = await engine.check(list(files))
+        else:
+            violations = await engine.check_sources(engine.source_cache.load_many(files))
+        return violations, time.perf_counter() - start, time.process_time() - cpu_start
+
+    def _backfill_trace_index(
+        self, engine: TraceEngine, sources: List[SourceFile], outcomes: Dict[str, FileOutcome]
+    ) -> None:
+        """Store the cached links of result-cache hits the trace index lacks (e.g. it was deleted)."""
+        fingerprint = engine.fingerprint()
+        digests = {s.norm_path: s.digest for s in sources}
+        try:
+            current = self.trace_index.current(digests.items(), fingerprint)
+            entries = [
+                (s.norm_path, s.digest, outcomes[s.path].links or []) for s in sources if s.norm_path not in current
+            ]
+            self.trace_index.update(entries, fingerprint)
+        except Exception as e:
+            self.audit.log("TRACE_INDEX_WRITE_FAILED", {"error": str(e)})
+
+    async def _replay_trace_index(
+        self, engine: TraceEngine, sources: List[SourceFile]
+    ) -> Tuple[List[FileOutcome], List[SourceFile]]:
+        """Evaluate files whose links are current in the trace index without re-parsing them.
+
+        Indexed links seed the engine's extraction cache, so those files are checked
+        in-process at negligible cost. Returns their outcomes and the sources left to
+        evaluate normally.
+        """
+        try:
+            stored = self.trace_index.lookup(
+                ((s.norm_path, s.digest) for s in sources if s.exists and s.text is not None), engine.fingerprint()
+            )
+        except Exception as e:
+            self.audit.log("TRACE_INDEX_READ_FAILED", {"error": str(e)})
+            return [], sources
+
+        replay, rest = [], []
+        for source in sources:
+            links = stored.get(source.norm_path)
+            if links is None:
+                rest.append(source)
+                continue
+            links = [link._replace(source=source.path) for link in links]
+            engine.remember(source.path, source.digest, links)
+            replay.append(source)
+        return await evaluate_sources(engine, replay), rest
+
+    async def _check_engine(
+        self,
+        engine: BaseEngine,
+        sources: List[SourceFile],
+        pool: Optional[EnginePool] = None,
+        metrics: Optional[RunMetrics] = None,
+    ) -> Optional[List[FileOutcome]]:
+        """Run one per-file engine, dispatching only files whose cached result is missing or stale.
+
+        Cached violations (and trace links for the TraceEngine) are replayed for unchanged
+        files; the remaining files are evaluated in-process or on the worker pool and
+        their results written back to the cache. Returns one outcome per source, in
+        order, or None when the engine is disabled.
+        """
+        if not engine.should_run():
+            return None
+        start = time.perf_counter()
+
+        # Only files inside the repository feed the result cache, the trace index and the matrix
+        base_dir = Path(".").resolve()
+        inside = {s.path for s in sources if s.exists and is_inside_base(base_dir, s.path)}
+
+        keys: Dict[str, str] = {}
+        cached: Dict[str, Dict] = {}
+        if self.cache:
+            fingerprint = engine.fingerprint()
+            for source in sources:
+                if source.path in inside:
+                    extra = engine.cache_key_extra(source.path)
+                    keys[source.path] = self.cache.make_key(fingerprint, source.norm_path, source.digest, extra)
+            try:
+                cached = self.cache.get_many(keys.values())
+            except Exception as e:
+                self.audit.log("RESULT_CACHE_READ_FAILED", {"engine": engine.name, "error": str(e)})
+
+        is_trace = engine is self.trace_engine
+        per_file: Dict[str, FileOutcome] = {}
+        misses: List[SourceFile] = []
+        for source in sources:
+            payload = cached.get(keys.get(source.path, ""))
+            if payload is None:
+                misses.append(source)
+                continue
+            violations = [Violation(**v) for v in payload["violations"]]
+            links = [LinkRecord.create(**link) for link in payload.get("links", [])] if is_trace else None
+            per_file[source.path] = FileOutcome(source.path, violations, links)
+        # Files replayed from the trace index below are still result-cache misses
+        cache_hits, cache_misses = len(sources) - len(misses), len(misses)
+
+        if is_trace and self.trace_index is not None and len(misses) < len(sources):
+            self._backfill_trace_index(engine, [s for s in sources if s.path in per_file], per_file)
+
+        indexed: List[FileOutcome] = []
+        if is_trace and self.trace_index is not None and misses:
+            indexed, rest = await self._replay_trace_index(engine, [s for s in misses if s.path in inside])
+            misses = rest + [s for s in misses if s.path not in inside]
+            for outcome in indexed:
+                per_file[outcome.path] = outcome
+
+        if pool and engine.parallel:
+            outcomes = await pool.evaluate(engine, misses)
+        else:
+            outcomes = await evaluate_sources(engine, misses)
+        if is_trace:
+            outcomes = [o if o.path in inside or not o.links else o._replace(links=[]) for o in outcomes]
+
+        if is_trace and self.trace_index is not None and outcomes:
+            digests = {source.path: (source.norm_path, source.digest) for source in misses if source.path in inside}
+            entries = [(*digests[o.path], o.links or []) for o in outcomes if o.path in digests]
+            try:
+                self.trace_index.update(entries, engine.fingerprint())
+            except Exception as e:
+                self.audit.log("TRACE_INDEX_WRITE_FAILED", {"error": str(e)})
+        if is_trace and self.trace_index is not None:
+            # Reverse queries stay read-only; links of checked files that are gone are dropped here
+            deleted = [s.norm_path for s in sources if not s.exists and is_inside_base(base_dir, s.path)]
+            try:
+                self.trace_index.remove(deleted)
+            except Exception as e:
+                self.audit.log("TRACE_INDEX_WRITE_FAILED", {"error": str(e)})
+        outcomes = indexed + outcomes
+
+        fresh = []
+        for outcome in outcomes:
+            path, violations, links = outcome.path, outcome.violations, outcome.links
+            per_file[path] = outcome
+            key = keys.get(path)
+            if key is None:
+                continue
+            payload = {
+                "violations": [v.model_dump(mode="json", exclude={"timestamp", "resolved_at"}) for v in violations]
+            }
+            if links is not None:
+                payload["links"] = [link._asdict() for link in links]
+            fresh.append((key, engine.name, normalize_project_path(path), payload))
+
+        if self.cache:
+            self.cache.record(engine.name, hits=cache_hits, misses=cache_misses)
+            try:
+                self.cache.put_many(fresh)
+            except Exception as e:
+                self.audit.log("RESULT_CACHE_WRITE_FAILED", {"engine": engine.name, "error": str(e)})
+
+        # Duplicate input paths share one outcome; copy violations so overrides apply per occurrence
+        results = []
+        seen = set()
+        for source in sources:
+            outcome = per_file[source.path]
+            if source.path in seen:
+                outcome = outcome._replace(violations=[v.model_copy() for v in outcome.violations])
+            seen.add(source.path)
+            results.append(outcome)
+
+        if metrics:
+            metrics.record_engine(engine.name, time.perf_counter() - start)
+            if self.cache:
+                metrics.record_cache(engine.name, hits=cache_hits, misses=cache_misses)
+        return results
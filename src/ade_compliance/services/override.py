@@ -8,20 +8,27 @@ audit trail logging, and local SQLite DB storage.
 """
 
 import logging
+import threading
 import uuid
 from datetime import datetime, timedelta, timezone
-from typing import List
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from sqlalchemy import Boolean, Column, DateTime, String
+from sqlalchemy import Boolean, Column, DateTime, String, func
 
 from ..config import Config
 from ..exceptions import CryptoAttestationException, ValidationException
+from ..models.axiom import Violation, ViolationState
 from ..models.decision import Override
 from .base import BaseService
 from .db import Base
+from .override_index import OverrideIndex
 
 logger = logging.getLogger(__name__)
 
+# Process-wide OverrideIndex per database, tagged with the version stamp it was built from
+_INDEX_CACHE: Dict[str, Tuple[tuple, OverrideIndex]] = {}
+_INDEX_LOCK = threading.Lock()
+
 
 class OverrideEntry(Base):
     __tablename__ = "override_log"
@@ -118,6 +125,7 @@ class OverrideService(BaseService):
             session.add(entry)
             # Fetch created_at populated by DB default
             created_at = entry.created_at or datetime.now(timezone.utc).replace(tzinfo=None)
+        self.invalidate_index()
 
         # Log to audit trail
         self.audit.log(
@@ -175,28 +183,67 @@ class OverrideService(BaseService):
                     )
             return active
 
+    def _index_key(self) -> str:
+        return str(self.engine.url)
+
+    def _version_stamp(self) -> tuple:
+        """Cheap aggregate that changes whenever an override is created or revoked."""
+        with self.db_manager.session(self.config) as session:
+            count, last_created, last_revoked = session.query(
+                func.count(OverrideEntry.id),
+                func.max(OverrideEntry.created_at),
+                func.max(OverrideEntry.revoked_at),
+            ).one()
+        return (count, last_created, last_revoked)
+
+    def invalidate_index(self) -> None:
+        """Drop the cached OverrideIndex for this database."""
+        with _INDEX_LOCK:
+            _INDEX_CACHE.pop(self._index_key(), None)
+
+    def get_override_index(self) -> OverrideIndex:
+        """Return an OverrideIndex over the active overrides.
+
+        The index is cached per database and rebuilt only when the override table's
+        version stamp changes (create/revoke, including from other processes) or an
+        indexed override expires.
+        """
+        key = self._index_key()
+        stamp = self._version_stamp()
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        with _INDEX_LOCK:
+            cached = _INDEX_CACHE.get(key)
+        if cached and cached[0] == stamp and cached[1].is_current(now):
+            return cached[1]
+
+        index = OverrideIndex(self.get_active_overrides())
+        with _INDEX_LOCK:
+            _INDEX_CACHE[key] = (stamp, index)
+        return index
+
     def is_override_active(self, axiom_id: str, file_path: str) -> bool:
         """Check if an active override covers this axiom ID and file path."""
-        from ..utils.path import normalize_project_path
-
-        p = normalize_project_path(file_path)
-        active_list = self.get_active_overrides()
-
-        for o in active_list:
-            if o.axiom_id == axiom_id:
-                # Match path against scope
-                sv = o.scope_value.replace("\\", "/").strip("/")
-
-                if o.scope_type == "FILE":
-                    if p == sv:
-                        return True
-                elif o.scope_type == "DIRECTORY":
-                    if p.startswith(sv + "/") or p == sv:
-                        return True
-                elif o.scope_type == "COMPONENT":
-                    if sv in p:
-                        return True
-        return False
+        return self.get_override_index().matches(axiom_id, file_path)
+
+    def apply_overrides(self, violations: Iterable[Violation], index: Optional[OverrideIndex] = None) -> int:
+        """Transition every violation covered by an active override to OVERRIDDEN.
+
+        Resolves the override index once for the whole batch (or uses ``index`` when the
+        caller already holds one). Violations already in a terminal state are left
+        untouched. Returns the number of violations overridden.
+        """
+        if index is None:
+            index = self.get_override_index()
+        overridden = 0
+        if not len(index):
+            return overridden
+        for v in violations:
+            if v.state in (ViolationState.RESOLVED, ViolationState.OVERRIDDEN):
+                continue
+            if index.matches(v.axiom_id, v.file_path):
+                v.override()
+                overridden += 1
+        return overridden
 
     def revoke_override(self, override_id: str) -> bool:
         """Manually revoke a compliance override."""
@@ -207,6 +254,7 @@ class OverrideService(BaseService):
 
             now = datetime.now(timezone.utc).replace(tzinfo=None)
             entry.revoked_at = now
+        self.invalidate_index()
 
         # Log to audit trail
         self.audit.log(
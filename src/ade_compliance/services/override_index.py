@@ -0,0 +1,109 @@
+# implements: FR-021
+# traces_to: Π.3.1
+
+"""In-memory index of active overrides for batch violation matching.
+
+``OverrideIndex`` is built once from the active override set and answers
+"is this (axiom, path) overridden?" without touching the database:
+
+- FILE scopes: hash set of exact normalized paths.
+- DIRECTORY scopes: path-segment trie, matched by walking the violation path.
+- COMPONENT scopes: Aho-Corasick automaton over the substring scopes.
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Set
+
+from ..models.decision import Override
+from ..utils.aho_corasick import AhoCorasick
+from ..utils.path import normalize_project_path
+
+
+class _PathTrie:
+    """Trie over ``/``-separated path segments whose terminal nodes mark directory scopes."""
+
+    _END = "\0"
+
+    def __init__(self) -> None:
+        self._root: Dict[str, dict] = {}
+
+    def add(self, path: str) -> None:
+        node = self._root
+        for segment in path.split("/"):
+            node = node.setdefault(segment, {})
+        node[self._END] = {}
+
+    def covers(self, path: str) -> bool:
+        """True if ``path`` equals a stored directory or lies beneath one."""
+        node = self._root
+        for segment in path.split("/"):
+            node = node.get(segment)
+            if node is None:
+                return False
+            if self._END in node:
+                return True
+        return False
+
+
+class _AxiomScopes:
+    """Override scopes registered for a single axiom."""
+
+    def __init__(self) -> None:
+        self.files: Set[str] = set()
+        self.directories = _PathTrie()
+        self.components: Set[str] = set()
+        self.matcher: Optional[AhoCorasick] = None
+
+    def matches(self, path: str) -> bool:
+        if path in self.files or self.directories.covers(path):
+            return True
+        if "" in self.components:
+            # Legacy empty substring scope matches every path
+            return True
+        return self.matcher is not None and self.matcher.contains_any(path)
+
+
+class OverrideIndex:
+    """Immutable lookup structure over a snapshot of active overrides.
+
+    ``valid_until`` is the earliest expiry among the indexed non-permanent overrides;
+    the snapshot must not be used past that instant.
+    """
+
+    def __init__(self, overrides: Iterable[Override]):
+        self._scopes: Dict[str, _AxiomScopes] = {}
+        self.valid_until: Optional[datetime] = None
+        self.size = 0
+
+        for o in overrides:
+            scopes = self._scopes.setdefault(o.axiom_id, _AxiomScopes())
+            sv = o.scope_value.replace("\\", "/").strip("/")
+            if o.scope_type == "FILE":
+                scopes.files.add(sv)
+            elif o.scope_type == "DIRECTORY":
+                scopes.directories.add(sv)
+            elif o.scope_type == "COMPONENT":
+                scopes.components.add(sv)
+            else:
+                continue
+            self.size += 1
+            if not o.is_permanent and (self.valid_until is None or o.expires_at < self.valid_until):
+                self.valid_until = o.expires_at
+
+        for scopes in self._scopes.values():
+            if scopes.components:
+                scopes.matcher = AhoCorasick(scopes.components)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def is_current(self, now: datetime) -> bool:
+        """Whether no indexed override has expired as of ``now`` (naive UTC)."""
+        return self.valid_until is None or now < self.valid_until
+
+    def matches(self, axiom_id: str, file_path: str) -> bool:
+        """Check if an indexed override covers this axiom ID and file path."""
+        scopes = self._scopes.get(axiom_id)
+        if scopes is None:
+            return False
+        return scopes.matches(normalize_project_path(file_path))
@@ -0,0 +1,148 @@
+# implements: FR-006
+# traces_to: Π.3.1
+
+"""Process-pool execution of per-file compliance engines.
+
+Engine checks are synchronous CPU work (tree-sitter parsing, ``ast.parse``, regex)
+behind ``async def``, so ``asyncio.gather`` alone never uses more than one core.
+``EnginePool`` partitions the files an engine must evaluate into chunks and fans
+them out to a ``ProcessPoolExecutor`` whose workers instantiate every engine once.
+Results are merged back in input order, so parallel runs are deterministic.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Type
+
+from ..config import Config, EngineConfig
+from ..engines.base import BaseEngine
+from ..engines.trace_engine import TraceEngine
+from ..models.axiom import Violation
+from ..models.records import LinkRecord
+from ..utils.parse_cache import DEFAULT_BUDGET_BYTES, ParseCache
+from ..utils.source import SourceCache, SourceFile
+
+
+class FileOutcome(NamedTuple):
+    """Result of one engine on one file; ``links`` are only produced by the TraceEngine."""
+
+    path: str
+    violations: List[Violation]
+    links: Optional[List[LinkRecord]]
+    seconds: float = 0.0
+    cpu_seconds: float = 0.0
+
+
+# Upper bound on files per submitted task, keeping per-task pickling overhead predictable
+MAX_CHUNK_SIZE = 256
+
+# Engines instantiated once per worker process by _init_worker
+_WORKER_ENGINES: Dict[str, BaseEngine] = {}
+# Run each worker engine last began (see EnginePool.begin_run)
+_WORKER_RUNS: Dict[str, int] = {}
+
+
+def resolve_jobs(jobs: int) -> int:
+    """Map the configured job count to a worker count (0 means one per CPU)."""
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+async def evaluate_sources(engine: BaseEngine, sources: Sequence[SourceFile]) -> List[FileOutcome]:
+    """Evaluate an engine file by file so every result can be attributed to its source.
+
+    Trace links are first extracted for all sources concurrently; the time each
+    file's parse took is added to that file's timings.
+    """
+    is_trace = isinstance(engine, TraceEngine)
+    prefetched = engine.prefetch_links(list(sources)) if is_trace else {}
+    outcomes: List[FileOutcome] = []
+    for source in sources:
+        start, cpu_start = time.perf_counter(), time.process_time()
+        violations = await engine.check_sources([source])
+        links = engine.extract_source_links(source) if is_trace else None
+        wall, cpu = time.perf_counter() - start, time.process_time() - cpu_start
+        parse_wall, parse_cpu = prefetched.get(source.path, (0.0, 0.0))
+        outcomes.append(FileOutcome(source.path, violations, links, wall + parse_wall, cpu + parse_cpu))
+    return outcomes
+
+
+def _init_worker(engine_specs: List[Tuple[Type[BaseEngine], EngineConfig]], parse_cache_bytes: int) -> None:
+    _WORKER_ENGINES.clear()
+    _WORKER_RUNS.clear()
+    # One parse cache per worker, shared by its engines like the orchestrator's
+    parse_cache = ParseCache(parse_cache_bytes)
+    for engine_cls, engine_config in engine_specs:
+        engine = engine_cls(engine_config)
+        engine.parse_cache = parse_cache
+        _WORKER_ENGINES[engine.name] = engine
+
+
+def _check_chunk(engine_name: str, run_id: int, sources: List[SourceFile]) -> List[FileOutcome]:
+    engine = _WORKER_ENGINES[engine_name]
+    if _WORKER_RUNS.get(engine_name) != run_id:
+        # First chunk of a run in this worker: related files (e.g. mapped test files)
+        # are then shared by every chunk of the run the worker handles
+        _WORKER_RUNS[engine_name] = run_id
+        engine.source_cache = SourceCache()
+        engine.begin_run()
+    return asyncio.run(evaluate_sources(engine, sources))
+
+
+def chunk_sources(sources: Sequence[SourceFile], workers: int) -> List[List[SourceFile]]:
+    """Split sources into contiguous chunks, roughly four per worker for load balancing."""
+    if not sources:
+        return []
+    size = max(1, min(MAX_CHUNK_SIZE, -(-len(sources) // (workers * 4))))
+    return [list(sources[i : i + size]) for i in range(0, len(sources), size)]
+
+
+class EnginePool:
+    """A process pool whose workers hold one warm instance of each per-file engine."""
+
+    def __init__(self, engines: Sequence[BaseEngine], workers: int, parse_cache_bytes: int = DEFAULT_BUDGET_BYTES):
+        self.workers = workers
+        self.run_id = 0
+        specs = [(type(engine), engine.config) for engine in engines]
+        # spawn keeps workers independent of the parent's threads, event loop and DB connections
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(specs, parse_cache_bytes),
+        )
+
+    @classmethod
+    def from_config(cls, config: Config, engines: Sequence[BaseEngine]) -> Optional["EnginePool"]:
+        """Build a pool when more than one job is configured and there are per-file engines."""
+        workers = resolve_jobs(config.global_settings.jobs)
+        per_file = [engine for engine in engines if engine.cacheable and engine.parallel and engine.should_run()]
+        if workers <= 1 or not per_file:
+            return None
+        return cls(per_file, workers, config.global_settings.parse_cache_mb * 2**20)
+
+    def begin_run(self) -> None:
+        """Start a new run: each worker resets an engine's per-run state on its first chunk of the run."""
+        self.run_id += 1
+
+    async def evaluate(self, engine: BaseEngine, sources: Sequence[SourceFile]) -> List[FileOutcome]:
+        """Evaluate sources for one engine across the pool, preserving input order."""
+        if len(sources) < 2:
+            return await evaluate_sources(engine, sources)
+
+        loop = asyncio.get_running_loop()
+        futures = [
+            loop.run_in_executor(self._executor, _check_chunk, engine.name, self.run_id, chunk)
+            for chunk in chunk_sources(sources, self.workers)
+        ]
+        outcomes: List[FileOutcome] = []
+        for chunk_outcomes in await asyncio.gather(*futures):
+            outcomes.extend(chunk_outcomes)
+        return outcomes
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
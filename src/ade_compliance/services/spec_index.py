@@ -0,0 +1,355 @@
+# implements: FR-001, FR-004
+# traces_to: Π.1.1
+
+"""Persistent index of specification documents and the requirements they define.
+
+Specifications are ``spec.md`` at the repository root and every Markdown file under
+``specs/`` (``specs/<NNN-feature>/spec.md``, ``plan.md``, ...). For each document the
+index keeps its headings and the requirement IDs it defines (``**FR-001**: ...`` list
+items or ``### FR-001 ...`` headings), so requirements can be looked up without
+re-reading Markdown.
+
+The index is stored as JSON (``spec_index.json`` beside the result cache) together
+with the mtime of every directory it covers. ``refresh`` re-lists only directories
+whose mtime changed (a spec was added, removed or renamed) and re-parses only
+documents whose size or mtime changed; an unchanged tree costs one ``stat`` per
+directory and document.
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from ..config import Config
+
+# Bump to discard persisted indexes when the format or the parsing rules change
+SPEC_INDEX_VERSION = 1
+
+SPEC_INDEX_FILE_NAME = "spec_index.json"
+
+ROOT_SPEC = "spec.md"
+SPEC_DIR = "specs"
+
+# FR-001, FR-WP-001
+REQUIREMENT_ID = re.compile(r"\bFR-(?:[A-Z]+-)?\d+\b")
+
+HEADING = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$")
+# A list item or heading that starts with a (possibly bold) requirement ID
+DEFINITION = re.compile(
+    r"^\s*(?:[-*+]\s+|\d+[.)]\s+|#{1,6}\s+)?[*_]*(FR-(?:[A-Z]+-)?\d+)\b[*_]*\s*(?:[:.]|[-–—]\s)\s*(.*)$"
+)
+FENCE = ("```", "~~~")
+
+# Leading sequence number of a feature directory (001-ade-compliance)
+_FEATURE_NUMBER = re.compile(r"^\d+[-_]")
+
+
+class Heading(NamedTuple):
+    level: int
+    text: str
+    line: int
+
+
+class Requirement(NamedTuple):
+    id: str
+    path: str
+    line: int
+    text: str
+
+
+class SpecDocument(NamedTuple):
+    path: str
+    # (size, mtime_ns) the document was parsed at
+    stamp: Tuple[int, int]
+    requirements: Tuple[Requirement, ...]
+    headings: Tuple[Heading, ...]
+
+    @property
+    def feature(self) -> Optional[str]:
+        """The feature directory below ``specs/`` the document belongs to, if any."""
+        parts = self.path.split("/")
+        return parts[1] if len(parts) > 2 and parts[0] == SPEC_DIR else None
+
+
+def parse_spec(path: str, text: str, stamp: Tuple[int, int] = (0, 0)) -> SpecDocument:
+    """Headings and requirement definitions of a Markdown document (fenced code is skipped)."""
+    requirements: List[Requirement] = []
+    headings: List[Heading] = []
+    fence: Optional[str] = None
+    for number, line in enumerate(text.splitlines(), 1):
+        stripped = line.lstrip()
+        if fence:
+            if stripped.startswith(fence):
+                fence = None
+            continue
+        if stripped.startswith(FENCE):
+            fence = stripped[:3]
+            continue
+        heading = HEADING.match(line)
+        if heading:
+            headings.append(Heading(len(heading.group(1)), heading.group(2), number))
+        definition = DEFINITION.match(line)
+        if definition:
+            requirements.append(Requirement(definition.group(1), path, number, definition.group(2).strip(" *_")))
+    return SpecDocument(path, stamp, tuple(requirements), tuple(headings))
+
+
+def _join(directory: str, name: str) -> str:
+    return name if directory == "." else f"{directory}/{name}"
+
+
+def _parent(path: str) -> str:
+    return path.rpartition("/")[0] or "."
+
+
+def _stamp(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def _dir_mtime(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+class SpecIndex:
+    """Specification documents of the working tree, refreshed incrementally and optionally persisted."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else None
+        self._lock = threading.RLock()
+        # directory -> mtime_ns when it was last listed
+        self._dirs: Dict[str, int] = {}
+        self._documents: Dict[str, SpecDocument] = {}
+        self._requirements: Optional[Dict[str, List[Requirement]]] = None
+        self._digest: Optional[str] = None
+        self.parses = 0
+        self._load()
+
+    @classmethod
+    def from_config(cls, config: Config) -> "SpecIndex":
+        """The index for ``config``; kept in memory only when persistent caching is disabled."""
+        settings = config.global_settings
+        return cls(Path(settings.cache_path) / SPEC_INDEX_FILE_NAME if settings.cache_enabled else None)
+
+    def _load(self) -> None:
+        if self.path is None or not self.path.is_file():
+            return
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+            if payload.get("version") != SPEC_INDEX_VERSION:
+                return
+            dirs = {d: int(mtime) for d, mtime in payload["dirs"].items()}
+            documents = {
+                path: SpecDocument(
+                    path,
+                    tuple(doc["stamp"]),
+                    tuple(Requirement(rid, path, line, text) for rid, line, text in doc["requirements"]),
+                    tuple(Heading(*heading) for heading in doc["headings"]),
+                )
+                for path, doc in payload["documents"].items()
+            }
+        except (OSError, ValueError, TypeError, KeyError):
+            # A corrupt index is rebuilt from scratch on the next refresh
+            return
+        self._dirs, self._documents = dirs, documents
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        payload = {
+            "version": SPEC_INDEX_VERSION,
+            "dirs": self._dirs,
+            "documents": {
+                path: {
+                    "stamp": list(doc.stamp),
+                    "requirements": [[r.id, r.line, r.text] for r in doc.requirements],
+                    "headings": [list(h) for h in doc.headings],
+                }
+                for path, doc in self._documents.items()
+            },
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f)
+            os.replace(tmp, self.path)
+        except OSError:
+            # Persistence is only an optimization; the next process rebuilds the index
+            pass
+
+    def refresh(self) -> bool:
+        """Bring the index up to date with the working tree; True if anything changed."""
+        with self._lock:
+            changed = False
+            if not self._dirs:
+                self._scan_dir(".")
+                changed = True
+            else:
+                for directory, mtime in list(self._dirs.items()):
+                    # Entries may disappear while siblings are rescanned
+                    if directory in self._dirs and _dir_mtime(directory) != mtime:
+                        self._scan_dir(directory)
+                        changed = True
+            for path, doc in list(self._documents.items()):
+                stamp = _stamp(path)
+                if stamp is None:
+                    del self._documents[path]
+                    changed = True
+                elif stamp != doc.stamp:
+                    self._parse(path)
+                    changed = True
+            if changed:
+                self._requirements = None
+                self._digest = None
+                self._save()
+            return changed
+
+    def _wanted(self, directory: str, name: str, is_dir: bool) -> bool:
+        if directory == ".":
+            return name == SPEC_DIR if is_dir else name == ROOT_SPEC
+        if name.startswith("."):
+            return False
+        return is_dir or name.lower().endswith(".md")
+
+    def _scan_dir(self, directory: str) -> None:
+        """(Re-)list one directory: pick up new documents and subdirectories, forget vanished ones."""
+        mtime = _dir_mtime(directory)
+        try:
+            entries = list(os.scandir(directory)) if mtime is not None else None
+        except OSError:
+            entries = None
+        if entries is None:
+            self._forget_dir(directory)
+            return
+        self._dirs[directory] = mtime
+
+        documents: Set[str] = set()
+        subdirs: Set[str] = set()
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                continue
+            if self._wanted(directory, entry.name, is_dir):
+                (subdirs if is_dir else documents).add(_join(directory, entry.name))
+
+        for path in [p for p in self._documents if _parent(p) == directory and p not in documents]:
+            del self._documents[path]
+        for path in [d for d in self._dirs if d != directory and _parent(d) == directory and d not in subdirs]:
+            self._forget_dir(path)
+        for path in sorted(documents - self._documents.keys()):
+            self._parse(path)
+        for path in sorted(subdirs - self._dirs.keys()):
+            self._scan_dir(path)
+
+    def _forget_dir(self, directory: str) -> None:
+        prefix = "" if directory == "." else directory + "/"
+        for d in [d for d in self._dirs if d == directory or d.startswith(prefix)]:
+            del self._dirs[d]
+        for path in [p for p in self._documents if p.startswith(prefix)]:
+            del self._documents[path]
+
+    def _parse(self, path: str) -> None:
+        stamp = _stamp(path)
+        try:
+            text = Path(path).read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            self._documents.pop(path, None)
+            return
+        self._documents[path] = parse_spec(path, text, stamp or (0, 0))
+        self.parses += 1
+
+    @property
+    def documents(self) -> Dict[str, SpecDocument]:
+        """Indexed documents by normalized path (as of the last refresh)."""
+        with self._lock:
+            return dict(self._documents)
+
+    def _by_id(self) -> Dict[str, List[Requirement]]:
+        with self._lock:
+            if self._requirements is None:
+                by_id: Dict[str, List[Requirement]] = {}
+                for path in sorted(self._documents):
+                    for requirement in self._documents[path].requirements:
+                        by_id.setdefault(requirement.id, []).append(requirement)
+                self._requirements = by_id
+            return self._requirements
+
+    def digest(self) -> str:
+        """Hash of the indexed documents and the requirements they define (changes when lookups can)."""
+        with self._lock:
+            if self._digest is None:
+                payload = [
+                    [path, [r.id for r in self._documents[path].requirements]] for path in sorted(self._documents)
+                ]
+                self._digest = hashlib.sha256(json.dumps(payload).encode("utf-8")).hexdigest()
+            return self._digest
+
+    def lookup(self, requirement_id: str) -> List[Requirement]:
+        """Every definition of ``requirement_id`` (normally one), ordered by document path."""
+        return list(self._by_id().get(requirement_id.upper(), ()))
+
+    def requirement_ids(self) -> Set[str]:
+        return set(self._by_id())
+
+    def _primary(self, documents: Iterable[str]) -> str:
+        """The document standing for a feature: its ``spec.md`` if present, else the first by path."""
+        documents = sorted(documents)
+        for path in documents:
+            if path.rsplit("/", 1)[-1] == ROOT_SPEC:
+                return path
+        return documents[0]
+
+    def governing_spec(self, file_path: str, requirement_ids: Iterable[str] = ()) -> Optional[str]:
+        """The specification that governs ``file_path``, or None if none can be determined.
+
+        In order of precedence: the feature defining most of the file's declared
+        ``requirement_ids``; a feature whose directory name (without its sequence
+        number) matches a directory of the file (``specs/001-ade-compliance`` for
+        ``src/ade_compliance/...``); the root ``spec.md``; the only feature.
+        """
+        documents = self.documents
+        # Documents grouped by feature; documents outside a feature directory stand alone
+        units: Dict[str, List[str]] = {}
+        for path, doc in documents.items():
+            units.setdefault(doc.feature or path, []).append(path)
+        if not units:
+            return None
+        features = [unit for unit in units if "/" not in unit and unit != ROOT_SPEC]
+
+        votes: Dict[str, int] = {}
+        for requirement_id in set(requirement_ids):
+            for unit in {documents[r.path].feature or r.path for r in self.lookup(requirement_id)}:
+                votes[unit] = votes.get(unit, 0) + 1
+        if votes:
+            best = max(votes.values())
+            winners = [unit for unit, count in votes.items() if count == best]
+            if len(winners) == 1:
+                return self._primary(units[winners[0]])
+
+        slugs = {_FEATURE_NUMBER.sub("", feature).replace("_", "-").lower(): feature for feature in features}
+        for segment in file_path.replace("\\", "/").split("/")[:-1]:
+            feature = slugs.get(segment.replace("_", "-").lower())
+            if feature:
+                return self._primary(units[feature])
+
+        if ROOT_SPEC in units:
+            return ROOT_SPEC
+        if len(features) == 1:
+            return self._primary(units[features[0]])
+        return None
+
+    def __len__(self) -> int:
+        return len(self._documents)
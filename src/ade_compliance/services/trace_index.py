@@ -0,0 +1,182 @@
+# implements: FR-003, FR-026
+# traces_to: Π.3.1
+
+"""Persistent trace-link index keyed by file content hash.
+
+Stores the trace link rows extracted from every traced file in a SQLite file
+(``trace.sqlite`` beside the result cache by default), one generation per normalized path
+tagged with the content hash and TraceEngine fingerprint it was extracted from.
+``Orchestrator`` looks up each batch in bulk and replays the stored links for
+unchanged files instead of parsing them again, and writes back the links of
+files that were re-extracted. Links are also indexed by ``target``, which makes the
+index answer reverse queries ("which files and symbols implement FR-021?") with a
+single index seek; results reflect the files as of their last check. Rows of deleted
+files are removed when a run checks them (or by ``prune_missing`` from ``cache
+prune``), never by queries.
+"""
+
+import os
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from ..config import Config
+from ..models.records import LinkRecord
+
+# Bump to discard stored links when the table layout changes
+INDEX_SCHEMA_VERSION = 1
+
+TRACE_INDEX_DB_NAME = "trace.sqlite"
+
+# SQLite caps host parameters per statement (999 on older builds)
+_QUERY_CHUNK = 500
+
+
+class TraceIndex:
+    """On-disk store of per-file trace links, replaced whenever a file's content changes."""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != INDEX_SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS trace_links")
+                conn.execute("DROP TABLE IF EXISTS trace_files")
+                conn.execute(f"PRAGMA user_version = {INDEX_SCHEMA_VERSION}")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS trace_files ("
+                "path TEXT PRIMARY KEY, content_hash TEXT NOT NULL, fingerprint TEXT NOT NULL, "
+                "indexed_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS trace_links ("
+                "path TEXT NOT NULL, target TEXT NOT NULL, type TEXT NOT NULL, symbol TEXT, "
+                "position INTEGER NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_trace_links_path ON trace_links (path)")
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_trace_links_target ON trace_links (target)")
+
+    @classmethod
+    def from_config(cls, config: Config) -> Optional["TraceIndex"]:
+        """Build the configured index, or None when persistent caching is disabled."""
+        if not config.global_settings.cache_enabled:
+            return None
+        settings = config.global_settings
+        return cls(Path(settings.trace_index_path or Path(settings.cache_path) / TRACE_INDEX_DB_NAME))
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), timeout=30.0)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def lookup(self, files: Iterable[Tuple[str, str]], fingerprint: str) -> Dict[str, List[LinkRecord]]:
+        """Return stored links for ``(path, content_hash)`` pairs that are still current.
+
+        Paths whose stored hash or engine fingerprint differs (or that were never
+        indexed) are omitted. Returned links carry the normalized path as ``source``.
+        """
+        wanted = dict(files)
+        found: Dict[str, List[LinkRecord]] = {}
+        if not wanted:
+            return found
+        paths = list(wanted)
+        with closing(self._connect()) as conn:
+            for i in range(0, len(paths), _QUERY_CHUNK):
+                chunk = paths[i : i + _QUERY_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT path, content_hash FROM trace_files WHERE fingerprint = ? AND path IN ({placeholders})",
+                    [fingerprint, *chunk],
+                )
+                current = [path for path, content_hash in rows if wanted[path] == content_hash]
+                for path in current:
+                    found[path] = []
+                if not current:
+                    continue
+                placeholders = ",".join("?" * len(current))
+                rows = conn.execute(
+                    f"SELECT path, target, type, symbol FROM trace_links WHERE path IN ({placeholders}) "
+                    "ORDER BY path, position",
+                    current,
+                )
+                for path, target, link_type, symbol in rows:
+                    found[path].append(LinkRecord.create(path, target, link_type, symbol))
+        return found
+
+    def current(self, files: Iterable[Tuple[str, str]], fingerprint: str) -> Set[str]:
+        """Paths among ``(path, content_hash)`` pairs whose stored links are current, without loading links."""
+        wanted = dict(files)
+        found: Set[str] = set()
+        paths = list(wanted)
+        if not paths:
+            return found
+        with closing(self._connect()) as conn:
+            for i in range(0, len(paths), _QUERY_CHUNK):
+                chunk = paths[i : i + _QUERY_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT path, content_hash FROM trace_files WHERE fingerprint = ? AND path IN ({placeholders})",
+                    [fingerprint, *chunk],
+                )
+                found.update(path for path, content_hash in rows if wanted[path] == content_hash)
+        return found
+
+    def update(self, entries: Iterable[Tuple[str, str, Sequence[LinkRecord]]], fingerprint: str) -> None:
+        """Replace the stored links of each ``(path, content_hash, links)`` entry in one transaction."""
+        # Last entry wins for repeated paths so links are never stored twice
+        entries = list({path: (path, content_hash, links) for path, content_hash, links in entries}.values())
+        if not entries:
+            return
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            conn.executemany("DELETE FROM trace_links WHERE path = ?", [(path,) for path, _, _ in entries])
+            conn.executemany(
+                "INSERT OR REPLACE INTO trace_files (path, content_hash, fingerprint, indexed_at) VALUES (?, ?, ?, ?)",
+                [(path, content_hash, fingerprint, now) for path, content_hash, _ in entries],
+            )
+            conn.executemany(
+                "INSERT INTO trace_links (path, target, type, symbol, position) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (path, link.target, link.type, link.symbol, position)
+                    for path, _, links in entries
+                    for position, link in enumerate(links)
+                ],
+            )
+
+    def query(self, target: str, existing_only: bool = True) -> List[LinkRecord]:
+        """Reverse lookup: every stored link pointing at ``target``, ordered by file and position.
+
+        With ``existing_only`` links from files that no longer exist on disk are left out
+        of the result. The index itself is never modified; ``prune_missing`` removes them.
+        """
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT path, type, symbol FROM trace_links WHERE target = ? ORDER BY path, position", (target,)
+            ).fetchall()
+        links = [LinkRecord.create(path, target, link_type, symbol) for path, link_type, symbol in rows]
+        if existing_only:
+            links = [link for link in links if os.path.isfile(link.source)]
+        return links
+
+    def prune_missing(self) -> int:
+        """Drop the links of indexed files that no longer exist on disk; returns the files removed."""
+        with closing(self._connect()) as conn:
+            paths = [path for (path,) in conn.execute("SELECT path FROM trace_files")]
+        return self.remove(path for path in paths if not os.path.isfile(path))
+
+    def remove(self, paths: Iterable[str]) -> int:
+        """Drop every stored link for the given normalized paths; returns the files removed."""
+        paths = [(path,) for path in paths]
+        if not paths:
+            return 0
+        with closing(self._connect()) as conn, conn:
+            conn.executemany("DELETE FROM trace_links WHERE path = ?", paths)
+            return sum(conn.execute("DELETE FROM trace_files WHERE path = ?", p).rowcount for p in paths)
+
+    def __len__(self) -> int:
+        with closing(self._connect()) as conn:
+            return int(conn.execute("SELECT COUNT(*) FROM trace_files").fetchone()[0])
@@ -0,0 +1,308 @@
+# implements: FR-006
+# traces_to: Π.3.1
+
+"""Watch-mode session keeping an always-current compliance report.
+
+A ``WatchSession`` owns one ``Orchestrator`` (engines, result cache and worker pool
+stay warm for the life of the process), keeps per-file results in memory and, on
+each batch of file-system changes, re-checks only the changed files plus the
+implementation files whose mapped test file changed. Repository-wide engines are
+re-run over every tracked file on each refresh. Specifications and the coverage data
+file are watched too: every file's SpecEngine and CoverageEngine result depends on
+them, so a change to their digest re-checks every tracked file. After every refresh the
+aggregate ``ComplianceReport`` is written atomically to
+``global_settings.watch_report_path`` so other processes can read it instantly.
+"""
+
+import asyncio
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from ..config import Config
+from ..engines.coverage_engine import CoverageEngine
+from ..engines.spec_engine import SpecEngine
+from ..models.axiom import Violation
+from ..models.records import LinkRecord
+from ..models.report import ComplianceReport
+from ..utils.path import SOURCE_FILE_SUFFIXES, collect_source_files, normalize_project_path
+from ..utils.testfiles import stems_for_test_file
+from .coverage_data import DEFAULT_DATA_FILES
+from .orchestrator import Orchestrator
+from .parallel import EnginePool
+from .spec_index import ROOT_SPEC, SPEC_DIR
+
+# (violations keyed by engine name, trace links) for one file
+FileEntry = Tuple[Dict[str, List[Violation]], List[LinkRecord]]
+
+
+class WatchSession:
+    """Incrementally maintained compliance state for a set of watched paths."""
+
+    def __init__(self, config: Config, paths: Iterable[str]):
+        self.config = config
+        self.paths = [p.replace("\\", "/") for p in paths]
+        self.orchestrator = Orchestrator(config)
+        self.orchestrator.pool = EnginePool.from_config(config, self.orchestrator.engines)
+        self.report_path = Path(config.global_settings.watch_report_path)
+
+        self.files: Dict[str, str] = {}
+        self._by_stem: Dict[str, Set[str]] = {}
+        self._results: Dict[str, FileEntry] = {}
+        self._global: Dict[str, List[Violation]] = {}
+        self._global_engines = {e.name for e in self.orchestrator.engines if not e.cacheable}
+        self._override_index = None
+        self._context: Optional[Tuple[Optional[str], ...]] = None
+
+        self.refreshes = 0
+        self.last_checked = 0
+        self.last_refresh_ms = 0
+        for path in collect_source_files(self.paths):
+            self._track(path)
+
+    # -- tracked file set -------------------------------------------------
+
+    def _track(self, path: str) -> None:
+        norm = normalize_project_path(path)
+        self.files[norm] = path
+        stem = Path(norm).stem
+        self._by_stem.setdefault(stem, set()).add(norm)
+
+    def _untrack(self, norm: str) -> None:
+        self.files.pop(norm, None)
+        self._results.pop(norm, None)
+        stems = self._by_stem.get(Path(norm).stem)
+        if stems:
+            stems.discard(norm)
+
+    def _is_watched(self, norm: str) -> bool:
+        if not norm.endswith(SOURCE_FILE_SUFFIXES):
+            return False
+        for root in self.paths:
+            root_norm = normalize_project_path(root)
+            if root_norm in ("", ".") or norm == root_norm or norm.startswith(root_norm + "/"):
+                return True
+        return False
+
+    def roots(self) -> List[str]:
+        """Paths to watch: the requested paths, the test roots when test mapping matters and the context paths."""
+        roots = list(self.paths)
+
+        def covered(path: str) -> bool:
+            norm = normalize_project_path(path)
+            return any(
+                r in ("", ".") or norm == r or norm.startswith(r + "/") for r in map(normalize_project_path, roots)
+            )
+
+        if self.config.engines.test.enabled:
+            for test_root in self.config.engines.test.test_roots:
+                if os.path.isdir(test_root) and not covered(test_root):
+                    roots.append(test_root)
+        for path in self.context_paths():
+            if not covered(path):
+                roots.append(path)
+        return roots
+
+    def context_paths(self) -> List[str]:
+        """Files (or directories) outside the tracked set that every file's result depends on.
+
+        These are the specifications when SpecEngine runs and the coverage data file
+        when CoverageEngine gates on a minimum.
+        """
+        paths = []
+        for engine in self.orchestrator.engines:
+            if isinstance(engine, SpecEngine):
+                paths += [ROOT_SPEC, SPEC_DIR]
+            elif isinstance(engine, CoverageEngine) and engine.config.min_coverage is not None:
+                configured = getattr(engine.config, "data_file", None)
+                paths += [configured] if configured else list(DEFAULT_DATA_FILES)
+        return paths
+
+    def _is_context(self, norm: str) -> bool:
+        for path in self.context_paths():
+            context = normalize_project_path(path)
+            if norm == context or norm.startswith(context + "/"):
+                return True
+        return False
+
+    def _context_changed(self) -> bool:
+        """True if the spec index or coverage data digest changed since the last call."""
+        digests: List[Optional[str]] = []
+        for engine in self.orchestrator.engines:
+            if isinstance(engine, SpecEngine):
+                engine.index.refresh()
+                digests.append(engine.index.digest())
+            elif isinstance(engine, CoverageEngine):
+                engine.begin_run()
+                summary = engine.summary() if engine.should_run() else None
+                digests.append(summary.digest if summary else None)
+        context = tuple(digests)
+        changed = self._context is not None and context != self._context
+        self._context = context
+        return changed
+
+    def _test_subjects(self, norm_path: str) -> Set[str]:
+        """Implementation stems a test file can be mapped to by ``TestEngine.find_test_file``."""
+        test = self.config.engines.test
+        if not any(norm_path.startswith(normalize_project_path(root) + "/") for root in test.test_roots):
+            return set()
+        return stems_for_test_file(norm_path, test.test_patterns)
+
+    def affected(self, changed: Iterable[str]) -> Set[str]:
+        """Update the tracked set for created/deleted files and return files to re-check.
+
+        A changed test file also invalidates the implementation files it may map to.
+        """
+        targets: Set[str] = set()
+        for path in changed:
+            norm = normalize_project_path(path)
+            exists = os.path.isfile(path)
+            if norm in self.files:
+                if exists:
+                    targets.add(norm)
+                else:
+                    self._untrack(norm)
+            elif exists and self._is_watched(norm):
+                self._track(path)
+                targets.add(norm)
+
+            for stem in self._test_subjects(norm):
+                targets.update(self._by_stem.get(stem, ()))
+        return targets
+
+    # -- checking ---------------------------------------------------------
+
+    def _overrides_changed(self) -> bool:
+        from .override import OverrideService
+
+        index = OverrideService(self.config).get_override_index()
+        changed = self._override_index is not None and index is not self._override_index
+        self._override_index = index
+        return changed
+
+    async def refresh(self, changed: Optional[Iterable[str]] = None) -> int:
+        """Re-check files affected by ``changed`` (everything when None).
+
+        Any change to the active overrides, the specifications or the coverage data
+        also re-evaluates every file, which is cheap
+        because unchanged files are replayed from the result cache. Returns the number
+        of files re-checked; the report file is rewritten whenever it is non-zero.
+        """
+        if changed is None:
+            for norm in list(self.files):
+                if not os.path.isfile(self.files[norm]):
+                    self._untrack(norm)
+            for path in collect_source_files(self.paths):
+                if normalize_project_path(path) not in self.files:
+                    self._track(path)
+            targets = set(self.files)
+        else:
+            targets = self.affected(changed)
+        context_touched = changed is None or any(self._is_context(normalize_project_path(p)) for p in changed)
+        if context_touched and self._context_changed():
+            targets = set(self.files)
+        if self._overrides_changed() or self.refreshes == 0:
+            targets = set(self.files)
+        if not targets and self.refreshes:
+            return 0
+
+        start = time.monotonic()
+        ordered = [self.files[norm] for norm in sorted(targets)]
+        # Repository-wide engines always see every tracked file, so their findings replace the old ones
+        tracked = [self.files[norm] for norm in sorted(self.files)]
+        global_violations: Dict[str, List[Violation]] = {}
+        async for result, engine_violations, links in self.orchestrator.iter_results(ordered, global_files=tracked):
+            if set(engine_violations) <= self._global_engines and engine_violations:
+                for name, violations in engine_violations.items():
+                    global_violations.setdefault(name, []).extend(violations)
+                continue
+            norm = normalize_project_path(result.file_path)
+            if norm in self.files:
+                self._results[norm] = (engine_violations, links)
+
+        self._global = global_violations
+        self.refreshes += 1
+        self.last_checked = len(ordered)
+        self.last_refresh_ms = int((time.monotonic() - start) * 1000)
+        self.write_report()
+        return len(ordered)
+
+    def report(self) -> ComplianceReport:
+        """Assemble the current report from the in-memory per-file results."""
+        by_engine: Dict[str, List[Violation]] = {engine.name: [] for engine in self.orchestrator.engines}
+        links: List[LinkRecord] = []
+        for name, violations in self._global.items():
+            by_engine.setdefault(name, []).extend(violations)
+        for norm in sorted(self._results):
+            engine_violations, file_links = self._results[norm]
+            for name, violations in engine_violations.items():
+                by_engine.setdefault(name, []).extend(violations)
+            links.extend(file_links)
+
+        trace_engine = self.orchestrator.trace_engine
+        report = ComplianceReport(
+            repo_root=".",
+            violations=[v for violations in by_engine.values() for v in violations],
+            traceability_matrix=trace_engine.generate_matrix(links) if trace_engine else {},
+            metrics={
+                "watch": {
+                    "files": len(self.files),
+                    "refreshes": self.refreshes,
+                    "last_checked": self.last_checked,
+                    "last_refresh_ms": self.last_refresh_ms,
+                }
+            },
+        )
+        report.generate_summary()
+        return report
+
+    def write_report(self) -> ComplianceReport:
+        """Atomically replace the report file so readers never observe a partial write."""
+        report = self.report()
+        self.report_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=str(self.report_path.parent), prefix=".report-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(report.model_dump_json(by_alias=True))
+            os.replace(tmp, self.report_path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        return report
+
+    async def watch(
+        self,
+        watcher,
+        interval: float,
+        on_refresh: Optional[Callable[["WatchSession"], None]] = None,
+        debounce: float = 0.2,
+    ) -> None:
+        """Check everything once, then re-check on every batch of changes until cancelled."""
+        await self.refresh(None)
+        if on_refresh:
+            on_refresh(self)
+        while True:
+            changed = await asyncio.to_thread(watcher.wait, interval)
+            # Coalesce bursts (editors writing several files, formatters) into one refresh
+            while changed:
+                more = await asyncio.to_thread(watcher.wait, debounce)
+                if more is None:
+                    # Events were lost; fall back to a full rescan
+                    changed = None
+                elif more:
+                    changed |= more
+                    continue
+                break
+            if await self.refresh(changed):
+                if on_refresh:
+                    on_refresh(self)
+
+    def close(self) -> None:
+        if self.orchestrator.pool:
+            self.orchestrator.pool.shutdown()
+            self.orchestrator.pool = None
@@ -0,0 +1,65 @@
+# implements: FR-021
+# traces_to: Π.3.1
+
+"""Aho-Corasick multi-pattern substring matcher.
+
+Finds every pattern occurring in a text in a single left-to-right pass, independent
+of the number of patterns. Used to match COMPONENT override scopes (plain substring
+scopes) against violation paths without testing each scope in turn.
+"""
+
+from collections import deque
+from typing import Dict, Iterable, Iterator, List
+
+
+class AhoCorasick:
+    """Immutable automaton over a fixed set of non-empty string patterns."""
+
+    def __init__(self, patterns: Iterable[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # Patterns ending at each state, including those inherited through failure links
+        self._out: List[List[str]] = [[]]
+        self.patterns = sorted({p for p in patterns if p})
+
+        for pattern in self.patterns:
+            state = 0
+            for ch in pattern:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = nxt
+            self._out[state].append(pattern)
+
+        # Breadth-first construction of failure links; depth-1 states fail to the root
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0) if state else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def iter_matches(self, text: str) -> Iterator[str]:
+        """Yield each pattern occurrence in ``text`` (a pattern may be yielded repeatedly)."""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            yield from out[state]
+
+    def contains_any(self, text: str) -> bool:
+        """Return True if at least one pattern occurs in ``text``."""
+        return next(self.iter_matches(text), None) is not None
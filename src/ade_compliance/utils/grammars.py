@@ -0,0 +1,128 @@
+# implements: FR-003
+# traces_to: Π.3.1
+
+"""Process-wide registry of tree-sitter grammars.
+
+Each grammar module is imported and its ``Language`` built lazily, at most once per
+process, no matter how many engines or orchestrators are created (the server builds
+one per request). ``Parser`` and ``QueryCursor`` objects are stateful, so they are
+handed out per thread; tree-sitter releases the GIL while parsing, which lets
+callers parse several files concurrently from a thread pool.
+"""
+
+import importlib
+import threading
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    # tree-sitter is optional at runtime and imported lazily below
+    from tree_sitter import Language, Parser, Query, QueryCursor
+
+# Source suffix -> (grammar module, language function)
+GRAMMAR_MODULES: Dict[str, Tuple[str, str]] = {
+    ".py": ("tree_sitter_python", "language"),
+    ".js": ("tree_sitter_javascript", "language"),
+    ".ts": ("tree_sitter_typescript", "language_typescript"),
+    ".tsx": ("tree_sitter_typescript", "language_typescript"),
+    ".java": ("tree_sitter_java", "language"),
+}
+
+# Comment node kinds across the supported grammars (Java splits line and block comments)
+COMMENT_NODE_TYPES = ("comment", "line_comment", "block_comment")
+
+
+class GrammarRegistry:
+    """Lazily loaded languages and comment queries shared process-wide, with per-thread parsers."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._languages: Dict[str, Optional["Language"]] = {}
+        self._queries: Dict[str, Optional["Query"]] = {}
+        self._local = threading.local()
+
+    def language(self, suffix: str) -> Optional["Language"]:
+        """The ``Language`` for a source suffix, or None if unsupported or not installed."""
+        try:
+            return self._languages[suffix]
+        except KeyError:
+            pass
+        with self._lock:
+            if suffix not in self._languages:
+                self._languages[suffix] = self._load(suffix)
+            return self._languages[suffix]
+
+    @staticmethod
+    def _load(suffix: str) -> Optional["Language"]:
+        spec = GRAMMAR_MODULES.get(suffix)
+        if spec is None:
+            return None
+        try:
+            from tree_sitter import Language
+
+            module = importlib.import_module(spec[0])
+            return Language(getattr(module, spec[1])())
+        except Exception:
+            # tree-sitter or the grammar package is missing (e.g. minimal environments)
+            return None
+
+    def _thread_state(self) -> Tuple[Dict[str, "Parser"], Dict[str, Optional["QueryCursor"]]]:
+        state = getattr(self._local, "state", None)
+        if state is None:
+            state = self._local.state = ({}, {})
+        return state
+
+    def parser(self, suffix: str) -> Optional["Parser"]:
+        """This thread's ``Parser`` for a source suffix (None when no grammar is available)."""
+        parsers, _ = self._thread_state()
+        parser = parsers.get(suffix)
+        if parser is None:
+            lang = self.language(suffix)
+            if lang is None:
+                return None
+            from tree_sitter import Parser
+
+            parser = parsers[suffix] = Parser(lang)
+        return parser
+
+    def _comment_query(self, suffix: str) -> Optional["Query"]:
+        try:
+            return self._queries[suffix]
+        except KeyError:
+            pass
+        query = None
+        lang = self.language(suffix)
+        if lang is not None:
+            try:
+                from tree_sitter import Query
+
+                kinds = [k for k in COMMENT_NODE_TYPES if lang.id_for_node_kind(k, True) is not None]
+                if kinds:
+                    query = Query(lang, "[" + " ".join(f"({k})" for k in kinds) + "] @comment")
+            except Exception:
+                query = None
+        with self._lock:
+            return self._queries.setdefault(suffix, query)
+
+    def comment_cursor(self, suffix: str) -> Optional["QueryCursor"]:
+        """This thread's ``QueryCursor`` capturing comment nodes as ``@comment``.
+
+        None when the grammar is unavailable or the bindings predate ``QueryCursor``.
+        """
+        _, cursors = self._thread_state()
+        if suffix in cursors:
+            return cursors[suffix]
+        cursor = None
+        query = self._comment_query(suffix)
+        if query is not None:
+            try:
+                from tree_sitter import QueryCursor
+
+                cursor = QueryCursor(query)
+            except Exception:
+                cursor = None
+        cursors[suffix] = cursor
+        return cursor
+
+
+# The process-wide registry used by TraceEngine
+GRAMMARS = GrammarRegistry()
@@ -0,0 +1,135 @@
+# implements: FR-030
+# traces_to: Π.3.1
+
+"""Repository-scoped advisory locking for concurrent compliance runs.
+
+Replaces per-file ``O_CREAT | O_EXCL`` lock files with a single repository lock (or a
+small fixed set of hash-bucket shards) held through ``fcntl.flock`` / ``msvcrt.locking``.
+Waiters block in the kernel instead of busy-sleeping, locks are released automatically
+if the holding process dies, and lock files live under ``.ade_compliance/locks`` rather
+than the repository root.
+"""
+
+import asyncio
+import hashlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from pathlib import Path
+from typing import AsyncGenerator, Generator, Iterable, List, Optional
+
+from ..config import Config
+from ..observability.metrics import lock_wait_seconds
+from .path import normalize_project_path
+
+if os.name == "nt":  # pragma: no cover - exercised on Windows runners only
+    import msvcrt
+
+    def _lock_fd(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        while True:
+            try:
+                # LK_LOCK retries for ~10 seconds before raising; keep waiting
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue
+
+    def _unlock_fd(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _lock_fd(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+    def _unlock_fd(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+# Dedicated waiter threads so blocked acquisitions never starve the default executor
+_WAITERS = ThreadPoolExecutor(thread_name_prefix="ade-lock")
+
+
+class RepositoryLock:
+    """Exclusive lock serializing compliance runs over the same repository (FR-030).
+
+    With ``shards == 1`` every run takes the single repository lock. With more shards,
+    files are hashed into buckets and a run locks only the buckets its files fall into,
+    always in ascending order so concurrent runs cannot deadlock.
+    """
+
+    def __init__(self, lock_dir: Path, shards: int = 1):
+        self.lock_dir = Path(lock_dir)
+        self.shards = max(1, shards)
+
+    @classmethod
+    def from_config(cls, config: Config) -> "RepositoryLock":
+        return cls(Path(config.global_settings.lock_path), config.global_settings.lock_shards)
+
+    def lock_names(self, files: Optional[Iterable[str]] = None) -> List[str]:
+        """Lock file names covering the given files, in acquisition order."""
+        if self.shards == 1 or files is None:
+            return ["repo.lock"] if self.shards == 1 else [f"shard-{i:03d}.lock" for i in range(self.shards)]
+        buckets = set()
+        for f in files:
+            digest = hashlib.sha256(normalize_project_path(f).encode("utf-8")).digest()
+            buckets.add(int.from_bytes(digest[:4], "big") % self.shards)
+        return [f"shard-{i:03d}.lock" for i in sorted(buckets)]
+
+    def _open(self, names: List[str]) -> List[int]:
+        self.lock_dir.mkdir(parents=True, exist_ok=True)
+        return [os.open(str(self.lock_dir / name), os.O_RDWR | os.O_CREAT, 0o644) for name in names]
+
+    @staticmethod
+    def _lock_all(fds: List[int]) -> None:
+        for fd in fds:
+            _lock_fd(fd)
+
+    @staticmethod
+    def _release(fds: List[int]) -> None:
+        for fd in reversed(fds):
+            try:
+                _unlock_fd(fd)
+            except OSError:
+                pass
+            os.close(fd)
+
+    @contextmanager
+    def acquire(self, files: Optional[Iterable[str]] = None) -> Generator[float, None, None]:
+        """Block until the lock is held; yields the time spent waiting in seconds."""
+        fds = self._open(self.lock_names(files))
+        start = time.monotonic()
+        try:
+            self._lock_all(fds)
+        except BaseException:
+            self._release(fds)
+            raise
+        waited = time.monotonic() - start
+        lock_wait_seconds.observe(waited)
+        try:
+            yield waited
+        finally:
+            self._release(fds)
+
+    @asynccontextmanager
+    async def acquire_async(self, files: Optional[Iterable[str]] = None) -> AsyncGenerator[float, None]:
+        """Async variant of ``acquire`` that waits on a helper thread without blocking the event loop."""
+        fds = self._open(self.lock_names(files))
+        start = time.monotonic()
+        waiter = _WAITERS.submit(self._lock_all, fds)
+        try:
+            await asyncio.wrap_future(waiter)
+        except BaseException:
+            # The waiter thread may still acquire the lock later; release once it finishes
+            waiter.add_done_callback(lambda _: self._release(fds))
+            raise
+        waited = time.monotonic() - start
+        lock_wait_seconds.observe(waited)
+        try:
+            yield waited
+        finally:
+            self._release(fds)
@@ -0,0 +1,105 @@
+# implements: FR-012
+# traces_to: Π.3.1
+
+"""Streaming writers for exporting the traceability matrix.
+
+Rows are ``(source, type, target, symbol)`` tuples (``MATRIX_COLUMNS``) written as
+they are produced, so dashboards can ingest the matrix without anyone building or
+parsing one large JSON document:
+
+- ``csv``: header plus one row per link (empty ``symbol`` when absent).
+- ``jsonl``: one JSON object per link.
+- ``parquet``: row groups flushed every ``PARQUET_ROW_GROUP`` rows; needs the
+  optional ``pyarrow`` dependency (``pip install ade-compliance[parquet]``).
+"""
+
+import csv
+import json
+from typing import IO, Iterable, List, Optional, Tuple
+
+from ..models.records import MATRIX_COLUMNS
+
+MatrixRow = Tuple[str, str, str, Optional[str]]
+
+EXPORT_FORMATS = ("csv", "jsonl", "parquet")
+
+# Rows buffered per Parquet row group
+PARQUET_ROW_GROUP = 50_000
+
+
+class CsvMatrixWriter:
+    def __init__(self, stream: IO[str]):
+        self._writer = csv.writer(stream, lineterminator="\n")
+        self._writer.writerow(MATRIX_COLUMNS)
+        self.rows = 0
+
+    def write_rows(self, rows: Iterable[MatrixRow]) -> None:
+        for source, ltype, target, symbol in rows:
+            self._writer.writerow((source, ltype, target, symbol or ""))
+            self.rows += 1
+
+    def close(self) -> None:
+        pass
+
+
+class JsonlMatrixWriter:
+    def __init__(self, stream: IO[str]):
+        self._stream = stream
+        self.rows = 0
+
+    def write_rows(self, rows: Iterable[MatrixRow]) -> None:
+        for row in rows:
+            self._stream.write(json.dumps(dict(zip(MATRIX_COLUMNS, row, strict=True)), ensure_ascii=False))
+            self._stream.write("\n")
+            self.rows += 1
+
+    def close(self) -> None:
+        pass
+
+
+class ParquetMatrixWriter:
+    def __init__(self, path: str):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise RuntimeError(
+                "Parquet export requires pyarrow (pip install 'ade-compliance[parquet]' or 'pyarrow')"
+            ) from e
+        self._pa = pa
+        self._schema = pa.schema([(name, pa.string()) for name in MATRIX_COLUMNS])
+        self._writer = pq.ParquetWriter(path, self._schema)
+        self._buffer: List[MatrixRow] = []
+        self.rows = 0
+
+    def write_rows(self, rows: Iterable[MatrixRow]) -> None:
+        for row in rows:
+            self._buffer.append(row)
+            self.rows += 1
+            if len(self._buffer) >= PARQUET_ROW_GROUP:
+                self._flush()
+
+    def _flush(self) -> None:
+        if not self._buffer:
+            return
+        columns = list(zip(*self._buffer, strict=True))
+        batch = self._pa.record_batch([self._pa.array(col, self._pa.string()) for col in columns], schema=self._schema)
+        self._writer.write_batch(batch)
+        self._buffer = []
+
+    def close(self) -> None:
+        self._flush()
+        self._writer.close()
+
+
+def open_matrix_writer(fmt: str, stream: Optional[IO[str]] = None, path: Optional[str] = None):
+    """Create a writer for ``fmt``; text formats write to ``stream``, Parquet to ``path``."""
+    if fmt == "csv":
+        return CsvMatrixWriter(stream)
+    if fmt == "jsonl":
+        return JsonlMatrixWriter(stream)
+    if fmt == "parquet":
+        if path is None:
+            raise ValueError("Parquet export needs an output file")
+        return ParquetMatrixWriter(path)
+    raise ValueError(f"Unknown matrix export format '{fmt}' (expected one of {', '.join(EXPORT_FORMATS)})")
@@ -0,0 +1,123 @@
+# implements: FR-017
+# traces_to: Π.3.1
+
+"""Content-hash keyed cache of parse trees shared by all engines.
+
+The orchestrator owns one ``ParseCache`` and binds it to every engine, so a file is
+parsed at most once per parser kind (Python ``ast`` or a tree-sitter grammar) no
+matter how many engines analyse it. Entries are keyed by content digest, which keeps
+them valid across runs of a long-lived orchestrator (watch mode, the server) until
+the file changes.
+
+Trees are much larger than the source they came from, so retention is bounded by
+an estimated memory budget: each entry is charged its source size times a
+per-parser factor and the least recently used entries are evicted past the budget.
+"""
+
+import ast
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+
+from .grammars import GRAMMARS
+from .source import SourceFile
+
+# Approximate in-memory tree size per source byte (measured on this code base)
+AST_BYTES_PER_SOURCE_BYTE = 32
+TREE_SITTER_BYTES_PER_SOURCE_BYTE = 48
+
+DEFAULT_BUDGET_BYTES = 256 * 2**20
+
+# Stored for sources that fail to parse, so they are not re-parsed either
+_UNPARSABLE = object()
+
+
+class ParseCache:
+    """LRU cache of parse trees keyed by ``(parser kind, content digest)`` within a memory budget.
+
+    Safe to share between threads (TraceEngine parses on a thread pool). A budget of
+    0 disables retention; lookups still work but always parse.
+    """
+
+    def __init__(self, budget_bytes: int = DEFAULT_BUDGET_BYTES):
+        self.budget_bytes = budget_bytes
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[object, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def from_config(cls, config) -> "ParseCache":
+        return cls(config.global_settings.parse_cache_mb * 2**20)
+
+    def get_or_parse(self, kind: str, digest: str, cost: int, parse: Callable[[], object]) -> Optional[object]:
+        """Return the cached tree for ``(kind, digest)``, calling ``parse`` on a miss.
+
+        ``parse`` may raise to signal an unparsable source; None is returned then (and
+        on later lookups of the same content). Sources without a digest are never cached.
+        """
+        key = (kind, digest)
+        if digest:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return None if entry[0] is _UNPARSABLE else entry[0]
+                self.misses += 1
+
+        try:
+            tree = parse()
+        except Exception:
+            tree = _UNPARSABLE
+        if digest and cost <= self.budget_bytes:
+            self._store(key, tree, cost)
+        return None if tree is _UNPARSABLE else tree
+
+    def _store(self, key: Tuple[str, str], tree: object, cost: int) -> None:
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.used_bytes -= previous[1]
+            self._entries[key] = (tree, cost)
+            self.used_bytes += cost
+            while self.used_bytes > self.budget_bytes:
+                _, (_, evicted_cost) = self._entries.popitem(last=False)
+                self.used_bytes -= evicted_cost
+                self.evictions += 1
+
+    def python_ast(self, source: SourceFile) -> Optional[ast.Module]:
+        """The ``ast`` module tree of a Python source, or None if unreadable or invalid."""
+        if not source.exists or source.text is None:
+            return None
+        tree = self.get_or_parse(
+            "ast",
+            source.digest,
+            source.size * AST_BYTES_PER_SOURCE_BYTE,
+            lambda: ast.parse(source.text, filename=source.norm_path),
+        )
+        return tree if isinstance(tree, ast.Module) else None
+
+    def tree_sitter(self, suffix: str, digest: str, data: bytes, parser: Optional[object] = None) -> Optional[object]:
+        """The tree-sitter tree of ``data`` for the grammar of ``suffix``.
+
+        ``parser`` overrides the registry's thread-local parser for that grammar. None
+        when no grammar is available or parsing fails.
+        """
+        if parser is None:
+            parser = GRAMMARS.parser(suffix)
+            if parser is None:
+                return None
+        return self.get_or_parse(
+            f"tree-sitter{suffix}", digest, len(data) * TREE_SITTER_BYTES_PER_SOURCE_BYTE, lambda: parser.parse(data)
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.used_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
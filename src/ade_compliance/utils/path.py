@@ -11,11 +11,16 @@ import os
 import re
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Generator, Optional
+from typing import Generator, Iterable, List, Optional
 
 # Strict regex matching only standard alphanumeric characters, underscores, hyphens, and dots
 SAFE_SEGMENT_PATTERN = re.compile(r"^[a-zA-Z0-9_\-.]+$")
 
+# File patterns collected when a directory is passed to the CLI
+SOURCE_FILE_GLOBS = ("*.py", "*.js", "*.ts", "*.tsx", "*.java")
+# The same languages as file name suffixes
+SOURCE_FILE_SUFFIXES = tuple(glob[1:] for glob in SOURCE_FILE_GLOBS)
+
 
 def sanitize_relative_path(base_dir: Path, input_path: str) -> Optional[Path]:
     """Sanitize and resolve a relative file path securely against a base directory boundary.
@@ -61,6 +66,20 @@ def sanitize_relative_path(base_dir: Path, input_path: str) -> Optional[Path]:
         return None
 
 
+def is_inside_base(base_dir: Path, input_path: str) -> bool:
+    """True if ``input_path`` resolves inside ``base_dir`` to a path ``sanitize_relative_path`` leaves unchanged.
+
+    ``base_dir`` must be resolved. Paths outside the base (absolute, via ``..`` or via
+    symlinks) and names the sanitizer would rewrite are rejected.
+    """
+    try:
+        resolved = (base_dir / str(input_path).replace("\\", "/")).resolve()
+        relative = resolved.relative_to(base_dir)
+    except (OSError, ValueError):
+        return False
+    return sanitize_relative_path(base_dir, relative.as_posix()) == resolved
+
+
 def normalize_project_path(file_path: str) -> str:
     """Normalize a path to a standardized project-root relative path with forward slashes.
 
@@ -99,9 +118,30 @@ def normalize_project_path(file_path: str) -> str:
         return normalized
 
 
+def collect_source_files(paths: Iterable[str]) -> List[str]:
+    """Expand files and directories into the list of source files to check.
+
+    Files are taken as given; directories are searched recursively for the supported
+    languages. Paths use forward slashes.
+    """
+    files = []
+    for p in paths:
+        path = Path(p)
+        if path.is_file():
+            files.append(str(path).replace("\\", "/"))
+        elif path.is_dir():
+            # Recursive search for supported languages
+            for ext in SOURCE_FILE_GLOBS:
+                for f in path.rglob(ext):
+                    files.append(str(f).replace("\\", "/"))
+    return files
+
+
 @contextmanager
 def file_system_lock(file_path: str, timeout: float = 10.0) -> Generator[bool, None, None]:
-    """A cross-platform file-system lock to serialize concurrent file access.
+    """Deprecated: Use utils.locks.RepositoryLock, which the orchestrator now holds per run.
+
+    A cross-platform file-system lock to serialize concurrent file access.
 
     Creates a temporary lock file atomically using O_CREAT | O_EXCL.
     Retries with exponential backoff if the lock is held, up to the timeout budget.
@@ -0,0 +1,39 @@
+# implements: FR-011
+# traces_to: Π.3.1
+
+"""Deterministic file partitioning for distributed (multi-runner) compliance checks.
+
+A file's shard depends only on its normalized project path, never on the rest of the
+file set, so a file lands on the same CI runner on every run and that runner's result
+cache stays warm.
+"""
+
+import hashlib
+from typing import Iterable, List, Tuple
+
+from .path import normalize_project_path
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """Parse an ``INDEX/TOTAL`` shard spec (1-based) into ``(index, total)``."""
+    try:
+        index_str, total_str = value.split("/", 1)
+        index, total = int(index_str), int(total_str)
+    except ValueError:
+        raise ValueError(f"Invalid shard '{value}': expected INDEX/TOTAL, e.g. 2/8") from None
+    if total < 1 or not 1 <= index <= total:
+        raise ValueError(f"Invalid shard '{value}': INDEX must be between 1 and TOTAL")
+    return index, total
+
+
+def shard_of(file_path: str, total: int) -> int:
+    """Stable 1-based shard index for a file."""
+    digest = hashlib.sha256(normalize_project_path(file_path).encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % total + 1
+
+
+def select_shard(files: Iterable[str], index: int, total: int) -> List[str]:
+    """Keep the files (in order) that belong to shard ``index`` of ``total``."""
+    if total == 1:
+        return list(files)
+    return [f for f in files if shard_of(f, total) == index]
@@ -0,0 +1,99 @@
+# implements: FR-017
+# traces_to: Π.3.1
+
+"""Read-once source file loading shared by all compliance engines.
+
+The orchestrator loads each input file exactly once per run (raw bytes, decoded
+UTF-8 text and a stat fingerprint) and hands the resulting immutable ``SourceFile``
+objects to every engine, instead of each engine re-opening and re-decoding the
+same file.
+"""
+
+import hashlib
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from .path import normalize_project_path
+
+
+@dataclass(frozen=True)
+class SourceFile:
+    """Immutable snapshot of a file's content taken at load time.
+
+    ``exists`` is False when the file is missing or unreadable; ``text`` is None when
+    the content is not valid UTF-8.
+    """
+
+    path: str
+    norm_path: str
+    data: bytes
+    text: Optional[str]
+    digest: str
+    size: int
+    mtime_ns: int
+    exists: bool = True
+
+    @property
+    def suffix(self) -> str:
+        return Path(self.norm_path).suffix.lower()
+
+    @classmethod
+    def load(cls, path: str) -> "SourceFile":
+        """Read a file once, capturing its bytes, decoded text and stat fingerprint."""
+        norm_path = normalize_project_path(path)
+        try:
+            with open(path, "rb") as f:
+                st = os.fstat(f.fileno())
+                data = f.read()
+        except OSError:
+            return cls(path=path, norm_path=norm_path, data=b"", text=None, digest="", size=0, mtime_ns=0, exists=False)
+
+        try:
+            text: Optional[str] = data.decode("utf-8")
+        except UnicodeDecodeError:
+            text = None
+
+        return cls(
+            path=path,
+            norm_path=norm_path,
+            data=data,
+            text=text,
+            digest=hashlib.sha256(data).hexdigest(),
+            size=st.st_size,
+            mtime_ns=st.st_mtime_ns,
+        )
+
+
+class SourceCache:
+    """Per-run memo of loaded ``SourceFile`` objects keyed by normalized project path.
+
+    Engines that need files outside their input set (e.g. the test file mapped to an
+    implementation module) load them through the same cache so every file is read at
+    most once per run.
+    """
+
+    def __init__(self) -> None:
+        self._files: Dict[str, SourceFile] = {}
+
+    def get(self, path: str) -> SourceFile:
+        """Return the cached snapshot for ``path``, loading it on first access."""
+        key = normalize_project_path(path)
+        source = self._files.get(key)
+        if source is None:
+            source = SourceFile.load(path)
+            self._files[key] = source
+        return source
+
+    def load_many(self, paths: Iterable[str]) -> List[SourceFile]:
+        """Load every path (in order), reusing snapshots already in the cache."""
+        return [self.get(p) for p in paths]
+
+    @property
+    def bytes_read(self) -> int:
+        """Total size of the file contents loaded so far."""
+        return sum(source.size for source in self._files.values())
+
+    def __len__(self) -> int:
+        return len(self._files)
@@ -0,0 +1,158 @@
+# implements: FR-002
+# traces_to: Π.3.1
+
+"""Indexed mapping from implementation modules to their test files.
+
+``TestFileIndex`` enumerates the test roots once (one directory walk instead of a
+``stat`` per candidate path per module) and resolves each module with dictionary
+lookups. Mapping patterns use these placeholders:
+
+- ``{name}`` / ``{stem}``: the module's file name with / without its suffix;
+- ``{package}``: the module's directory below ``src/`` (``ade_compliance/engines``);
+- ``{subpackage}``: the same without the top-level package (``engines``).
+
+A pattern without ``/`` is a file name matched anywhere under a test root; when
+several files share it, the one whose directories best mirror the module's package
+wins (``tests/unit/engines/test_x.py`` for ``src/ade_compliance/engines/x.py``). A
+pattern with ``/`` is a path relative to a test root. Patterns are tried in order.
+"""
+
+import os
+import posixpath
+import re
+import string
+from typing import Dict, Iterable, List, Optional, Set
+
+from .path import normalize_project_path
+
+DEFAULT_TEST_ROOTS = ("tests",)
+DEFAULT_TEST_PATTERNS = ("test_{name}", "test_{stem}_unit.py")
+
+PATTERN_FIELDS = ("name", "stem", "package", "subpackage")
+
+# Directories never searched for tests
+_SKIPPED_DIRS = {"__pycache__", "node_modules"}
+
+
+def validate_pattern(pattern: str) -> str:
+    """Return ``pattern`` if it only uses known placeholders, else raise ValueError."""
+    try:
+        pattern.format(**{field: "x" for field in PATTERN_FIELDS})
+    except (KeyError, IndexError, ValueError) as e:
+        raise ValueError(
+            f"test pattern '{pattern}' may only use the placeholders {', '.join('{' + f + '}' for f in PATTERN_FIELDS)}"
+        ) from e
+    return pattern
+
+
+def _module_fields(norm_path: str) -> Dict[str, str]:
+    directory, _, name = norm_path.rpartition("/")
+    dirs = directory.split("/") if directory else []
+    if dirs and dirs[0] == "src":
+        dirs = dirs[1:]
+    return {
+        "name": name,
+        "stem": name.rsplit(".", 1)[0],
+        "package": "/".join(dirs),
+        "subpackage": "/".join(dirs[1:]),
+    }
+
+
+def _mirror_depth(test_dirs: List[str], package_dirs: List[str]) -> int:
+    """Number of trailing directories the test file shares with the module's package."""
+    depth = 0
+    for test_dir, package_dir in zip(reversed(test_dirs), reversed(package_dirs), strict=False):
+        if test_dir != package_dir:
+            break
+        depth += 1
+    return depth
+
+
+class TestFileIndex:
+    """Test files under the test roots, indexed by file name and by path."""
+
+    __test__ = False
+
+    def __init__(
+        self, roots: Iterable[str] = DEFAULT_TEST_ROOTS, patterns: Iterable[str] = DEFAULT_TEST_PATTERNS
+    ) -> None:
+        self.roots = [normalize_project_path(root) for root in roots]
+        self.patterns = list(patterns)
+        self.paths: Set[str] = set()
+        self._by_name: Dict[str, List[str]] = {}
+        for root in self.roots:
+            self._scan(root)
+        for matches in self._by_name.values():
+            matches.sort()
+
+    def _scan(self, root: str) -> None:
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if d not in _SKIPPED_DIRS and not d.startswith(".")]
+            prefix = normalize_project_path(dirpath)
+            for filename in filenames:
+                path = f"{prefix}/{filename}"
+                self.paths.add(path)
+                self._by_name.setdefault(filename, []).append(path)
+
+    def find(self, impl_path: str) -> Optional[str]:
+        """The test file mapped to an implementation module, or None."""
+        fields = _module_fields(normalize_project_path(impl_path))
+        for pattern in self.patterns:
+            target = pattern.format(**fields)
+            if "/" in target:
+                for root in self.roots:
+                    candidate = posixpath.normpath(f"{root}/{target}")
+                    if candidate in self.paths:
+                        return candidate
+                continue
+            matches = self._by_name.get(target)
+            if not matches:
+                continue
+            if len(matches) == 1:
+                return matches[0]
+            package_dirs = fields["package"].split("/")
+            return min(
+                matches,
+                key=lambda path: (
+                    -_mirror_depth(path.split("/")[:-1], package_dirs),
+                    path.count("/"),
+                    path,
+                ),
+            )
+        return None
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+
+def _stem_regex(pattern: str) -> Optional["re.Pattern[str]"]:
+    """Regex over a test file name capturing the module stem, or None if the name does not encode it."""
+    name = pattern.rsplit("/", 1)[-1]
+    if "{stem}" not in name and "{name}" not in name:
+        return None
+    regex = ""
+    seen: Set[str] = set()
+    for literal, field, _, _ in string.Formatter().parse(name):
+        regex += re.escape(literal)
+        if field in ("stem", "name"):
+            regex += f"(?P={field})" if field in seen else f"(?P<{field}>.+?)"
+            seen.add(field)
+        elif field:
+            regex += r"[^/]*?"
+    return re.compile(regex + r"\Z")
+
+
+def stems_for_test_file(test_path: str, patterns: Iterable[str] = DEFAULT_TEST_PATTERNS) -> Set[str]:
+    """Module stems a test file may be mapped to under ``patterns`` (the reverse of ``find``)."""
+    filename = normalize_project_path(test_path).rsplit("/", 1)[-1]
+    stems: Set[str] = set()
+    for pattern in patterns:
+        regex = _stem_regex(pattern)
+        match = regex.match(filename) if regex else None
+        if match is None:
+            continue
+        groups = match.groupdict()
+        stem = groups.get("stem") or groups.get("name", "").rsplit(".", 1)[0]
+        if stem:
+            stems.add(stem)
+    return stems
@@ -0,0 +1,208 @@
+# implements: FR-006
+# traces_to: Π.3.1
+
+"""File-system change watchers for watch mode.
+
+``InotifyWatcher`` binds the Linux inotify API through ``ctypes`` (no extra
+dependency) and watches every directory under the roots; ``PollingWatcher`` is the
+portable fallback that compares ``(mtime_ns, size)`` snapshots. Both expose
+``wait(timeout)``, returning the set of changed paths, an empty set on timeout, or
+None when events were lost and the caller must rescan everything.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .path import SOURCE_FILE_SUFFIXES
+
+# Directory names never watched: VCS metadata, our own state directory, caches
+IGNORED_DIRS = {".git", ".hg", ".svn", ".ade_compliance", "__pycache__", "node_modules", ".venv", "venv"}
+
+# Files the polling watcher snapshots: sources plus Markdown specifications
+_POLLED_SUFFIXES = SOURCE_FILE_SUFFIXES + (".md",)
+
+# inotify(7) constants
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def _walk_dirs(root: str) -> Iterable[Tuple[str, List[str]]]:
+    """Yield ``(directory, file names)`` under ``root``, skipping ignored directories."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in IGNORED_DIRS]
+        yield dirpath, filenames
+
+
+def _join(directory: str, name: str) -> str:
+    return os.path.join(directory, name).replace("\\", "/")
+
+
+class PollingWatcher:
+    """Portable watcher comparing stat snapshots of source, specification and single-file roots every ``wait`` call."""
+
+    name = "polling"
+
+    def __init__(self, roots: Iterable[str]):
+        self.roots = list(roots)
+        self._snapshot = self._scan()
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        snapshot: Dict[str, Tuple[int, int]] = {}
+        for root in self.roots:
+            # Roots that are not directories are single files, which may not exist yet
+            paths = [] if os.path.isdir(root) else [root.replace("\\", "/")]
+            if not paths:
+                for dirpath, filenames in _walk_dirs(root):
+                    paths.extend(_join(dirpath, f) for f in filenames if f.endswith(_POLLED_SUFFIXES))
+            for path in paths:
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                snapshot[path] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    def wait(self, timeout: float) -> Optional[Set[str]]:
+        time.sleep(timeout)
+        current = self._scan()
+        previous, self._snapshot = self._snapshot, current
+        return {p for p in previous.keys() | current.keys() if previous.get(p) != current.get(p)}
+
+    def close(self) -> None:
+        pass
+
+
+def _load_libc() -> ctypes.CDLL:
+    libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    # Raises AttributeError on platforms without inotify
+    libc.inotify_init1.argtypes = [ctypes.c_int]
+    libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    return libc
+
+
+class InotifyWatcher:
+    """Linux inotify watcher over every (non-ignored) directory beneath the roots."""
+
+    name = "inotify"
+
+    def __init__(self, roots: Iterable[str]):
+        self._libc = _load_libc()
+        self._fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self._dirs: Dict[int, str] = {}
+        try:
+            for root in roots:
+                if os.path.isdir(root):
+                    for dirpath, _ in _walk_dirs(root):
+                        self._add(dirpath)
+                elif os.path.isdir(os.path.dirname(root) or "."):
+                    # Single files (possibly not created yet) are watched through their directory
+                    self._add(os.path.dirname(root) or ".")
+        except BaseException:
+            self.close()
+            raise
+
+    def _add(self, directory: str) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_add_watch({directory}): {os.strerror(err)}")
+        self._dirs[wd] = directory.replace("\\", "/")
+
+    def _add_tree(self, directory: str, changed: Set[str]) -> None:
+        # Files created together with a new directory may predate its watch; report them too
+        for dirpath, filenames in _walk_dirs(directory):
+            self._add(dirpath)
+            changed.update(_join(dirpath, f) for f in filenames)
+
+    def wait(self, timeout: float) -> Optional[Set[str]]:
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        changed: Set[str] = set()
+        if not ready:
+            return changed
+
+        overflow = False
+        while True:
+            try:
+                buf = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(buf):
+                wd, mask, _, name_len = _EVENT_HEADER.unpack_from(buf, offset)
+                offset += _EVENT_HEADER.size
+                name = buf[offset : offset + name_len].split(b"\0", 1)[0]
+                offset += name_len
+
+                if mask & _IN_Q_OVERFLOW:
+                    overflow = True
+                    continue
+                directory = self._dirs.get(wd)
+                if mask & _IN_IGNORED:
+                    self._dirs.pop(wd, None)
+                    continue
+                if directory is None or not name:
+                    continue
+                path = _join(directory, os.fsdecode(name))
+                if mask & _IN_ISDIR:
+                    if os.path.basename(path) in IGNORED_DIRS:
+                        continue
+                    if mask & (_IN_CREATE | _IN_MOVED_TO):
+                        try:
+                            self._add_tree(path, changed)
+                        except OSError:
+                            overflow = True
+                    elif mask & (_IN_DELETE | _IN_MOVED_FROM):
+                        # Contents of a removed directory are unknown here; rescan
+                        overflow = True
+                    continue
+                changed.add(path)
+        return None if overflow else changed
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def create_watcher(roots: Iterable[str], polling: bool = False):
+    """Return an inotify watcher where supported, otherwise (or if forced) a polling watcher."""
+    roots = list(roots)
+    if not polling:
+        try:
+            return InotifyWatcher(roots)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(roots)
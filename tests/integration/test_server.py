@@ -3,6 +3,8 @@
 Tests the FastAPI server endpoints using TestClient.
 """
 
+import json
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -12,7 +14,11 @@ from ade_compliance.server import create_app
 @pytest.fixture
 def client(tmp_path):
     """Create a test client with a temporary config."""
-    app = create_app(config_path=None, audit_path=str(tmp_path / "test_audit.sqlite").replace("\\", "/"))
+    app = create_app(
+        config_path=None,
+        audit_path=str(tmp_path / "test_audit.sqlite").replace("\\", "/"),
+        cache_path=str(tmp_path / "cache").replace("\\", "/"),
+    )
     return TestClient(app)
 
 
@@ -46,6 +52,47 @@ class TestCheckEndpoint:
         data = response.json()
         assert data["violations"] == []
 
+    def test_check_stream_returns_ndjson(self, client):
+        """POST /check/stream should emit one line per file and a final summary line."""
+        response = client.post("/check/stream", json={"files": ["src/ade_compliance/cli.py"]})
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        files = [line for line in lines if line["event"] == "file"]
+        assert any(line["file_path"] == "src/ade_compliance/cli.py" for line in files)
+        assert "timings_ms" in files[0]
+        assert lines[-1]["event"] == "complete"
+        assert lines[-1]["files_checked"] == 1
+
+
+class TestTraceabilityEndpoint:
+    """Reverse traceability lookups served from the trace index."""
+
+    def test_traceability_lists_linked_files(self, client, tmp_path):
+        from ade_compliance.models import TraceLink
+        from ade_compliance.services.trace_index import TraceIndex
+
+        index = TraceIndex(tmp_path / "trace.sqlite")
+        link = TraceLink(source="src/ade_compliance/cli.py", target="FR-011", type="implements", symbol="main")
+        index.update([("src/ade_compliance/cli.py", "hash", [link]), ("src/deleted.py", "hash", [link])], "fp")
+        client.app.state.trace_index = index
+
+        response = client.get("/traceability/FR-011")
+        assert response.status_code == 200
+        data = response.json()
+        # Links from files that no longer exist are left out, but not deleted by the GET
+        assert data == {
+            "target": "FR-011",
+            "links": [{"source": "src/ade_compliance/cli.py", "symbol": "main", "type": "implements"}],
+            "count": 1,
+        }
+        assert client.get("/traceability/FR-404").json()["count"] == 0
+        assert len(index) == 2
+
+    def test_traceability_disabled_returns_503(self, client):
+        client.app.state.trace_index = None
+        assert client.get("/traceability/FR-011").status_code == 503
+
 
 class TestAttestEndpoint:
     """T062: Attest endpoint tests."""
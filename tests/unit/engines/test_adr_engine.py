@@ -83,12 +83,14 @@ def test_adr_engine_architectural_change_with_adr_failure(mock_run):
     assert "Validation error" in violations[0].message
 
 
-def test_orchestrator_loads_adr_engine():
+def test_orchestrator_loads_adr_engine(tmp_path):
     """Verify that the Orchestrator initializes ADREngine when configured."""
     from ade_compliance.config import Config
     from ade_compliance.services.orchestrator import Orchestrator
 
     cfg = Config()
+    cfg.global_settings.audit_path = str(tmp_path / "audit.sqlite")
+    cfg.global_settings.cache_path = str(tmp_path / "cache")
     cfg.engines.adr.enabled = True
 
     orch = Orchestrator(cfg)
@@ -17,3 +17,30 @@ def test_base_engine_should_run():
     config_disabled = EngineConfig(enabled=False)
     engine_disabled = DummyEngine(config_disabled)
     assert engine_disabled.should_run() is False
+
+
+def test_legacy_check_engine_served_through_check_sources():
+    import asyncio
+
+    from ade_compliance.utils.source import SourceFile
+
+    seen = []
+
+    class LegacyEngine(BaseEngine):
+        async def check(self, files):
+            seen.extend(files)
+            return []
+
+    engine = LegacyEngine(EngineConfig())
+    asyncio.run(engine.check_sources([SourceFile.load("does/not/exist.py")]))
+    assert seen == ["does/not/exist.py"]
+
+
+def test_engine_without_entry_point_raises():
+    import asyncio
+
+    import pytest
+
+    engine = BaseEngine(EngineConfig())
+    with pytest.raises(NotImplementedError):
+        asyncio.run(engine.check(["a.py"]))
@@ -0,0 +1,62 @@
+# implements: FR-002
+# traces_to: Π.2.1
+
+import pytest
+
+from ade_compliance.config import Config, EngineConfig, GlobalSettings
+from ade_compliance.engines.coverage_engine import CoverageEngine
+from ade_compliance.services.orchestrator import Orchestrator
+
+REPORT = """<?xml version="1.0" ?>
+<coverage>
+  <packages><package name="pkg"><classes>
+    <class filename="src/low.py"><lines>
+      <line number="1" hits="1"/><line number="2" hits="0"/><line number="3" hits="0"/><line number="4" hits="0"/>
+    </lines></class>
+    <class filename="src/high.py"><lines><line number="1" hits="1"/></lines></class>
+  </classes></package></packages>
+</coverage>
+"""
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "src").mkdir()
+    for name in ("low.py", "high.py", "other.py"):
+        (tmp_path / "src" / name).write_text("x = 1\n", encoding="utf-8")
+    (tmp_path / "coverage.xml").write_text(REPORT, encoding="utf-8")
+    return tmp_path
+
+
+@pytest.mark.asyncio
+async def test_reports_files_below_threshold(project):
+    engine = CoverageEngine(EngineConfig(min_coverage=80))
+    violations = await engine.check(["src/low.py", "src/high.py", "src/other.py"])
+
+    assert [(v.axiom_id, v.file_path) for v in violations] == [("Π.2.1", "src/low.py")]
+    assert violations[0].message == "Line coverage 25.0% is below the minimum of 80% (1/4 lines covered)"
+    assert engine.cache_key_extra("src/low.py").startswith("coverage:")
+
+
+@pytest.mark.asyncio
+async def test_skipped_without_threshold_or_data(project):
+    assert not CoverageEngine(EngineConfig()).should_run()
+    (project / "coverage.xml").unlink()
+    engine = CoverageEngine(EngineConfig(min_coverage=80))
+    assert not engine.should_run()
+    assert await engine.check(["src/low.py"]) == []
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_applies_test_min_coverage(project):
+    config = Config(global_settings=GlobalSettings(audit_path=":memory:", cache_path=str(project / "cache")))
+    for name in ("spec", "adr", "trace", "forbidden_api"):
+        getattr(config.engines, name).enabled = False
+    config.engines.test.min_coverage = 50
+
+    report = await Orchestrator(config).run(["src/low.py", "src/high.py"])
+    coverage = [v for v in report.violations if "Line coverage" in v.message]
+    assert [v.file_path for v in coverage] == ["src/low.py"]
+    assert "minimum of 50%" in coverage[0].message
+    assert "CoverageEngine" in {check["engine"] for check in report.checks_run}
@@ -11,7 +11,7 @@ import textwrap
 
 import pytest
 
-from ade_compliance.config import EngineConfig
+from ade_compliance.config import EngineConfig, ForbiddenAPIConfig, ForbiddenAPIRule
 from ade_compliance.engines.forbidden_api_engine import ForbiddenAPIEngine
 
 
@@ -241,6 +241,99 @@ class TestCleanFile:
         assert len(sleep_violations) == 0
 
 
+# --------------------------------------------------------------------------
+# 6b. Import aliases
+# --------------------------------------------------------------------------
+class TestImportAliases:
+    """Verify calls are resolved through `import X as Y` and `from X import Y as Z` aliases."""
+
+    def test_detect_aliased_module_calls(self, engine):
+        """t.sleep() after `import time as t` should be flagged as the time module's sleep."""
+        code = textwrap.dedent(f"""\
+            import time as t
+            from datetime import datetime as dt
+            import urllib.request as ur
+
+            def test_x():
+                t.{"sleep"}(1)
+                dt.now()
+                ur.urlopen("http://example.com")
+        """)
+        messages = [v.message for v in engine.scan_source(code, "tests/test_alias.py")]
+        assert len(messages) == 3
+        assert messages[0].startswith(f"Forbidden API call: t.{'sleep'}() (time.{'sleep'}) at line 6.")
+        assert "dt.now() (datetime.datetime.now)" in messages[1]
+        assert "ur.urlopen() (urllib.request.urlopen)" in messages[2]
+
+    def test_detect_nested_calls(self, engine):
+        """Calls inside arguments and call targets are visited too."""
+        code = textwrap.dedent(f"""\
+            import time
+            import requests
+
+            def test_x():
+                print(time.{"sleep"}(1))
+                requests.{"get"}(str(time.{"sleep"}(2))).json()
+        """)
+        lines = sorted(v.message.split(" at line ")[1][0] for v in engine.scan_source(code, "tests/test_nested.py"))
+        assert lines == ["5", "6", "6"]
+
+    def test_random_rules_do_not_match_other_objects(self, engine):
+        """Only the random module itself needs seeding: numpy and attributes named random are not flagged."""
+        code = textwrap.dedent("""\
+            import numpy as np
+
+            def test_x(self):
+                np.random.choice([1, 2])
+                self.random.shuffle([1, 2])
+        """)
+        assert engine.scan_source(code, "tests/test_numpy.py") == []
+
+    def test_chained_attribute_calls_still_match(self, engine):
+        """A sleep call through obj.time is flagged by the time rule, as before alias resolution."""
+        code = textwrap.dedent(f"""\
+            def test_x(obj):
+                obj.time.{"sleep"}(1)
+        """)
+        messages = [v.message for v in engine.scan_source(code, "tests/test_obj.py")]
+        assert len(messages) == 1
+        assert messages[0].startswith(f"Forbidden API call: obj.time.{'sleep'}() at line 2.")
+
+    def test_aliased_random_and_seed(self, engine):
+        """Aliased random calls are flagged unless seeded, under any alias and in any order."""
+        unseeded = textwrap.dedent("""\
+            def test_x():
+                return r.randint(1, 6)
+
+            import random as r
+        """)
+        messages = [v.message for v in engine.scan_source(unseeded, "tests/test_rng.py")]
+        assert messages == [
+            "Forbidden API call: r.randint() (random.randint) at line 2. "
+            "Unseeded random call (seed with random.seed() for determinism)"
+        ]
+
+        seeded = textwrap.dedent("""\
+            import random as r
+            from random import seed as reseed
+
+            def test_x():
+                reseed(7)
+                return r.randint(1, 6)
+        """)
+        assert engine.scan_source(seeded, "tests/test_rng.py") == []
+
+    def test_shadowing_import_is_not_flagged(self, engine):
+        """A local name bound to another module does not match the forbidden table."""
+        code = textwrap.dedent(f"""\
+            import mytimer as time
+
+            def test_x():
+                time.{"sleep"}(1)
+        """)
+        assert engine.scan_source(code, "tests/test_shadow.py") == []
+
+
 # --------------------------------------------------------------------------
 # 7. Non-test files skipped
 # --------------------------------------------------------------------------
@@ -328,3 +421,48 @@ class TestViolationMetadata:
         assert len(sleep_violations) == 1
         # Line 4 contains the sleep call
         assert "line 4" in sleep_violations[0].message.lower()
+
+
+# --------------------------------------------------------------------------
+# 11. Configured rules
+# --------------------------------------------------------------------------
+class TestConfiguredRules:
+    """Verify project rules from .ade-compliance.yml extend and trim the built-in table."""
+
+    @pytest.fixture
+    def configured(self):
+        config = ForbiddenAPIConfig(
+            rules=[
+                ForbiddenAPIRule(call="subprocess.run", reason="Use the runner fixture"),
+                ForbiddenAPIRule(call="os.environ"),
+            ],
+            allow=["os.system"],
+        )
+        return ForbiddenAPIEngine(config)
+
+    def test_project_rules_and_allowances(self, configured):
+        code = textwrap.dedent("""\
+            import os
+            import subprocess as sp
+            from subprocess import run
+
+            def test_x():
+                sp.run(["ls"])
+                run(["ls"])
+                os.environ.get("HOME")
+                os.system("ls")
+                os.getcwd()
+        """)
+        messages = [v.message for v in configured.scan_source(code, "tests/test_cfg.py")]
+        assert messages == [
+            "Forbidden API call: sp.run() (subprocess.run) at line 6. Use the runner fixture",
+            "Forbidden API call: run() (from subprocess) at line 7. Use the runner fixture",
+            "Forbidden API call: os.environ.get() at line 8. Forbidden API call in test",
+        ]
+
+    def test_rule_index_compiled_once_per_table(self, configured, engine):
+        again = ForbiddenAPIEngine(configured.config.model_copy(deep=True))
+        assert again.rules is configured.rules
+        assert ForbiddenAPIEngine(EngineConfig()).rules is engine.rules
+        assert configured.rules.digest != engine.rules.digest
+        assert configured.fingerprint() != engine.fingerprint()
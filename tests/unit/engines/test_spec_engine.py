@@ -1,9 +1,7 @@
-from unittest.mock import Mock, patch
-
 import pytest
 
 from ade_compliance.config import EngineConfig
-from ade_compliance.engines.spec_engine import SpecEngine
+from ade_compliance.engines.spec_engine import SpecEngine, SpecPresenceEngine, declared_requirements
 
 
 @pytest.fixture
@@ -12,19 +10,80 @@ def spec_engine():
     return SpecEngine(config)
 
 
+@pytest.fixture
+def presence_engine():
+    config = EngineConfig(enabled=True, strictness="warn")
+    return SpecPresenceEngine(config)
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.mark.asyncio
+async def test_check_no_spec_file(presence_engine, spec_engine, project):
+    violations = await presence_engine.check(["src/main.py"])
+    assert len(violations) == 1
+    assert violations[0].axiom_id == "Π.1.1"
+    assert violations[0].file_path == "."
+    assert violations[0].message == "No specification found"
+    # Reported once for the repository, not per file
+    assert await spec_engine.check(["src/main.py"]) == []
+
+
 @pytest.mark.asyncio
-async def test_check_no_spec_file(spec_engine):
-    # Mock file system to return empty
-    with patch("pathlib.Path.glob", return_value=[]):
-        violations = await spec_engine.check(["src/main.py"])
-        assert len(violations) == 1
-        assert violations[0].axiom_id == "Π.1.1"
-        assert violations[0].message == "No specification found"
+async def test_check_valid_spec(presence_engine, spec_engine, project):
+    (project / "specs" / "001-app").mkdir(parents=True)
+    (project / "specs" / "001-app" / "spec.md").write_text("# App\n", encoding="utf-8")
+    assert await presence_engine.check(["src/main.py"]) == []
+    violations = await spec_engine.check(["src/main.py"])
+    assert len(violations) == 0  # Should pass
 
 
 @pytest.mark.asyncio
-async def test_check_valid_spec(spec_engine):
-    with patch("pathlib.Path.glob", return_value=[Mock()]):
-        # Mock glob finding a file
-        violations = await spec_engine.check(["src/main.py"])
-        assert len(violations) == 0  # Should pass
+async def test_spec_added_between_runs_is_picked_up(presence_engine, project):
+    assert len(await presence_engine.check(["src/main.py"])) == 1
+    (project / "spec.md").write_text("# App\n", encoding="utf-8")
+    assert await presence_engine.check(["src/main.py"]) == []
+
+
+@pytest.mark.asyncio
+async def test_undefined_requirement_names_governing_spec(spec_engine, project):
+    feature = project / "specs" / "001-billing"
+    feature.mkdir(parents=True)
+    (feature / "spec.md").write_text("## Requirements\n- **FR-001**: Invoices\n", encoding="utf-8")
+    (project / "src" / "billing").mkdir(parents=True)
+    (project / "src" / "billing" / "ok.py").write_text("# implements: FR-001\n", encoding="utf-8")
+    (project / "src" / "billing" / "new.py").write_text("# implements: FR-001, FR-002\n", encoding="utf-8")
+
+    violations = await spec_engine.check(["src/billing/ok.py", "src/billing/new.py"])
+    assert [(v.file_path, v.message) for v in violations] == [
+        (
+            "src/billing/new.py",
+            "Requirement(s) FR-002 not defined in any specification; define them in specs/001-billing/spec.md",
+        )
+    ]
+
+
+@pytest.mark.asyncio
+async def test_cache_key_follows_defined_requirements(spec_engine, project):
+    (project / "spec.md").write_text("- **FR-001**: One\n", encoding="utf-8")
+    spec_engine.begin_run()
+    before = spec_engine.cache_key_extra("src/main.py")
+    assert spec_engine.cache_key_extra("src/other.py") == before
+
+    # Edits that leave the requirements unchanged keep cached results valid
+    (project / "spec.md").write_text("# Spec\n\n- **FR-001**: One, reworded\n", encoding="utf-8")
+    spec_engine.begin_run()
+    assert spec_engine.cache_key_extra("src/main.py") == before
+
+    (project / "spec.md").write_text("- **FR-001**: One\n- **FR-002**: Two\n", encoding="utf-8")
+    spec_engine.begin_run()
+    assert spec_engine.cache_key_extra("src/main.py") != before
+
+
+def test_declared_requirements_only_reads_comment_markers():
+    text = '# implements: FR-001, FR-WP-002\n// implements: FR-003\nmarker = f"# implements: FR-00{i}"\n'
+    assert declared_requirements(text) == ["FR-001", "FR-WP-002", "FR-003"]
@@ -49,16 +49,14 @@ async def test_check_no_test_file(test_engine):
 
 
 @pytest.mark.asyncio
-async def test_determinism_check(test_engine):
-    from unittest.mock import mock_open
+async def test_determinism_check(test_engine, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "tests").mkdir()
+    # We concatenate the sleep command to prevent compliance check on this test file from matching literally
+    sleep_cmd = "time." + "sleep(1)"
+    (tmp_path / "tests" / "test_main.py").write_text(f"import time\ndef test_foo(): {sleep_cmd}", encoding="utf-8")
 
-    # Mock existing test file with sleep code
     with patch.object(TestEngine, "find_test_file", return_value="tests/test_main.py"):
-        # We concatenate the sleep command to prevent compliance check on this test file from matching literally
-        sleep_cmd = "time." + "sleep(1)"
-        m = mock_open(read_data=f"import time\ndef test_foo(): {sleep_cmd}")
-        with patch("builtins.open", m):
-            with patch("pathlib.Path.exists", return_value=True):
-                violations = await test_engine.check(["src/main.py"])
-                # Should flag non-determinism
-                assert any("Non-deterministic" in v.message for v in violations)
+        violations = await test_engine.check(["src/main.py"])
+        # Should flag non-determinism
+        assert any("Non-deterministic" in v.message for v in violations)
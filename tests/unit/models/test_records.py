@@ -0,0 +1,51 @@
+# implements: FR-003
+# traces_to: Π.2.1
+
+import pickle
+
+from ade_compliance.models import TraceLink
+from ade_compliance.models.records import LinkRecord
+
+
+def test_link_record_round_trips_through_model():
+    record = LinkRecord.create("src/a.py", "FR-001", "implements", "run")
+    model = record.to_model()
+    assert isinstance(model, TraceLink)
+    assert model == TraceLink(source="src/a.py", target="FR-001", type="implements", symbol="run")
+    assert LinkRecord.from_model(model) == record
+    assert pickle.loads(pickle.dumps(record)) == record
+
+
+def test_link_record_interns_strings():
+    first = LinkRecord.create("src/" + "a.py", "FR-" + "001", "imple" + "ments")
+    second = LinkRecord.create("".join(["src/", "a.py"]), "".join(["FR-", "001"]), "".join(["imple", "ments"]))
+    assert first.source is second.source
+    assert first.target is second.target
+    assert first.type is second.type
+    assert first.symbol is None
+    assert not hasattr(first, "__dict__")
+
+
+def test_trace_matrix_dedupes_and_nests():
+    from ade_compliance.models.records import TraceMatrix
+
+    matrix = TraceMatrix(
+        [
+            LinkRecord.create("src/a.py", "FR-001", "implements", "run"),
+            LinkRecord.create("src/a.py", "FR-001", "IMPLEMENTS", "run"),
+            LinkRecord.create("src/a.py", "FR-001", "implements"),
+            LinkRecord.create("src/a.py", "Π.3.1", "traces_to"),
+            LinkRecord.create("src/a.py", "FR-009", "unknown"),
+            LinkRecord.create("tests/test_a.py", "FR-001", "validates"),
+        ]
+    )
+    assert len(matrix) == 4
+    assert list(matrix.rows())[:2] == [
+        ("src/a.py", "implements", "FR-001", "run"),
+        ("src/a.py", "implements", "FR-001", None),
+    ]
+    assert matrix.add(LinkRecord.create("src/a.py", "FR-001", "implements", "run")) is False
+    assert matrix.to_nested() == {
+        "src/a.py": {"implements": ["FR-001 (run)", "FR-001"], "validates": [], "traces_to": ["Π.3.1"]},
+        "tests/test_a.py": {"implements": [], "validates": ["FR-001"], "traces_to": []},
+    }
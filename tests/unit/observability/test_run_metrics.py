@@ -0,0 +1,58 @@
+# implements: FR-026
+# traces_to: Π.2.1
+
+import pytest
+
+from ade_compliance.config import Config, GlobalSettings
+from ade_compliance.observability.metrics import get_metrics_output
+from ade_compliance.observability.run_metrics import RunMetrics
+from ade_compliance.services.orchestrator import Orchestrator
+
+
+def test_run_metrics_aggregates_engines_and_files():
+    metrics = RunMetrics(top_files=2)
+    metrics.record_engine("TraceEngine", 0.5)
+    metrics.record_file("TraceEngine", "src/a.py", 0.3, 0.2, violations=1)
+    metrics.record_file("TraceEngine", "src/b.py", 0.1, 0.1, violations=0)
+    metrics.record_file("TestEngine", "src/a.py", 0.2, 0.2, violations=2)
+    metrics.record_file("TestEngine", "src/c.py", 0.0, 0.0, violations=0)
+    metrics.record_cache("TraceEngine", hits=3, misses=1)
+
+    checks = {c["engine"]: c for c in metrics.checks_run()}
+    assert checks["TraceEngine"]["files"] == 2
+    assert checks["TraceEngine"]["duration_ms"] == 500.0
+    assert checks["TraceEngine"]["cpu_ms"] == pytest.approx(300.0)
+    assert checks["TestEngine"]["violations"] == 2
+
+    summary = metrics.summary()
+    assert summary["cache"] == {"hits": 3, "misses": 1, "hit_rate": 0.75}
+    assert [f["file_path"] for f in summary["slowest_files"]] == ["src/a.py", "src/b.py"]
+
+    metrics.publish()
+    data, _ = get_metrics_output()
+    assert b'engine_duration_seconds_count{engine="TraceEngine"}' in data
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_fills_report_instrumentation(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "a.py").write_text("# implements: FR-001\ndef a():\n    pass\n", encoding="utf-8")
+    (tmp_path / "src" / "b.py").write_text("def b():\n    pass\n", encoding="utf-8")
+
+    config = Config(global_settings=GlobalSettings(audit_path=":memory:", cache_path=str(tmp_path / "cache")))
+    config.engines.adr.enabled = False
+
+    report = await Orchestrator(config).run(["src/a.py", "src/b.py"])
+    assert report.check_duration_ms >= 0
+    engines = [c["engine"] for c in report.checks_run]
+    assert engines == ["SpecPresenceEngine", "SpecEngine", "TestEngine", "TraceEngine", "ForbiddenAPIEngine"]
+    trace = next(c for c in report.checks_run if c["engine"] == "TraceEngine")
+    assert trace["files"] == 2
+    assert trace["cache_misses"] == 2
+    assert report.metrics["files_processed"] == 2
+    assert report.metrics["bytes_read"] > 0
+    assert len(report.metrics["slowest_files"]) <= 10
+
+    second = await Orchestrator(config).run(["src/a.py", "src/b.py"])
+    assert second.metrics["cache"]["hits"] == 8
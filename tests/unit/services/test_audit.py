@@ -80,3 +80,30 @@ def test_verify_chain_tampered_previous_hash(audit_service):
     success, errors = audit_service.verify_chain()
     assert success is False
     assert len(errors) > 0
+
+
+def test_log_many_preserves_hash_chain(audit_service):
+    audit_service.log("BEFORE", {})
+    written = audit_service.log_many([("BATCH_1", {"b": 1, "a": 2}), ("BATCH_2", {"n": 2})])
+    audit_service.log("AFTER", {})
+
+    assert written == 2
+    assert audit_service.log_many([]) == 0
+    entries = audit_service.get_entries()
+    assert [e["action"] for e in entries] == ["AFTER", "BATCH_2", "BATCH_1", "BEFORE"]
+    assert audit_service.verify_chain() == (True, [])
+
+
+def test_audit_batch_flushes_on_exit_and_on_error(audit_service):
+    with audit_service.batch() as batch:
+        batch.log("QUEUED", {"i": 1})
+        assert len(batch) == 1
+        assert audit_service.get_entries() == []
+    assert [e["action"] for e in audit_service.get_entries()] == ["QUEUED"]
+
+    with pytest.raises(RuntimeError):
+        with audit_service.batch() as batch:
+            batch.log("BEFORE_FAILURE", {})
+            raise RuntimeError("boom")
+    assert audit_service.get_entries(limit=1)[0]["action"] == "BEFORE_FAILURE"
+    assert audit_service.verify_chain()[0] is True
@@ -0,0 +1,85 @@
+# implements: FR-026
+# traces_to: Π.2.1
+
+import pytest
+
+from ade_compliance.config import Config, GlobalSettings
+from ade_compliance.services.cache import ResultCache
+from ade_compliance.services.orchestrator import Orchestrator
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResultCache(tmp_path / "cache")
+
+
+def test_make_key_depends_on_every_component():
+    base = ResultCache.make_key("fp", "src/a.py", "abc", "")
+    assert base == ResultCache.make_key("fp", "src/a.py", "abc", "")
+    assert base != ResultCache.make_key("fp2", "src/a.py", "abc", "")
+    assert base != ResultCache.make_key("fp", "src/b.py", "abc", "")
+    assert base != ResultCache.make_key("fp", "src/a.py", "def", "")
+    assert base != ResultCache.make_key("fp", "src/a.py", "abc", "test:none")
+
+
+def test_put_and_get_many(cache):
+    cache.put_many([("k1", "TraceEngine", "src/a.py", {"violations": []})])
+    assert cache.get_many(["k1", "missing"]) == {"k1": {"violations": []}}
+
+
+def test_put_replaces_previous_entry_for_same_file(cache):
+    cache.put_many([("old", "TraceEngine", "src/a.py", {"violations": []})])
+    cache.put_many([("new", "TraceEngine", "src/a.py", {"violations": []})])
+    assert cache.get_many(["old", "new"]).keys() == {"new"}
+    assert cache.stats()["entries"] == 1
+
+
+def test_stats_accumulate_across_flushes(cache):
+    cache.record("TraceEngine", hits=3, misses=1)
+    cache.flush_stats()
+    cache.record("TraceEngine", hits=1)
+    cache.flush_stats()
+
+    engine_stats = cache.stats()["engines"]["TraceEngine"]
+    assert engine_stats["hits"] == 4
+    assert engine_stats["misses"] == 1
+    assert engine_stats["hit_rate"] == 0.8
+
+
+def test_prune(cache):
+    cache.put_many([("k1", "TraceEngine", "src/a.py", {"violations": []})])
+    assert cache.prune(older_than_days=1) == 0
+    assert cache.prune() == 1
+    assert cache.get_many(["k1"]) == {}
+
+
+def test_from_config_disabled(tmp_path):
+    config = Config(global_settings=GlobalSettings(cache_enabled=False, cache_path=str(tmp_path)))
+    assert ResultCache.from_config(config) is None
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_replays_unchanged_files(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "src").mkdir()
+    source = tmp_path / "src" / "mod.py"
+    source.write_text("def f():\n    return 1\n", encoding="utf-8")
+
+    config = Config(global_settings=GlobalSettings(audit_path=":memory:", cache_path=str(tmp_path / "cache")))
+    config.engines.spec.enabled = False
+    config.engines.adr.enabled = False
+
+    first = await Orchestrator(config).run(["src/mod.py"])
+    orch = Orchestrator(config)
+    second = await orch.run(["src/mod.py"])
+
+    assert [(v.axiom_id, v.message) for v in first.violations] == [(v.axiom_id, v.message) for v in second.violations]
+    stats = orch.cache.stats()["engines"]
+    assert stats["TraceEngine"]["hits"] == 1
+    assert stats["TestEngine"]["hits"] == 1
+
+    # Editing the file invalidates its entry and produces the new result
+    source.write_text("# implements: FR-001\ndef f():\n    return 1\n", encoding="utf-8")
+    third = await Orchestrator(config).run(["src/mod.py"])
+    assert not [v for v in third.violations if v.axiom_id == "Π.3.1"]
+    assert third.traceability_matrix["src/mod.py"]["implements"] == ["FR-001 (f)"]
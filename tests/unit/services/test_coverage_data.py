@@ -0,0 +1,94 @@
+# implements: FR-002
+# traces_to: Π.2.1
+
+import pytest
+
+from ade_compliance.services.coverage_data import (
+    CoverageStore,
+    FileCoverage,
+    find_data_file,
+    parse_cobertura,
+    parse_coverage_db,
+)
+
+COBERTURA = """<?xml version="1.0" ?>
+<coverage line-rate="0.6" version="7.4">
+  <sources><source>{root}</source></sources>
+  <packages>
+    <package name="pkg">
+      <classes>
+        <class name="a.py" filename="src/pkg/a.py" line-rate="0.5">
+          <methods>
+            <method name="f"><lines><line number="1" hits="1"/></lines></method>
+          </methods>
+          <lines>
+            <line number="1" hits="1"/>
+            <line number="2" hits="0"/>
+          </lines>
+        </class>
+        <class name="A$Inner" filename="src/pkg/a.py" line-rate="1">
+          <lines><line number="2" hits="3"/><line number="5" hits="0"/></lines>
+        </class>
+        <class name="b.py" filename="src/pkg/b.py" line-rate="1">
+          <lines><line number="1" hits="2"/></lines>
+        </class>
+      </classes>
+    </package>
+  </packages>
+</coverage>
+"""
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_parse_cobertura_merges_classes_per_file(project):
+    report = project / "coverage.xml"
+    report.write_text(COBERTURA.format(root=project), encoding="utf-8")
+
+    assert parse_cobertura(report) == {
+        "src/pkg/a.py": FileCoverage(covered=2, total=3),
+        "src/pkg/b.py": FileCoverage(covered=1, total=1),
+    }
+    assert find_data_file().resolve() == report.resolve()
+    assert find_data_file("missing.xml") is None
+
+
+def test_parse_coverage_db(project):
+    coverage = pytest.importorskip("coverage")
+    (project / "src").mkdir()
+    module = project / "src" / "mod.py"
+    module.write_text("def f(x):\n    if x:\n        return 1\n    return 2\n", encoding="utf-8")
+    data = coverage.CoverageData(str(project / ".coverage"))
+    data.add_lines({str(module): [1, 2, 3]})
+    data.write()
+
+    assert parse_coverage_db(project / ".coverage") == {"src/mod.py": FileCoverage(covered=3, total=4)}
+
+
+def test_store_caches_summaries_by_content_hash(project):
+    report = project / "coverage.xml"
+    report.write_text(COBERTURA.format(root=project), encoding="utf-8")
+    cache_dir = project / "cache"
+
+    store = CoverageStore(str(cache_dir))
+    first = store.load(report)
+    assert store.load(report) is first
+    assert store.parses == 1
+    assert (cache_dir / "coverage" / f"{first.digest}.json").is_file()
+
+    # A new process reuses the persisted summary for the same data
+    fresh = CoverageStore(str(cache_dir))
+    assert fresh.load(report) == first
+    assert fresh.parses == 0
+
+    report.write_text(COBERTURA.format(root=project).replace('hits="0"', 'hits="1"'), encoding="utf-8")
+    updated = fresh.load(report)
+    assert fresh.parses == 1
+    assert updated.digest != first.digest
+    assert updated.files["src/pkg/a.py"] == FileCoverage(covered=3, total=3)
+    # The summary of the replaced data is removed instead of accumulating
+    assert sorted(p.name for p in (cache_dir / "coverage").iterdir()) == [f"{updated.digest}.json"]
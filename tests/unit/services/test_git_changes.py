@@ -0,0 +1,84 @@
+# implements: FR-005
+# traces_to: Π.2.1
+
+import git
+import pytest
+
+from ade_compliance.services.git_changes import ChangeSetProvider, FileChange, parse_name_status
+
+AUTHOR = git.Actor("Dev", "dev@example.com")
+
+
+def commit(repo, message):
+    repo.index.commit(message, author=AUTHOR, committer=AUTHOR)
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    repo = git.Repo.init(tmp_path)
+    (tmp_path / "a b.py").write_text("print('a')\n" * 20, encoding="utf-8")
+    (tmp_path / "keep.py").write_text("x = 1\n", encoding="utf-8")
+    repo.index.add(["a b.py", "keep.py"])
+    commit(repo, "initial")
+    repo.git.branch("-M", "main")
+    repo.git.checkout("-b", "feature")
+    return repo
+
+
+def test_parse_name_status_keeps_rename_and_copy_sources():
+    output = "M\0src/it's here.py\0R097\0old name.py\0new name.py\0C100\0a.py\0b.py\0D\0gone.py\0"
+    assert parse_name_status(output) == [
+        FileChange("M", "src/it's here.py"),
+        FileChange("R", "new name.py", "old name.py"),
+        FileChange("C", "b.py", "a.py"),
+        FileChange("D", "gone.py"),
+    ]
+
+
+def test_change_set_covers_branch_and_working_tree(repo, tmp_path):
+    (tmp_path / "src").mkdir()
+    repo.git.mv("a b.py", "src/c d.py")
+    commit(repo, "move")
+    (tmp_path / "keep.py").write_text("x = 2\n", encoding="utf-8")
+    (tmp_path / 'new "quoted".py').write_text("y = 1\n", encoding="utf-8")
+
+    provider = ChangeSetProvider.open(str(tmp_path), bases=("main",))
+    change_set = provider.change_set()
+
+    assert change_set.head == repo.head.commit.hexsha
+    assert change_set.base == repo.rev_parse("main").hexsha
+    assert set(change_set.changes) == {
+        FileChange("R", "src/c d.py", "a b.py"),
+        FileChange("M", "keep.py"),
+        FileChange("?", 'new "quoted".py'),
+    }
+    assert sorted(provider.changed_files()) == ["keep.py", 'new "quoted".py', "src/c d.py"]
+
+
+def test_change_set_follows_index_and_commits(repo, tmp_path):
+    provider = ChangeSetProvider.open(str(tmp_path), bases=("main",))
+    assert provider.change_set().changes == ()
+
+    (tmp_path / "keep.py").write_text("x = 3\n", encoding="utf-8")
+    repo.index.add(["keep.py"])
+    assert provider.change_set().paths == ["keep.py"]
+
+    commit(repo, "edit")
+    assert provider.change_set().paths == ["keep.py"]
+    assert provider.computations == 3
+
+
+def test_open_outside_repository(tmp_path):
+    assert ChangeSetProvider.open(str(tmp_path)) is None
+
+
+def test_every_request_sees_untracked_files_and_unstaged_edits(repo, tmp_path):
+    provider = ChangeSetProvider.open(str(tmp_path), bases=("main",))
+    assert provider.changed_files() == []
+
+    # Neither touches HEAD or the index
+    (tmp_path / "keep.py").write_text("x = 4\n", encoding="utf-8")
+    (tmp_path / "new.py").write_text("y = 1\n", encoding="utf-8")
+    assert sorted(provider.changed_files()) == ["keep.py", "new.py"]
+    assert provider.computations == 2
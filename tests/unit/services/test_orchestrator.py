@@ -3,24 +3,108 @@
 
 import pytest
 
-from ade_compliance.config import Config
+from ade_compliance.config import Config, GlobalSettings
 from ade_compliance.services.orchestrator import Orchestrator
 
 
 @pytest.mark.asyncio
-async def test_orchestrator_initialization():
+async def test_orchestrator_initialization(tmp_path):
     config = Config()
     config.global_settings.audit_path = ":memory:"
+    config.global_settings.cache_path = str(tmp_path / "cache")
 
     orch = Orchestrator(config)
     assert len(orch.engines) > 0
 
 
 @pytest.mark.asyncio
-async def test_orchestrator_run_empty():
+async def test_orchestrator_run_empty(tmp_path):
     config = Config()
     config.global_settings.audit_path = ":memory:"
+    config.global_settings.cache_path = str(tmp_path / "cache")
 
     orch = Orchestrator(config)
     report = await orch.run([])
     assert len(report.violations) == 0
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_stream_yields_per_file_results(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "src").mkdir()
+    files = []
+    for i in range(12):
+        marker = "# implements: FR-001\n" if i % 2 else ""
+        (tmp_path / "src" / f"mod{i}.py").write_text(f"{marker}def f{i}():\n    pass\n", encoding="utf-8")
+        files.append(f"src/mod{i}.py")
+
+    config = Config(global_settings=GlobalSettings(audit_path=":memory:", cache_enabled=False))
+    config.engines.spec.enabled = False
+    config.engines.adr.enabled = False
+
+    results = [result async for result in Orchestrator(config).stream(files)]
+    assert [r.file_path for r in results] == files
+    assert set(results[0].timings_ms) == {"TestEngine", "TraceEngine", "ForbiddenAPIEngine"}
+    assert any(v.axiom_id == "Π.3.1" for v in results[0].violations)
+    assert results[1].trace_links[0].target == "FR-001"
+
+    report = await Orchestrator(config).run(files)
+    streamed = sorted((v.axiom_id, v.file_path) for r in results for v in r.violations)
+    assert streamed == sorted((v.axiom_id, v.file_path) for v in report.violations)
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_stream_includes_repository_wide_findings(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = Config(global_settings=GlobalSettings(audit_path=":memory:", cache_enabled=False))
+    config.engines.adr.enabled = False
+
+    results = [result async for result in Orchestrator(config).stream([])]
+    assert len(results) == 1
+    assert results[0].file_path == "."
+    assert results[0].violations[0].axiom_id == "Π.1.1"
+    assert "SpecPresenceEngine" in results[0].timings_ms
+
+
+@pytest.mark.asyncio
+async def test_files_outside_repository_feed_no_matrix_cache_or_index(tmp_path, monkeypatch):
+    repo = tmp_path / "repo"
+    (repo / "src").mkdir(parents=True)
+    (repo / "src" / "inside.py").write_text("# implements: FR-001\ndef f():\n    pass\n", encoding="utf-8")
+    outside = tmp_path / "outside.py"
+    outside.write_text("# implements: FR-002\ndef g():\n    pass\n", encoding="utf-8")
+    monkeypatch.chdir(repo)
+
+    config = Config(global_settings=GlobalSettings(audit_path=":memory:", cache_path=str(tmp_path / "cache")))
+    for name in ("spec", "test", "adr", "forbidden_api"):
+        getattr(config.engines, name).enabled = False
+    orch = Orchestrator(config)
+    report = await orch.run(["src/inside.py", str(outside), "../outside.py"])
+
+    assert list(report.traceability_matrix) == ["src/inside.py"]
+    assert orch.cache.stats()["entries"] == 1
+    assert [k.source for k in orch.trace_index.query("FR-001")] == ["src/inside.py"]
+    assert orch.trace_index.query("FR-002") == []
+
+
+@pytest.mark.asyncio
+async def test_stream_closed_early_still_records_detected_violations(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "src").mkdir()
+    files = []
+    for i in range(3):
+        (tmp_path / "src" / f"mod{i}.py").write_text(f"def f{i}():\n    pass\n", encoding="utf-8")
+        files.append(f"src/mod{i}.py")
+
+    config = Config(global_settings=GlobalSettings(audit_path=str(tmp_path / "audit.sqlite"), cache_enabled=False))
+    for name in ("spec", "trace", "adr", "forbidden_api"):
+        getattr(config.engines, name).enabled = False
+    orch = Orchestrator(config)
+
+    stream = orch.stream(files)
+    first = await anext(stream)
+    await stream.aclose()
+
+    assert first.violations
+    detected = [e for e in orch.audit.get_entries() if e["action"] == "VIOLATION_DETECTED"]
+    assert {e["details"]["file_path"] for e in detected} == {first.file_path}
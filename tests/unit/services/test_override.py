@@ -5,6 +5,7 @@ path scope matching (FILE, DIRECTORY, COMPONENT), and revocation behaviors.
 """
 
 import uuid
+from datetime import datetime
 
 import pytest
 
@@ -303,3 +304,53 @@ class TestOverrideService:
 
         assert override_service.is_override_active("Π.1.1", abs_path) is True
         assert override_service.is_override_active("Π.1.1", "./src/core/main.py") is True
+
+    def test_apply_overrides_batch(self, override_service):
+        """apply_overrides must override covered violations in one pass and skip terminal states."""
+        from ade_compliance.models.axiom import Violation, ViolationState
+
+        override_service.create_override(
+            axiom_id="Π.2.1",
+            scope_type="DIRECTORY",
+            scope_value="src/legacy",
+            rationale="This is a very long rationale of more than twenty characters.",
+            created_by="architect-1",
+        )
+        violations = [
+            Violation(axiom_id="Π.2.1", file_path="src/legacy/a.py", message="m"),
+            Violation(axiom_id="Π.2.1", file_path="src/legacyx/a.py", message="m"),
+            Violation(axiom_id="Π.3.1", file_path="src/legacy/a.py", message="m"),
+            Violation(axiom_id="Π.2.1", file_path="./src/legacy/b.py", message="m"),
+        ]
+        violations[3].override()
+
+        assert override_service.apply_overrides(violations) == 1
+        assert [v.state for v in violations] == [
+            ViolationState.OVERRIDDEN,
+            ViolationState.NEW,
+            ViolationState.NEW,
+            ViolationState.OVERRIDDEN,
+        ]
+
+    def test_override_index_cached_until_table_changes(self, override_service):
+        """The index is reused while the table is unchanged and rebuilt after create/revoke."""
+        first = override_service.get_override_index()
+        assert override_service.get_override_index() is first
+
+        o = override_service.create_override(
+            axiom_id="Π.1.1",
+            scope_type="COMPONENT",
+            scope_value="scheduler",
+            rationale="This is a very long rationale of more than twenty characters.",
+            created_by="architect-1",
+        )
+        second = override_service.get_override_index()
+        assert second is not first
+        assert len(second) == 1
+
+        # A second service on the same database observes the revocation via the version stamp
+        other = OverrideService(override_service.config)
+        with override_service.db_manager.session(override_service.config) as session:
+            entry = session.query(OverrideEntry).filter(OverrideEntry.id == o.id).first()
+            entry.revoked_at = datetime(2099, 1, 1)
+        assert other.is_override_active("Π.1.1", "src/scheduler/main.py") is False
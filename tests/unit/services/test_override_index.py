@@ -0,0 +1,59 @@
+# implements: FR-021
+# traces_to: Π.2.1
+
+from datetime import datetime, timedelta
+
+from ade_compliance.models.decision import Override
+from ade_compliance.services.override_index import OverrideIndex
+
+
+def make_override(axiom_id, scope_type, scope_value, expires_at=None, is_permanent=False):
+    now = datetime(2026, 1, 1)
+    return Override(
+        id=f"{axiom_id}-{scope_type}-{scope_value}",
+        axiom_id=axiom_id,
+        scope_type=scope_type,
+        scope_value=scope_value,
+        rationale="This is a very long rationale of more than twenty characters.",
+        created_by="architect-1",
+        created_at=now,
+        expires_at=expires_at or now + timedelta(days=90),
+        is_permanent=is_permanent,
+        permanent_justification="SSO-PR-1" if is_permanent else None,
+    )
+
+
+def test_index_matches_each_scope_type():
+    index = OverrideIndex(
+        [
+            make_override("Π.1.1", "FILE", "src/core/main.py"),
+            make_override("Π.2.1", "DIRECTORY", "src/core/"),
+            make_override("Π.3.1", "COMPONENT", "scheduler"),
+            make_override("Π.3.1", "COMPONENT", "cron"),
+        ]
+    )
+
+    assert len(index) == 4
+    assert index.matches("Π.1.1", "./src/core/main.py")
+    assert not index.matches("Π.1.1", "src/core/other.py")
+    assert index.matches("Π.2.1", "src/core")
+    assert index.matches("Π.2.1", "src/core/sub/helper.py")
+    assert not index.matches("Π.2.1", "src/corex/helper.py")
+    assert index.matches("Π.3.1", "src/jobs/crontab.py")
+    assert index.matches("Π.3.1", "src/scheduler_helper.py")
+    assert not index.matches("Π.3.1", "src/core/main.py")
+    assert not index.matches("Π.9.9", "src/core/main.py")
+
+
+def test_index_validity_tracks_earliest_expiry():
+    soon = datetime(2026, 2, 1)
+    index = OverrideIndex(
+        [
+            make_override("Π.1.1", "FILE", "a.py", expires_at=soon),
+            make_override("Π.1.1", "FILE", "b.py", expires_at=datetime(2020, 1, 1), is_permanent=True),
+        ]
+    )
+    assert index.valid_until == soon
+    assert index.is_current(soon - timedelta(seconds=1))
+    assert not index.is_current(soon)
+    assert OverrideIndex([]).is_current(datetime(2100, 1, 1))
@@ -0,0 +1,73 @@
+# implements: FR-006
+# traces_to: Π.2.1
+
+import pytest
+
+from ade_compliance.config import Config, EngineConfig, GlobalSettings
+from ade_compliance.engines.test_engine import TestEngine
+from ade_compliance.services import parallel
+from ade_compliance.services.orchestrator import Orchestrator
+from ade_compliance.services.parallel import chunk_sources, resolve_jobs
+from ade_compliance.utils.source import SourceFile
+
+
+def test_resolve_jobs():
+    assert resolve_jobs(3) == 3
+    assert resolve_jobs(0) >= 1
+
+
+def test_chunk_sources_preserves_order():
+    sources = [SourceFile.load(f"missing_{i}.py") for i in range(10)]
+    chunks = chunk_sources(sources, workers=2)
+    assert [s for chunk in chunks for s in chunk] == sources
+    assert len(chunks) > 1
+    assert chunk_sources([], workers=4) == []
+
+
+def test_worker_begins_each_run_once_with_configured_parse_budget(monkeypatch):
+    parallel._init_worker([(TestEngine, EngineConfig())], 5 * 2**20)
+    engine = parallel._WORKER_ENGINES["TestEngine"]
+    assert engine.parse_cache.budget_bytes == 5 * 2**20
+
+    runs = []
+    monkeypatch.setattr(engine, "begin_run", lambda: runs.append(1))
+    sources = [SourceFile.load(f"missing_{i}.py") for i in range(2)]
+    parallel._check_chunk("TestEngine", 1, sources[:1])
+    cache = engine.source_cache
+    parallel._check_chunk("TestEngine", 1, sources[1:])
+    assert len(runs) == 1
+    assert engine.source_cache is cache
+
+    parallel._check_chunk("TestEngine", 2, sources)
+    assert len(runs) == 2
+
+
+def _config(tmp_path, jobs):
+    config = Config(global_settings=GlobalSettings(audit_path=":memory:", cache_enabled=False, jobs=jobs))
+    config.engines.spec.enabled = False
+    config.engines.adr.enabled = False
+    return config
+
+
+@pytest.mark.asyncio
+async def test_parallel_run_matches_serial_run(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "src").mkdir()
+    (tmp_path / "tests").mkdir()
+    files = []
+    for i in range(6):
+        marker = f"# implements: FR-00{i}\n" if i % 2 else ""
+        (tmp_path / "src" / f"mod{i}.py").write_text(f"{marker}def f{i}():\n    pass\n", encoding="utf-8")
+        files.append(f"src/mod{i}.py")
+    (tmp_path / "tests" / "test_mod1.py").write_text("import random\n\ndef test_x():\n    random.random()\n")
+    files.append("tests/test_mod1.py")
+
+    serial = await Orchestrator(_config(tmp_path, jobs=1)).run(files)
+    parallel = await Orchestrator(_config(tmp_path, jobs=2)).run(files)
+
+    def summarize(report):
+        return [(v.axiom_id, v.file_path, v.message) for v in report.violations]
+
+    assert summarize(parallel) == summarize(serial)
+    assert parallel.traceability_matrix == serial.traceability_matrix
+    assert any(v.axiom_id == "Π.2.2" for v in parallel.violations)
@@ -0,0 +1,113 @@
+# implements: FR-001
+# traces_to: Π.2.1
+
+import os
+
+import pytest
+
+from ade_compliance.services.spec_index import Heading, Requirement, SpecIndex, parse_spec
+
+SPEC = """# Feature Specification: Billing
+
+## Requirements
+
+- **FR-001**: Issue invoices
+- **FR-002**: Refunds (see FR-001)
+### FR-003 — Tax rules
+
+```markdown
+- **FR-999**: example inside a fence
+```
+"""
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    feature = tmp_path / "specs" / "001-billing"
+    feature.mkdir(parents=True)
+    (feature / "spec.md").write_text(SPEC, encoding="utf-8")
+    (feature / "plan.md").write_text("# Plan\n", encoding="utf-8")
+    return tmp_path
+
+
+def bump_mtime(path, delta=10):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + delta * 10**9))
+
+
+def test_parse_spec_collects_headings_and_definitions():
+    doc = parse_spec("spec.md", SPEC)
+    assert [r.id for r in doc.requirements] == ["FR-001", "FR-002", "FR-003"]
+    assert doc.requirements[1] == Requirement("FR-002", "spec.md", 6, "Refunds (see FR-001)")
+    assert doc.headings[:2] == (Heading(1, "Feature Specification: Billing", 1), Heading(2, "Requirements", 3))
+
+
+def test_lookup_and_governing_spec(project):
+    (project / "specs" / "002-portal").mkdir()
+    (project / "specs" / "002-portal" / "spec.md").write_text("- **FR-WP-001**: Pages\n", encoding="utf-8")
+    index = SpecIndex()
+    index.refresh()
+
+    assert sorted(index.documents) == [
+        "specs/001-billing/plan.md",
+        "specs/001-billing/spec.md",
+        "specs/002-portal/spec.md",
+    ]
+    assert [(r.path, r.line) for r in index.lookup("fr-003")] == [("specs/001-billing/spec.md", 7)]
+    assert index.requirement_ids() == {"FR-001", "FR-002", "FR-003", "FR-WP-001"}
+
+    assert index.governing_spec("lib/x.py", ["FR-WP-001", "FR-404"]) == "specs/002-portal/spec.md"
+    assert index.governing_spec("src/billing/x.py") == "specs/001-billing/spec.md"
+    assert index.governing_spec("portal/index.html") == "specs/002-portal/spec.md"
+    assert index.governing_spec("scripts/x.py") is None
+
+    (project / "spec.md").write_text("# Product\n", encoding="utf-8")
+    index.refresh()
+    assert index.governing_spec("scripts/x.py") == "spec.md"
+
+
+def test_refresh_follows_directory_and_file_changes(project):
+    index = SpecIndex()
+    assert index.refresh()
+    assert index.parses == 2
+    assert not index.refresh()
+
+    feature = project / "specs" / "001-billing"
+    (feature / "tasks.md").write_text("- FR-004: Export\n", encoding="utf-8")
+    bump_mtime(feature)
+    assert index.refresh()
+    assert index.parses == 3
+    assert [r.path for r in index.lookup("FR-004")] == ["specs/001-billing/tasks.md"]
+
+    (feature / "plan.md").write_text("# Plan\n- **FR-005**: Audit\n", encoding="utf-8")
+    bump_mtime(feature / "plan.md")
+    assert index.refresh()
+    assert index.lookup("FR-005")
+
+    (feature / "tasks.md").unlink()
+    bump_mtime(feature)
+    index.refresh()
+    assert index.lookup("FR-004") == []
+
+    (project / "specs" / "002-new").mkdir()
+    (project / "specs" / "002-new" / "spec.md").write_text("- **FR-100**: New\n", encoding="utf-8")
+    bump_mtime(project / "specs")
+    index.refresh()
+    assert index.lookup("FR-100")
+
+
+def test_index_is_persisted(project, tmp_path_factory):
+    path = tmp_path_factory.mktemp("cache") / "spec_index.json"
+    SpecIndex(path).refresh()
+    assert path.is_file()
+
+    reloaded = SpecIndex(path)
+    assert not reloaded.refresh()
+    assert reloaded.parses == 0
+    assert [r.text for r in reloaded.lookup("FR-001")] == ["Issue invoices"]
+
+    path.write_text("not json", encoding="utf-8")
+    rebuilt = SpecIndex(path)
+    assert rebuilt.refresh()
+    assert rebuilt.lookup("FR-001")
@@ -0,0 +1,158 @@
+# implements: FR-003
+# traces_to: Π.2.1
+
+from unittest.mock import patch
+
+import pytest
+
+from ade_compliance.config import Config, GlobalSettings
+from ade_compliance.engines.trace_engine import TraceEngine
+from ade_compliance.models import TraceLink
+from ade_compliance.services.orchestrator import Orchestrator
+from ade_compliance.services.trace_index import TraceIndex
+
+
+@pytest.fixture
+def index(tmp_path):
+    return TraceIndex(tmp_path / "trace.sqlite")
+
+
+def _link(target, link_type="implements", symbol=None, source="src/a.py"):
+    return TraceLink(source=source, target=target, type=link_type, symbol=symbol)
+
+
+def test_lookup_returns_current_entries_only(index):
+    index.update(
+        [
+            ("src/a.py", "h1", [_link("FR-001", symbol="run"), _link("Π.3.1", "traces_to")]),
+            ("src/b.py", "h2", []),
+        ],
+        "fp",
+    )
+
+    found = index.lookup([("src/a.py", "h1"), ("src/b.py", "h2"), ("src/c.py", "h3")], "fp")
+    assert found.keys() == {"src/a.py", "src/b.py"}
+    assert [(k.target, k.type, k.symbol) for k in found["src/a.py"]] == [
+        ("FR-001", "implements", "run"),
+        ("Π.3.1", "traces_to", None),
+    ]
+    assert found["src/b.py"] == []
+
+    # Changed content or a different engine fingerprint invalidates the entry
+    assert index.lookup([("src/a.py", "changed")], "fp") == {}
+    assert index.lookup([("src/a.py", "h1")], "other") == {}
+    assert index.current([("src/a.py", "h1"), ("src/b.py", "changed"), ("src/c.py", "h3")], "fp") == {"src/a.py"}
+
+
+def test_update_replaces_previous_links(index):
+    index.update([("src/a.py", "h1", [_link("FR-001")])], "fp")
+    index.update([("src/a.py", "h2", [_link("FR-002")]), ("src/a.py", "h2", [_link("FR-002")])], "fp")
+
+    assert [k.target for k in index.lookup([("src/a.py", "h2")], "fp")["src/a.py"]] == ["FR-002"]
+    assert len(index) == 1
+    assert index.remove(["src/a.py"]) == 1
+    assert len(index) == 0
+
+
+def test_query_by_target(index, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "src").mkdir()
+    for name in ("a.py", "b.py"):
+        (tmp_path / "src" / name).write_text("", encoding="utf-8")
+    index.update(
+        [
+            ("src/a.py", "h1", [_link("FR-021", symbol="Index"), _link("FR-001")]),
+            ("src/b.py", "h2", [_link("FR-021", "validates")]),
+            ("src/gone.py", "h3", [_link("FR-021")]),
+        ],
+        "fp",
+    )
+
+    assert [(k.source, k.type, k.symbol) for k in index.query("FR-021", existing_only=False)] == [
+        ("src/a.py", "implements", "Index"),
+        ("src/b.py", "validates", None),
+        ("src/gone.py", "implements", None),
+    ]
+    assert [k.source for k in index.query("FR-021")] == ["src/a.py", "src/b.py"]
+    # Queries are read-only; pruning is explicit
+    assert len(index) == 3
+    assert index.prune_missing() == 1
+    assert len(index) == 2
+    assert index.query("FR-404") == []
+
+
+def test_from_config_follows_cache_settings(tmp_path):
+    config = Config(global_settings=GlobalSettings(cache_path=str(tmp_path / "cache")))
+    assert TraceIndex.from_config(config).db_path == tmp_path / "cache" / "trace.sqlite"
+    config.global_settings.cache_enabled = False
+    assert TraceIndex.from_config(config) is None
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_replays_indexed_links_without_parsing(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "a.py").write_text("# implements: FR-001\ndef run():\n    pass\n", encoding="utf-8")
+    (tmp_path / "src" / "b.py").write_text("def plain():\n    pass\n", encoding="utf-8")
+    files = ["src/a.py", "src/b.py"]
+
+    config = Config(global_settings=GlobalSettings(audit_path=":memory:", cache_path=str(tmp_path / "cache")))
+    config.engines.spec.enabled = False
+    config.engines.adr.enabled = False
+    first = await Orchestrator(config).run(files)
+
+    orch = Orchestrator(config)
+    # Drop per-file results so only the trace index can avoid re-extraction
+    orch.cache.prune()
+    with patch.object(TraceEngine, "_get_parser_and_lang") as get_parser:
+        second = await orch.run(files)
+
+    get_parser.assert_not_called()
+    assert second.traceability_matrix == first.traceability_matrix
+    assert second.traceability_matrix["src/a.py"]["implements"] == ["FR-001 (run)"]
+    assert [(v.axiom_id, v.file_path) for v in second.violations if v.axiom_id == "Π.3.1"] == [("Π.3.1", "src/b.py")]
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_rebuilds_deleted_index_from_cached_results(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "a.py").write_text("# implements: FR-001\ndef run():\n    pass\n", encoding="utf-8")
+    config = Config(global_settings=GlobalSettings(audit_path=":memory:", cache_path=str(tmp_path / "cache")))
+    config.engines.spec.enabled = False
+    config.engines.adr.enabled = False
+    await Orchestrator(config).run(["src/a.py"])
+
+    for path in (tmp_path / "cache").glob("trace.sqlite*"):
+        path.unlink()
+    orch = Orchestrator(config)
+    await orch.run(["src/a.py"])
+
+    assert orch.cache.stats()["engines"]["TraceEngine"]["hits"] == 1
+    assert [(k.source, k.symbol) for k in orch.trace_index.query("FR-001")] == [("src/a.py", "run")]
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_prunes_only_checked_files_that_are_gone(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "src").mkdir()
+    for name in ("a.py", "b.py", "c.py"):
+        (tmp_path / "src" / name).write_text("# implements: FR-001\ndef run():\n    pass\n", encoding="utf-8")
+    config = Config(global_settings=GlobalSettings(audit_path=":memory:", cache_path=str(tmp_path / "cache")))
+    config.engines.spec.enabled = False
+    config.engines.adr.enabled = False
+    orch = Orchestrator(config)
+    await orch.run(["src/a.py", "src/b.py", "src/c.py"])
+    assert len(orch.trace_index) == 3
+
+    (tmp_path / "src" / "b.py").unlink()
+    (tmp_path / "src" / "c.py").unlink()
+    # A single-file run leaves unrelated rows alone, without checking whether their files exist
+    with patch("ade_compliance.services.trace_index.os.path.isfile") as isfile:
+        await orch.run(["src/a.py"])
+    isfile.assert_not_called()
+    assert len(orch.trace_index) == 3
+
+    await orch.run(["src/a.py", "src/b.py"])
+    assert [k.source for k in orch.trace_index.query("FR-001", existing_only=False)] == ["src/a.py", "src/c.py"]
+    assert orch.trace_index.prune_missing() == 1
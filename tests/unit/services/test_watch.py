@@ -0,0 +1,155 @@
+# implements: FR-006
+# traces_to: Π.2.1
+
+import json
+
+import pytest
+
+from ade_compliance.config import Config, GlobalSettings
+from ade_compliance.services.watch import WatchSession
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "src").mkdir()
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "src" / "a.py").write_text("# implements: FR-001\ndef a():\n    pass\n", encoding="utf-8")
+    (tmp_path / "src" / "b.py").write_text("def b():\n    pass\n", encoding="utf-8")
+    config = Config(
+        global_settings=GlobalSettings(
+            audit_path=":memory:",
+            cache_path=str(tmp_path / "cache"),
+            watch_report_path=str(tmp_path / "watch" / "report.json"),
+        )
+    )
+    config.engines.spec.enabled = False
+    config.engines.adr.enabled = False
+    return tmp_path, config
+
+
+def _active(report):
+    return sorted((v.axiom_id, v.file_path) for v in report.violations)
+
+
+@pytest.mark.asyncio
+async def test_refresh_rechecks_only_affected_files(project):
+    tmp_path, config = project
+    session = WatchSession(config, ["src"])
+    assert session.roots() == ["src", "tests"]
+
+    assert await session.refresh() == 2
+    assert ("Π.3.1", "src/b.py") in _active(session.report())
+    assert ("Π.2.1", "src/a.py") in _active(session.report())
+
+    # No relevant change: nothing re-checked
+    assert await session.refresh(set()) == 0
+    assert await session.refresh({"README.md"}) == 0
+
+    # Editing one file re-checks only that file
+    (tmp_path / "src" / "b.py").write_text("# implements: FR-002\ndef b():\n    pass\n", encoding="utf-8")
+    assert await session.refresh({"src/b.py"}) == 1
+    assert ("Π.3.1", "src/b.py") not in _active(session.report())
+
+    # A new test file re-checks the implementation it maps to
+    (tmp_path / "tests" / "test_a.py").write_text("def test_a():\n    pass\n", encoding="utf-8")
+    assert await session.refresh({"tests/test_a.py"}) == 1
+    assert ("Π.2.1", "src/a.py") not in _active(session.report())
+
+    # Created and deleted files join and leave the tracked set
+    (tmp_path / "src" / "c.py").write_text("def c():\n    pass\n", encoding="utf-8")
+    (tmp_path / "src" / "a.py").unlink()
+    assert await session.refresh({"src/c.py", "src/a.py"}) == 1
+    assert sorted(session.files) == ["src/b.py", "src/c.py"]
+    assert "src/a.py" not in session.report().traceability_matrix
+    session.close()
+
+
+@pytest.mark.asyncio
+async def test_report_file_is_written_atomically(project):
+    tmp_path, config = project
+    session = WatchSession(config, ["src"])
+    await session.refresh()
+
+    data = json.loads((tmp_path / "watch" / "report.json").read_text(encoding="utf-8"))
+    assert data["metrics"]["watch"]["files"] == 2
+    assert data["metrics"]["watch"]["refreshes"] == 1
+    assert data["summary"]["total"] == len(data["violations"])
+    assert [p.name for p in (tmp_path / "watch").iterdir()] == ["report.json"]
+    session.close()
+
+
+@pytest.mark.asyncio
+async def test_refresh_keeps_specification_findings_for_unchanged_files(project):
+    tmp_path, config = project
+    config.engines.spec.enabled = True
+    (tmp_path / "spec.md").write_text("# Spec\n\n- **FR-001**: Checks\n", encoding="utf-8")
+    for name in ("c", "d", "e"):
+        (tmp_path / "src" / f"{name}.py").write_text(
+            f"# implements: FR-099\ndef {name}():\n    pass\n", encoding="utf-8"
+        )
+    session = WatchSession(config, ["src"])
+
+    def undefined():
+        return sorted(v.file_path for v in session.report().violations if v.axiom_id == "Π.1.1")
+
+    await session.refresh()
+    assert undefined() == ["src/c.py", "src/d.py", "src/e.py"]
+
+    (tmp_path / "src" / "c.py").write_text("# implements: FR-001\ndef c():\n    pass\n", encoding="utf-8")
+    assert await session.refresh({"src/c.py"}) == 1
+    assert undefined() == ["src/d.py", "src/e.py"]
+    session.close()
+
+
+@pytest.mark.asyncio
+async def test_specification_changes_recheck_every_file(project):
+    tmp_path, config = project
+    config.engines.spec.enabled = True
+    (tmp_path / "spec.md").write_text("- **FR-001**: Checks\n", encoding="utf-8")
+    (tmp_path / "src" / "c.py").write_text("# implements: FR-099\ndef c():\n    pass\n", encoding="utf-8")
+    session = WatchSession(config, ["src"])
+    assert session.roots() == ["src", "tests", "spec.md", "specs"]
+
+    def undefined():
+        return [v.file_path for v in session.report().violations if v.axiom_id == "Π.1.1"]
+
+    await session.refresh()
+    assert undefined() == ["src/c.py"]
+
+    # Rewording leaves the defined requirements, and so every cached result, unchanged
+    (tmp_path / "spec.md").write_text("- **FR-001**: Checks, reworded\n", encoding="utf-8")
+    assert await session.refresh({"spec.md"}) == 0
+
+    (tmp_path / "specs").mkdir()
+    (tmp_path / "specs" / "plan.md").write_text("- **FR-099**: Later\n", encoding="utf-8")
+    assert await session.refresh({"specs/plan.md"}) == 3
+    assert undefined() == []
+    session.close()
+
+
+@pytest.mark.asyncio
+async def test_coverage_data_changes_recheck_every_file(project):
+    tmp_path, config = project
+    config.engines.coverage.min_coverage = 80
+    config.engines.coverage.data_file = "coverage.xml"
+    report = (
+        '<coverage><sources><source>{root}</source></sources><packages><package name="src"><classes>'
+        '<class name="b.py" filename="src/b.py"><lines>'
+        '<line number="1" hits="1"/><line number="2" hits="{hits}"/>'
+        "</lines></class></classes></package></packages></coverage>"
+    )
+    (tmp_path / "coverage.xml").write_text(report.format(root=tmp_path, hits=0), encoding="utf-8")
+    session = WatchSession(config, ["src"])
+    assert "coverage.xml" in session.roots()
+
+    def below_minimum():
+        return [v.file_path for v in session.report().violations if v.message.startswith("Line coverage")]
+
+    await session.refresh()
+    assert below_minimum() == ["src/b.py"]
+
+    (tmp_path / "coverage.xml").write_text(report.format(root=tmp_path, hits=1), encoding="utf-8")
+    assert await session.refresh({"coverage.xml"}) == 2
+    assert below_minimum() == []
+    session.close()
@@ -19,6 +19,7 @@ def test_cli_subcommands_registered():
     assert "generate-report" in result.output
     assert "override" in result.output
     assert "verify-audit-trail" in result.output
+    assert "export-matrix" in result.output
 
 
 @pytest.mark.parametrize(
@@ -140,3 +141,199 @@ def test_verify_audit_trail_cli_tampered():
         assert result.exit_code == 1
         assert "Tampering or chain corruption detected" in result.output
         assert "Chain broken at entry 3" in result.output
+
+
+def test_cache_stats_and_prune_cli(tmp_path):
+    """Verify the cache subcommands report and prune the configured result cache."""
+    from unittest.mock import patch
+
+    from ade_compliance.config import GlobalSettings
+    from ade_compliance.services.cache import ResultCache
+
+    cache_dir = tmp_path / "cache"
+    ResultCache(cache_dir).put_many([("k1", "TraceEngine", "src/a.py", {"violations": []})])
+    cfg = Config(global_settings=GlobalSettings(cache_path=str(cache_dir)))
+
+    runner = CliRunner()
+    with patch("ade_compliance.cli.load_config", return_value=cfg):
+        result = runner.invoke(main, ["cache", "stats"])
+        assert result.exit_code == 0
+        assert "Entries: 1" in result.output
+        assert "TraceEngine" in result.output
+
+        result = runner.invoke(main, ["cache", "prune", "--all"])
+        assert result.exit_code == 0
+        assert "Pruned 1 cache entry" in result.output
+        assert "Pruned trace links of 0 deleted files" in result.output
+
+
+def test_watch_status_reads_watch_report(tmp_path):
+    """Verify watch-status prints the watch report and maps it to an exit code."""
+    from unittest.mock import patch
+
+    from ade_compliance.config import GlobalSettings
+    from ade_compliance.models.report import ComplianceReport
+
+    report_path = tmp_path / "report.json"
+    cfg = Config(global_settings=GlobalSettings(watch_report_path=str(report_path)))
+
+    runner = CliRunner()
+    with patch("ade_compliance.cli.load_config", return_value=cfg):
+        result = runner.invoke(main, ["watch-status"])
+        assert result.exit_code == 3
+        assert "No watch report found" in result.output
+
+        violation = Violation(axiom_id="Π.3.1", file_path="src/a.py", message="Missing traceability links")
+        report_path.write_text(ComplianceReport(repo_root=".", violations=[violation]).model_dump_json(by_alias=True))
+        result = runner.invoke(main, ["watch-status"])
+        assert result.exit_code == 1
+        assert "src/a.py: Missing traceability links" in result.output
+
+
+def test_trace_query_answers_from_index(tmp_path, monkeypatch):
+    """Verify trace-query lists files and symbols linked to a target after a check run."""
+    import json
+    from unittest.mock import patch
+
+    from ade_compliance.config import GlobalSettings
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "a.py").write_text("# implements: FR-021\nclass Index:\n    pass\n", encoding="utf-8")
+    (tmp_path / "src" / "b.py").write_text("# implements: FR-001\ndef other():\n    pass\n", encoding="utf-8")
+    cfg = Config(global_settings=GlobalSettings(audit_path=":memory:", cache_path=str(tmp_path / "cache")))
+
+    runner = CliRunner()
+    with patch("ade_compliance.cli.load_config", return_value=cfg):
+        runner.invoke(main, ["check-traceability", "src"])
+        result = runner.invoke(main, ["trace-query", "FR-021", "--json"])
+        assert result.exit_code == 0
+        assert json.loads(result.output) == [{"source": "src/a.py", "symbol": "Index", "type": "implements"}]
+
+        result = runner.invoke(main, ["trace-query", "FR-999"])
+        assert result.exit_code == 0
+        assert "No trace links to FR-999" in result.output
+
+        cfg.global_settings.cache_enabled = False
+        result = runner.invoke(main, ["trace-query", "FR-021"])
+        assert result.exit_code == 3
+
+
+def test_spec_query_reports_definitions(tmp_path, monkeypatch):
+    """Verify spec-query answers from the spec index."""
+    import json
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "specs" / "001-app").mkdir(parents=True)
+    (tmp_path / "specs" / "001-app" / "spec.md").write_text("- **FR-021**: Overrides\n", encoding="utf-8")
+    (tmp_path / ".ade-compliance.yml").write_text("global:\n  audit_path: audit.sqlite\n  cache_path: cache\n")
+
+    runner = CliRunner()
+    result = runner.invoke(main, ["spec-query", "FR-021", "--json"])
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output) == [{"path": "specs/001-app/spec.md", "line": 1, "text": "Overrides"}]
+    assert (tmp_path / "cache" / "spec_index.json").is_file()
+
+    result = runner.invoke(main, ["spec-query", "FR-999"])
+    assert result.exit_code == 0
+    assert "FR-999 is not defined in any specification" in result.output
+
+
+def test_export_matrix_streams_rows(tmp_path, monkeypatch):
+    """Verify export-matrix writes one deduplicated row per trace link."""
+    import csv
+    import json
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "a.py").write_text("# implements: FR-001, FR-002\n# implements: FR-001\ndef run():\n    pass\n")
+    (tmp_path / "src" / "b.py").write_text("# traces_to: Π.3.1\nx = 1\n")
+    (tmp_path / ".ade-compliance.yml").write_text("global:\n  audit_path: audit.sqlite\n  cache_enabled: false\n")
+
+    runner = CliRunner()
+    result = runner.invoke(main, ["export-matrix", "src"])
+    assert result.exit_code == 0, result.output
+    assert sorted(csv.reader(result.output.splitlines()[1:])) == [
+        ["src/a.py", "implements", "FR-001", "run"],
+        ["src/a.py", "implements", "FR-002", "run"],
+        ["src/b.py", "traces_to", "Π.3.1", ""],
+    ]
+
+    result = runner.invoke(main, ["export-matrix", "src", "--format", "jsonl", "-o", "matrix.jsonl"])
+    assert result.exit_code == 0
+    rows = [json.loads(line) for line in (tmp_path / "matrix.jsonl").read_text().splitlines()]
+    assert {row["target"] for row in rows} == {"FR-001", "FR-002", "Π.3.1"}
+
+    result = runner.invoke(main, ["export-matrix", "src", "--format", "parquet"])
+    assert result.exit_code == 2
+
+
+def test_sharded_reports_merge_into_full_report(tmp_path, monkeypatch):
+    """Verify --shard partitions files, runs global engines once and merge-reports recombines them."""
+    import json
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "src").mkdir()
+    for i in range(8):
+        (tmp_path / "src" / f"mod{i}.py").write_text(f"# implements: FR-00{i}\ndef f{i}():\n    pass\n")
+    (tmp_path / ".ade-compliance.yml").write_text(
+        "global:\n  audit_path: audit.sqlite\n  cache_enabled: false\nengines:\n  adr:\n    enabled: false\n"
+    )
+
+    runner = CliRunner()
+    paths = []
+    for index in (1, 2, 3):
+        result = runner.invoke(main, ["generate-report", "src", "--shard", f"{index}/3"])
+        assert result.exit_code == 1, result.output
+        report = json.loads(result.output.strip().splitlines()[-1])
+        assert report["metrics"]["shard"]["index"] == index
+        spec = [v for v in report["violations"] if v["axiom_id"] == "Π.1.1"]
+        assert len(spec) == (1 if index == 1 else 0)
+        path = tmp_path / f"shard{index}.json"
+        path.write_text(json.dumps(report))
+        paths.append(str(path))
+
+    full = json.loads(runner.invoke(main, ["generate-report", "src"]).output.strip().splitlines()[-1])
+
+    result = runner.invoke(main, ["merge-reports", *paths])
+    assert result.exit_code == 1
+    merged = json.loads(result.output.strip().splitlines()[-1])
+    assert merged["traceability_matrix"] == full["traceability_matrix"]
+    assert sorted((v["axiom_id"], v["file_path"]) for v in merged["violations"]) == sorted(
+        (v["axiom_id"], v["file_path"]) for v in full["violations"]
+    )
+    assert merged["summary"]["total"] == len(full["violations"])
+
+    result = runner.invoke(main, ["merge-reports", *paths[:2]])
+    assert result.exit_code == 3
+    assert "incomplete" in result.output
+
+    result = runner.invoke(main, ["check-all", "src", "--shard", "4/3"])
+    assert result.exit_code == 2
+    assert "Invalid shard" in result.output
+
+
+def test_sharded_reports_keep_per_file_specification_findings(tmp_path, monkeypatch):
+    """Undefined requirements are per-file findings, so every shard reports its own files."""
+    import json
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "src").mkdir()
+    for i in range(8):
+        (tmp_path / "src" / f"mod{i}.py").write_text(f"# implements: FR-00{i}\ndef f{i}():\n    pass\n")
+    (tmp_path / "spec.md").write_text("".join(f"- **FR-00{i}**: Module {i}\n" for i in range(4)))
+    (tmp_path / ".ade-compliance.yml").write_text(
+        "global:\n  audit_path: audit.sqlite\n  cache_path: cache\nengines:\n  adr:\n    enabled: false\n"
+    )
+
+    runner = CliRunner()
+    paths = []
+    for index in (1, 2, 3):
+        result = runner.invoke(main, ["generate-report", "src", "--shard", f"{index}/3"])
+        path = tmp_path / f"shard{index}.json"
+        path.write_text(result.output.strip().splitlines()[-1])
+        paths.append(str(path))
+
+    merged = json.loads(runner.invoke(main, ["merge-reports", *paths]).output.strip().splitlines()[-1])
+    undefined = sorted(v["file_path"] for v in merged["violations"] if v["axiom_id"] == "Π.1.1")
+    assert undefined == [f"src/mod{i}.py" for i in range(4, 8)]
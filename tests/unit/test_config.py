@@ -256,3 +256,22 @@ def test_env_var_override_with_yaml_fallback(tmp_path, monkeypatch):
     assert config.global_settings.strictness == "warn"  # overridden by env
     assert config.global_settings.enabled is True  # fallback to YAML
     assert config.engines.test.min_coverage == 90  # overridden by env
+
+
+def test_forbidden_api_rules_from_yaml(tmp_path):
+    """Per-project forbidden-API rules load from YAML; malformed call paths are rejected."""
+    config_file = tmp_path / ".ade-compliance.yml"
+    config_file.write_text(
+        "engines:\n  forbidden_api:\n    rules:\n      - call: subprocess.run()\n        reason: Use the runner fixture\n"
+        "      - call: os.environ\n    allow:\n      - os.system\n"
+    )
+    rules = load_config(config_file).engines.forbidden_api
+    assert [(r.call, r.reason) for r in rules.rules] == [
+        ("subprocess.run", "Use the runner fixture"),
+        ("os.environ", "Forbidden API call in test"),
+    ]
+    assert rules.allow == ["os.system"]
+
+    config_file.write_text("engines:\n  forbidden_api:\n    rules:\n      - call: eval\n")
+    with pytest.raises(ConfigError, match="dotted path"):
+        load_config(config_file)
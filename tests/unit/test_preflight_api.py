@@ -13,7 +13,7 @@ from ade_compliance.server import create_app
 def test_preflight_api_endpoint(tmp_path):
     """Verify that /api/v1/compliance/preflight correctly returns strictness, target axioms, and file constraints."""
     db_file = tmp_path / f"preflight_{uuid.uuid4().hex[:8]}.sqlite"
-    app = create_app(audit_path=str(db_file).replace("\\", "/"))
+    app = create_app(audit_path=str(db_file).replace("\\", "/"), cache_path=str(tmp_path / "cache"))
     client = TestClient(app)
 
     request_data = {"files": ["src/ade_compliance/services/override.py", "tests/unit/test_config.py"]}
@@ -47,7 +47,7 @@ def test_preflight_api_endpoint(tmp_path):
 def test_prompt_decorate_api_endpoint(tmp_path):
     """Verify that /api/v1/prompts/decorate returns a formatted Markdown response."""
     db_file = tmp_path / f"prompt_dec_{uuid.uuid4().hex[:8]}.sqlite"
-    app = create_app(audit_path=str(db_file).replace("\\", "/"))
+    app = create_app(audit_path=str(db_file).replace("\\", "/"), cache_path=str(tmp_path / "cache"))
     client = TestClient(app)
 
     # Without query parameters
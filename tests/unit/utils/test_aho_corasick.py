@@ -0,0 +1,49 @@
+# implements: FR-021
+# traces_to: Π.2.1
+
+from collections import Counter
+
+from ade_compliance.utils.aho_corasick import AhoCorasick
+
+
+def naive_matches(patterns, text):
+    return Counter(p for p in set(patterns) if p for i in range(len(text)) if text.startswith(p, i))
+
+
+def test_aho_corasick_finds_overlapping_patterns():
+    matcher = AhoCorasick(["he", "she", "his", "hers", ""])
+    assert len(matcher) == 4
+    assert sorted(matcher.iter_matches("ushers")) == ["he", "hers", "she"]
+    assert matcher.contains_any("this")
+    assert not matcher.contains_any("xyz")
+
+
+def test_overlapping_patterns_are_all_reported():
+    matcher = AhoCorasick(["aba", "bab", "ab"])
+    text = "ababab"
+    assert Counter(matcher.iter_matches(text)) == Counter({"ab": 3, "aba": 2, "bab": 2})
+    assert Counter(matcher.iter_matches(text)) == naive_matches(matcher.patterns, text)
+
+
+def test_shared_prefixes_and_suffix_patterns():
+    patterns = ["auth", "author", "authority", "or", "ity"]
+    matcher = AhoCorasick(patterns)
+    text = "src/authority/auth.py"
+    assert Counter(matcher.iter_matches(text)) == Counter({"auth": 2, "author": 1, "authority": 1, "or": 1, "ity": 1})
+    assert Counter(matcher.iter_matches(text)) == naive_matches(patterns, text)
+    # A failed branch ("autho" then "x") falls back without losing later matches
+    assert list(matcher.iter_matches("authox-ity")) == ["auth", "ity"]
+
+
+def test_no_match():
+    matcher = AhoCorasick(["payments", "billing/"])
+    assert not matcher.contains_any("src/billing.py")
+    assert list(matcher.iter_matches("")) == []
+    assert matcher.contains_any("services/payments/api.py")
+
+
+def test_empty_and_duplicate_patterns_are_ignored():
+    matcher = AhoCorasick(["", "x", "x"])
+    assert len(matcher) == 1
+    assert list(matcher.iter_matches("xx")) == ["x", "x"]
+    assert not AhoCorasick([]).contains_any("anything")
@@ -0,0 +1,41 @@
+# implements: FR-003
+# traces_to: Π.2.1
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from ade_compliance.utils.grammars import GRAMMARS, GrammarRegistry
+
+pytest.importorskip("tree_sitter_python")
+
+
+def test_language_loaded_once_per_process():
+    registry = GrammarRegistry()
+    with patch(
+        "ade_compliance.utils.grammars.importlib.import_module", wraps=__import__("importlib").import_module
+    ) as imp:
+        first = registry.language(".py")
+        assert registry.language(".py") is first
+    assert imp.call_count == 1
+    assert registry.language(".rb") is None
+
+
+def test_parsers_and_cursors_are_thread_local():
+    main_parser = GRAMMARS.parser(".py")
+    assert GRAMMARS.parser(".py") is main_parser
+    assert GRAMMARS.comment_cursor(".py") is GRAMMARS.comment_cursor(".py")
+
+    other = {}
+
+    def worker():
+        other["parser"] = GRAMMARS.parser(".py")
+        other["cursor"] = GRAMMARS.comment_cursor(".py")
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    assert other["parser"] is not main_parser
+    assert other["cursor"] is not GRAMMARS.comment_cursor(".py")
+    assert other["parser"].language is main_parser.language
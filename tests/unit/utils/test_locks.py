@@ -0,0 +1,63 @@
+# implements: FR-030
+# traces_to: Π.2.1
+
+import asyncio
+import threading
+
+import pytest
+
+from ade_compliance.utils.locks import RepositoryLock
+
+
+def test_lock_names_single_repository_lock(tmp_path):
+    lock = RepositoryLock(tmp_path)
+    assert lock.lock_names(["src/a.py", "src/b.py"]) == ["repo.lock"]
+
+
+def test_lock_names_sharded_are_stable_and_sorted(tmp_path):
+    lock = RepositoryLock(tmp_path, shards=8)
+    names = lock.lock_names(["src/a.py", "./src/b.py", "tests/test_a.py"])
+    assert names == sorted(names)
+    assert names == lock.lock_names(["tests/test_a.py", "src/b.py", "src/a.py"])
+    assert len(lock.lock_names(None)) == 8
+
+
+def test_acquire_creates_lock_under_lock_dir_only(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    lock = RepositoryLock(tmp_path / ".ade_compliance" / "locks")
+    with lock.acquire(["src/a.py"]) as waited:
+        assert waited >= 0
+    assert [p.name for p in tmp_path.iterdir()] == [".ade_compliance"]
+    assert (tmp_path / ".ade_compliance" / "locks" / "repo.lock").exists()
+
+
+def test_acquire_blocks_concurrent_holder(tmp_path):
+    lock = RepositoryLock(tmp_path)
+    acquired = threading.Event()
+
+    def contender():
+        with lock.acquire():
+            acquired.set()
+
+    with lock.acquire():
+        thread = threading.Thread(target=contender)
+        thread.start()
+        assert not acquired.wait(timeout=0.2)
+    thread.join(timeout=5)
+    assert acquired.is_set()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_async_acquire_does_not_leak_lock(tmp_path):
+    lock = RepositoryLock(tmp_path)
+
+    async def hold():
+        async with lock.acquire_async():
+            pass
+
+    with lock.acquire():
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(hold(), timeout=0.1)
+
+    # The abandoned waiter releases the lock once it obtains it, so later runs still proceed
+    await asyncio.wait_for(hold(), timeout=5)
@@ -0,0 +1,73 @@
+# implements: FR-012
+# traces_to: Π.2.1
+
+import builtins
+import csv
+import io
+import json
+
+import pytest
+
+from ade_compliance.utils.matrix_export import open_matrix_writer
+
+ROWS = [
+    ("src/a.py", "implements", "FR-001", "run"),
+    ("src/b.py", "traces_to", "Π.3.1", None),
+]
+
+
+def test_csv_writer_streams_rows():
+    out = io.StringIO()
+    writer = open_matrix_writer("csv", stream=out)
+    writer.write_rows(iter(ROWS[:1]))
+    writer.write_rows(iter(ROWS[1:]))
+    writer.close()
+
+    assert writer.rows == 2
+    assert list(csv.reader(io.StringIO(out.getvalue()))) == [
+        ["source", "type", "target", "symbol"],
+        ["src/a.py", "implements", "FR-001", "run"],
+        ["src/b.py", "traces_to", "Π.3.1", ""],
+    ]
+
+
+def test_jsonl_writer_streams_rows():
+    out = io.StringIO()
+    writer = open_matrix_writer("jsonl", stream=out)
+    writer.write_rows(ROWS)
+    writer.close()
+
+    assert [json.loads(line) for line in out.getvalue().splitlines()] == [
+        {"source": "src/a.py", "type": "implements", "target": "FR-001", "symbol": "run"},
+        {"source": "src/b.py", "type": "traces_to", "target": "Π.3.1", "symbol": None},
+    ]
+
+
+def test_parquet_writer_flushes_row_groups(tmp_path, monkeypatch):
+    pq = pytest.importorskip("pyarrow.parquet")
+    monkeypatch.setattr("ade_compliance.utils.matrix_export.PARQUET_ROW_GROUP", 1)
+    path = tmp_path / "matrix.parquet"
+    writer = open_matrix_writer("parquet", path=str(path))
+    writer.write_rows(ROWS)
+    writer.close()
+
+    table = pq.read_table(path)
+    assert pq.ParquetFile(path).num_row_groups == 2
+    assert table.to_pylist()[1] == {"source": "src/b.py", "type": "traces_to", "target": "Π.3.1", "symbol": None}
+
+
+def test_parquet_without_pyarrow_or_path(tmp_path, monkeypatch):
+    real_import = builtins.__import__
+
+    def no_pyarrow(name, *args, **kwargs):
+        if name.startswith("pyarrow"):
+            raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "__import__", no_pyarrow)
+    with pytest.raises(RuntimeError, match="requires pyarrow"):
+        open_matrix_writer("parquet", path=str(tmp_path / "m.parquet"))
+    with pytest.raises(ValueError):
+        open_matrix_writer("parquet")
+    with pytest.raises(ValueError, match="Unknown matrix export format"):
+        open_matrix_writer("xml", stream=io.StringIO())
@@ -0,0 +1,87 @@
+# implements: FR-017
+# traces_to: Π.2.1
+
+import ast
+
+import pytest
+
+from ade_compliance.config import Config, GlobalSettings
+from ade_compliance.services.orchestrator import Orchestrator
+from ade_compliance.utils.parse_cache import AST_BYTES_PER_SOURCE_BYTE, ParseCache
+from ade_compliance.utils.source import SourceFile
+
+
+def _source(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return SourceFile.load(str(path))
+
+
+def test_python_ast_parsed_once_per_content(tmp_path):
+    cache = ParseCache()
+    first = _source(tmp_path, "a.py", "x = 1\n")
+    same_content = _source(tmp_path, "b.py", "x = 1\n")
+    broken = _source(tmp_path, "c.py", "def broken(:\n")
+
+    tree = cache.python_ast(first)
+    assert isinstance(tree, ast.Module)
+    assert cache.python_ast(same_content) is tree
+    assert cache.python_ast(broken) is None
+    assert cache.python_ast(broken) is None
+    assert (cache.hits, cache.misses, len(cache)) == (2, 2, 2)
+
+
+def test_parser_kinds_are_cached_separately():
+    cache = ParseCache()
+    calls = []
+    assert cache.get_or_parse("ast", "h1", 10, lambda: calls.append("ast") or "ast-tree") == "ast-tree"
+    assert cache.get_or_parse("tree-sitter.py", "h1", 10, lambda: calls.append("ts") or "ts-tree") == "ts-tree"
+    assert cache.get_or_parse("ast", "h1", 10, lambda: calls.append("again")) == "ast-tree"
+    assert calls == ["ast", "ts"]
+
+
+def test_budget_evicts_least_recently_used(tmp_path):
+    cost = len("x = 1\n") * AST_BYTES_PER_SOURCE_BYTE
+    cache = ParseCache(budget_bytes=2 * cost)
+    sources = [_source(tmp_path, f"m{i}.py", f"x = {i}\n") for i in range(3)]
+
+    cache.python_ast(sources[0])
+    cache.python_ast(sources[1])
+    cache.python_ast(sources[0])  # most recently used now
+    cache.python_ast(sources[2])
+
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    assert cache.used_bytes == 2 * cost
+    hits = cache.hits
+    cache.python_ast(sources[0])
+    assert cache.hits == hits + 1
+
+    disabled = ParseCache(budget_bytes=0)
+    assert isinstance(disabled.python_ast(sources[0]), ast.Module)
+    assert len(disabled) == 0
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_shares_one_parse_per_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "src").mkdir()
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "src" / "main.py").write_text("# implements: FR-001\ndef run():\n    pass\n", encoding="utf-8")
+    (tmp_path / "tests" / "test_main.py").write_text(
+        "# validates: FR-001\nimport time\n\n\ndef test_run():\n    time.perf_counter()\n", encoding="utf-8"
+    )
+    files = ["src/main.py", "tests/test_main.py"]
+    config = Config(global_settings=GlobalSettings(audit_path=":memory:", cache_enabled=False))
+    config.engines.spec.enabled = False
+    config.engines.adr.enabled = False
+
+    orch = Orchestrator(config)
+    report = await orch.run(files)
+    assert all(engine.parse_cache is orch.parse_cache for engine in orch.engines)
+    assert report.metrics["parse_cache"]["misses"] > 0
+
+    # Unchanged files are not parsed again by a long-lived orchestrator
+    second = await orch.run(files)
+    assert second.metrics["parse_cache"]["misses"] == 0
+    assert second.metrics["parse_cache"]["hits"] > 0
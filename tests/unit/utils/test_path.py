@@ -1,7 +1,7 @@
 # implements: FR-002
 # traces_to: Π.2.1
 
-from ade_compliance.utils.path import sanitize_relative_path
+from ade_compliance.utils.path import is_inside_base, sanitize_relative_path
 
 
 def test_sanitize_relative_path_valid(tmp_path):
@@ -22,3 +22,17 @@ def test_sanitize_relative_path_invalid_characters(tmp_path):
     res = sanitize_relative_path(base, "models/axiom$;.py")
     # axiom$;.py has invalid characters, so it should be skipped or stripped
     assert res == base / "models" or res is None
+
+
+def test_is_inside_base(tmp_path):
+    base = (tmp_path / "repo").resolve()
+    (base / "src").mkdir(parents=True)
+    (tmp_path / "secret.py").write_text("x = 1\n")
+    (base / "src" / "link.py").symlink_to(tmp_path / "secret.py")
+
+    assert is_inside_base(base, "src/main.py")
+    assert is_inside_base(base, str(base / "src" / "main.py"))
+    assert not is_inside_base(base, "../secret.py")
+    assert not is_inside_base(base, str(tmp_path / "secret.py"))
+    assert not is_inside_base(base, "src/link.py")
+    assert not is_inside_base(base, "src/axiom$;.py")
@@ -0,0 +1,25 @@
+# implements: FR-011
+# traces_to: Π.2.1
+
+import pytest
+
+from ade_compliance.utils.sharding import parse_shard, select_shard, shard_of
+
+
+def test_parse_shard():
+    assert parse_shard("2/8") == (2, 8)
+    for bad in ("0/3", "4/3", "1/0", "x/3", "3"):
+        with pytest.raises(ValueError, match="Invalid shard"):
+            parse_shard(bad)
+
+
+def test_shards_partition_files_stably():
+    files = [f"src/pkg/mod{i}.py" for i in range(200)]
+    shards = [select_shard(files, index, 4) for index in range(1, 5)]
+
+    assert sorted(f for shard in shards for f in shard) == sorted(files)
+    assert all(shard for shard in shards)
+    # Assignment depends only on the normalized path, not on the rest of the file set
+    assert shard_of("./src/pkg/mod7.py", 4) == shard_of("src/pkg/mod7.py", 4)
+    assert select_shard(files[:10], 2, 4) == [f for f in shards[1] if f in files[:10]]
+    assert select_shard(files, 1, 1) == files
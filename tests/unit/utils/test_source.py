@@ -0,0 +1,74 @@
+# implements: FR-017
+# traces_to: Π.2.1
+
+import dataclasses
+from unittest.mock import patch
+
+import pytest
+
+from ade_compliance.config import Config, GlobalSettings
+from ade_compliance.services.orchestrator import Orchestrator
+from ade_compliance.utils.source import SourceCache, SourceFile
+
+
+def test_load_captures_content_and_fingerprint(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "a.py").write_bytes(b"x = 1\n")
+
+    source = SourceFile.load("./src/a.py")
+    assert source.exists
+    assert source.norm_path == "src/a.py"
+    assert source.data == b"x = 1\n"
+    assert source.text == "x = 1\n"
+    assert source.size == 6
+    assert source.mtime_ns > 0
+    assert len(source.digest) == 64
+    assert source.suffix == ".py"
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        source.text = "y"
+
+
+def test_load_missing_and_binary_files(tmp_path):
+    missing = SourceFile.load(str(tmp_path / "nope.py"))
+    assert not missing.exists
+    assert missing.text is None
+
+    binary = tmp_path / "blob.py"
+    binary.write_bytes(b"\xff\xfe\x00")
+    loaded = SourceFile.load(str(binary))
+    assert loaded.exists
+    assert loaded.text is None
+
+
+def test_source_cache_reads_each_file_once(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "a.py").write_text("pass\n", encoding="utf-8")
+
+    cache = SourceCache()
+    with patch.object(SourceFile, "load", wraps=SourceFile.load) as load:
+        first, second = cache.load_many(["a.py", "./a.py"])
+    assert first is second
+    assert load.call_count == 1
+    assert len(cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_loads_each_file_once(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "src").mkdir()
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "src" / "mod.py").write_text("# implements: FR-001\ndef f():\n    pass\n", encoding="utf-8")
+    (tmp_path / "tests" / "test_mod.py").write_text("# validates: src/mod.py\ndef test_f():\n    pass\n")
+
+    config = Config(global_settings=GlobalSettings(audit_path=":memory:", cache_enabled=False))
+    config.engines.spec.enabled = False
+    config.engines.adr.enabled = False
+
+    with patch.object(SourceFile, "load", wraps=SourceFile.load) as load:
+        report = await Orchestrator(config).run(["src/mod.py", "tests/test_mod.py"])
+
+    loaded = sorted(call.args[0] for call in load.call_args_list)
+    assert loaded == ["src/mod.py", "tests/test_mod.py"]
+    assert report.traceability_matrix["src/mod.py"]["implements"] == ["FR-001 (f)"]
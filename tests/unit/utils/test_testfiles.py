@@ -0,0 +1,84 @@
+# implements: FR-002
+# traces_to: Π.2.1
+
+from unittest.mock import patch
+
+import pytest
+
+from ade_compliance.config import Config, ConfigError, load_config
+from ade_compliance.engines.test_engine import TestEngine
+from ade_compliance.utils.testfiles import TestFileIndex, stems_for_test_file
+
+
+def _touch(root, *paths):
+    for path in paths:
+        target = root / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text("", encoding="utf-8")
+
+
+@pytest.fixture
+def layout(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _touch(
+        tmp_path,
+        "tests/unit/test_cli_unit.py",
+        "tests/unit/services/test_watch.py",
+        "tests/unit/utils/test_watch.py",
+        "tests/e2e/test_report.py",
+        "tests/pkg/engines/spec_test.py",
+        "tests/__pycache__/test_stale.py",
+    )
+    return tmp_path
+
+
+def test_default_patterns_prefer_mirrored_packages(layout):
+    index = TestFileIndex()
+    assert index.find("src/pkg/cli.py") == "tests/unit/test_cli_unit.py"
+    assert index.find("src/pkg/utils/watch.py") == "tests/unit/utils/test_watch.py"
+    assert index.find("src/pkg/services/watch.py") == "tests/unit/services/test_watch.py"
+    # Any layout under the test root is found, not only the historical directories
+    assert index.find("src/pkg/report.py") == "tests/e2e/test_report.py"
+    assert index.find("src/pkg/stale.py") is None
+    assert index.find("src/pkg/engines/spec.py") is None
+
+
+def test_configured_patterns(layout):
+    index = TestFileIndex(patterns=["{subpackage}/{stem}_test.py", "pkg/{subpackage}/{stem}_test.py"])
+    assert index.find("src/pkg/engines/spec.py") == "tests/pkg/engines/spec_test.py"
+    assert TestFileIndex(patterns=["{stem}_test.py"]).find("src/other/spec.py") == "tests/pkg/engines/spec_test.py"
+
+
+def test_lookups_do_not_touch_the_file_system(layout):
+    index = TestFileIndex()
+    with patch("os.stat", side_effect=AssertionError("stat")), patch("os.walk", side_effect=AssertionError("walk")):
+        assert [index.find(f"src/pkg/mod{i}.py") for i in range(100)] == [None] * 100
+        assert index.find("src/pkg/utils/watch.py") == "tests/unit/utils/test_watch.py"
+
+
+def test_stems_reverse_patterns():
+    assert stems_for_test_file("tests/unit/test_cli_unit.py") == {"cli_unit", "cli"}
+    assert stems_for_test_file("tests/unit/conftest.py") == set()
+    assert stems_for_test_file("tests/pkg/spec_test.py", ["{stem}_test.py", "test_{name}"]) == {"spec"}
+
+
+def test_test_engine_uses_configured_mapping(layout, tmp_path):
+    (tmp_path / ".ade-compliance.yml").write_text(
+        "engines:\n  test:\n    test_patterns:\n      - '{stem}_test.py'\n", encoding="utf-8"
+    )
+    engine = TestEngine(load_config(tmp_path / ".ade-compliance.yml").engines.test)
+    assert engine.find_test_file("src/pkg/engines/spec.py") == "tests/pkg/engines/spec_test.py"
+
+    # The index is rebuilt per run, so new test files are picked up
+    _touch(tmp_path, "tests/unit/engines/cli_test.py")
+    assert engine.find_test_file("src/pkg/cli.py") is None
+    engine.begin_run()
+    assert engine.find_test_file("src/pkg/cli.py") == "tests/unit/engines/cli_test.py"
+
+    assert TestEngine(Config().engines.test).find_test_file("src/pkg/cli.py") == "tests/unit/test_cli_unit.py"
+
+    (tmp_path / ".ade-compliance.yml").write_text(
+        "engines:\n  test:\n    test_patterns:\n      - '{module}_test.py'\n", encoding="utf-8"
+    )
+    with pytest.raises(ConfigError, match="placeholders"):
+        load_config(tmp_path / ".ade-compliance.yml")
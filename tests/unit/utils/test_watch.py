@@ -0,0 +1,63 @@
+# implements: FR-006
+# traces_to: Π.2.1
+
+import sys
+
+import pytest
+
+from ade_compliance.utils.watch import InotifyWatcher, PollingWatcher, create_watcher
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "a.py").write_text("a = 1\n")
+    return tmp_path
+
+
+def test_polling_watcher_reports_modified_created_and_deleted(tree):
+    watcher = PollingWatcher(["src"])
+    assert watcher.wait(0) == set()
+
+    (tree / "src" / "a.py").write_text("a = 22\n")
+    (tree / "src" / "b.py").write_text("b = 1\n")
+    (tree / "src" / "notes.txt").write_text("ignored\n")
+    assert watcher.wait(0) == {"src/a.py", "src/b.py"}
+
+    (tree / "src" / "b.py").unlink()
+    assert watcher.wait(0) == {"src/b.py"}
+
+
+def test_polling_watcher_reports_specifications_and_file_roots(tree):
+    (tree / "specs").mkdir()
+    watcher = PollingWatcher(["specs", "coverage.xml"])
+
+    (tree / "specs" / "spec.md").write_text("# Spec\n")
+    (tree / "coverage.xml").write_text("<coverage/>\n")
+    assert watcher.wait(0) == {"specs/spec.md", "coverage.xml"}
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+def test_inotify_watcher_follows_new_directories(tree):
+    watcher = InotifyWatcher(["src"])
+    try:
+        assert watcher.wait(0) == set()
+        (tree / "src" / "a.py").write_text("a = 2\n")
+        assert "src/a.py" in watcher.wait(1.0)
+
+        (tree / "src" / "pkg").mkdir()
+        (tree / "src" / "pkg" / "m.py").write_text("m = 1\n")
+        changed = watcher.wait(1.0)
+        assert "src/pkg/m.py" in changed
+
+        (tree / "src" / "pkg" / "n.py").write_text("n = 1\n")
+        assert "src/pkg/n.py" in watcher.wait(1.0)
+    finally:
+        watcher.close()
+
+
+def test_create_watcher_polling_fallback(tree):
+    watcher = create_watcher(["src"], polling=True)
+    assert watcher.name == "polling"
+    watcher.close()